@@ -1,39 +1,78 @@
+import asyncio
+from contextlib import aclosing
 from datetime import datetime
 import json
 import asyncpg
+import orjson
 from loguru import logger
 import os
-from graphrag_processing import get_search_engine
+from answer_cache import AnswerCache, PostgresAnswerStore
+from graph_catalog import write_graph_meta
+from graph_payload import (
+    GraphPayloadCache,
+    choose_encoding,
+    etag_matches,
+    file_etag,
+    precompressed_variant,
+)
+from graph_tiles import GraphTileCache, Viewport
+from graphrag_processing import (
+    GRAPH_CATALOG,
+    SEARCH_ENGINES,
+    close_llm,
+    get_search_engine,
+    get_text_embedder,
+    warmup,
+)
+from settings import settings
 
 from pydantic import BaseModel
-from fastapi import Depends, FastAPI, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Literal
+from fastapi.responses import FileResponse, StreamingResponse
+from typing import AsyncIterator, Literal
 
 import re
+import secrets
 from uvicorn import run
 
 
 from pg import (
-    check_historical_prompt_response,
     connect,
     disconnect,
     get_connection_pool,
     get_prompts_history,
-    save_prompt_response,
 )
 
 
 app = FastAPI()
 
-app.add_event_handler("startup", connect)
-app.add_event_handler("shutdown", disconnect)
 
+async def start_warmup() -> None:
+    # in the background, so uvicorn accepts connections (and liveness probes)
+    # while the query stack and preloaded graphs are loading
+    app.state.warmup = asyncio.create_task(run_in_threadpool(warmup))
 
-AVAILABLE_GRAPHS = [
-    {"path": "data/graphs/podcast", "id": "podcast", "name": "podcast"},
-    {"path": "data/graphs/gazeta", "id": "gazeta", "name": "gazeta"},
-]
+
+app.add_event_handler("startup", connect)
+app.add_event_handler("startup", start_warmup)
+app.add_event_handler("shutdown", disconnect)
+app.add_event_handler("shutdown", close_llm)
+
+GRAPH_PAYLOADS = GraphPayloadCache(max_entries=settings.GRAPH_PAYLOAD_CACHE_SIZE)
+GRAPH_TILES = GraphTileCache(max_entries=settings.GRAPH_PAYLOAD_CACHE_SIZE)
+
+ANSWER_CACHE = AnswerCache(
+    PostgresAnswerStore(get_connection_pool),
+    max_entries=settings.ANSWER_CACHE_SIZE,
+    embedder=(
+        get_text_embedder()
+        if settings.ANSWER_CACHE_SIMILARITY_THRESHOLD is not None
+        else None
+    ),
+    similarity_threshold=settings.ANSWER_CACHE_SIMILARITY_THRESHOLD,
+)
 
 
 class PromptResponse(BaseModel):
@@ -41,13 +80,14 @@ class PromptResponse(BaseModel):
 
 
 class PromptHistory(BaseModel):
+    id: int
     prompt: str
     nodes: list[str]
 
 
 class PromptRequest(BaseModel):
     text: str
-    graph: Literal["podcast", "gazeta", "podcast-en"]
+    graph: str
     nodes: list[str] | None = None
     language: str = "english"
 
@@ -68,61 +108,196 @@ def format_response(resp: str, graph: str) -> str:
 
 
 @app.post(path="/api/prompt")
-async def prompt(
-    req: PromptRequest,
-    pg: asyncpg.Pool = Depends(get_connection_pool),
-) -> PromptResponse:
-    historical_response = await check_historical_prompt_response(
-        pg, req.text, req.nodes
+async def prompt(req: PromptRequest) -> PromptResponse:
+    cached_response = await ANSWER_CACHE.get(
+        req.text, req.nodes, req.graph, req.language
     )
-    if historical_response:
+    if cached_response is not None:
         logger.info('msg="Got from cache"')
-        return PromptResponse(response=format_response(historical_response, req.graph))
+        return PromptResponse(response=format_response(cached_response, req.graph))
+
+    search_engine = await run_in_threadpool(
+        get_search_engine, req.graph, req.nodes, req.language
+    )
+    result = await search_engine.asearch(req.text)
+
+    if isinstance(result.response, str):
+        resp = result.response
     else:
-        search_engine = get_search_engine(req.graph, req.nodes, req.language)
-        result = await search_engine.asearch(req.text)
+        resp = format_response(result.response[0]["output"], req.graph)  # type: ignore
+    # an answer missing the key points of a failed map batch is not cached
+    if not getattr(result, "failed_map_batches", 0):
+        await ANSWER_CACHE.put(req.text, req.nodes, req.graph, req.language, resp)
+    return PromptResponse(response=format_response(resp, req.graph))
 
-        if isinstance(result.response, str):
-            await save_prompt_response(
-                pg, req.text, result.response, req.nodes, req.graph
-            )
-            return PromptResponse(response=format_response(result.response, req.graph))
-        else:
-            resp = format_response(result.response[0]["output"], req.graph)  # type: ignore
-            await save_prompt_response(pg, req.text, resp, req.nodes, req.graph)
-            return PromptResponse(response=resp)
+
+def sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def stream_prompt_events(req: PromptRequest) -> AsyncIterator[str]:
+    try:
+        async with aclosing(_prompt_events(req)) as events:
+            async for event in events:
+                yield event
+    except Exception as error:
+        logger.exception('msg="Streamed prompt failed"')
+        detail = error.detail if isinstance(error, HTTPException) else "prompt failed"
+        yield sse_event("error", {"detail": detail})
+
+
+async def _prompt_events(req: PromptRequest) -> AsyncIterator[str]:
+    cached_response = await ANSWER_CACHE.get(
+        req.text, req.nodes, req.graph, req.language
+    )
+    if cached_response is not None:
+        logger.info('msg="Got from cache"')
+        yield sse_event(
+            "done", {"response": format_response(cached_response, req.graph)}
+        )
+        return
+
+    search_engine = await run_in_threadpool(
+        get_search_engine, req.graph, req.nodes, req.language
+    )
+    from graphrag.query.structured_search.global_search.search import (
+        GlobalSearchMapProgress,
+    )
+
+    chunks: list[str] = []
+    map_failed = False
+    # closed on client disconnect too, which cancels the pending map batches
+    async with aclosing(
+        search_engine.astream_search(req.text, map_progress=True)
+    ) as stream:
+        await anext(stream)  # context records, not sent to the client
+        async for chunk in stream:
+            if isinstance(chunk, GlobalSearchMapProgress):
+                map_failed = map_failed or chunk.failed
+                yield sse_event(
+                    "map",
+                    {
+                        "completed": chunk.completed,
+                        "total": chunk.total,
+                        "failed": chunk.failed,
+                    },
+                )
+            else:
+                chunks.append(chunk)
+                yield sse_event("token", {"text": chunk})
+
+    resp = "".join(chunks)
+    if not map_failed:
+        await ANSWER_CACHE.put(req.text, req.nodes, req.graph, req.language, resp)
+    yield sse_event("done", {"response": format_response(resp, req.graph)})
+
+
+@app.post(path="/api/prompt/stream")
+async def prompt_stream(req: PromptRequest) -> StreamingResponse:
+    """
+    Same as `/api/prompt`, as server-sent events: `map` after every map batch,
+    `token` for each piece of the reduce answer, and `done` with the formatted
+    answer once it has been written to the cache. Answers that miss a failed
+    map batch are not cached. A failure ends the stream with an `error` event.
+    """
+    return StreamingResponse(
+        stream_prompt_events(req),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get(path="/api/health/live")
+async def liveness() -> dict:
+    return {"status": "ok"}
+
+
+@app.get(path="/api/health/ready")
+async def readiness() -> dict:
+    task: asyncio.Task | None = getattr(app.state, "warmup", None)
+    if task is None or not task.done():
+        raise HTTPException(status_code=503, detail="warming up")
+    if task.exception() is not None:
+        raise HTTPException(status_code=503, detail=f"warmup failed: {task.exception()}")
+    return {"status": "ready"}
+
+
+@app.get(path="/api/prompt/cache-stats")
+async def prompt_cache_stats() -> dict[str, int]:
+    return ANSWER_CACHE.stats.as_dict()
 
 
 @app.get(path="/api/prompt/history")
 async def prompt_history(
     graph: str,
+    limit: int = Query(default=50, ge=1, le=500),
+    before_id: int | None = None,
     pg: asyncpg.Pool = Depends(get_connection_pool),
 ) -> list[PromptHistory]:
     return [
-        PromptHistory(prompt=x["prompt"], nodes=x["nodes"])
-        for x in await get_prompts_history(pg, graph)
+        PromptHistory(id=x["id"], prompt=x["prompt"], nodes=x["nodes"])
+        for x in await get_prompts_history(pg, graph, limit, before_id)
     ]
 
 
+def require_admin(authorization: str | None = Header(default=None)) -> None:
+    if settings.ADMIN_TOKEN is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    expected = f"Bearer {settings.ADMIN_TOKEN}".encode()
+    if authorization is None or not secrets.compare_digest(
+        authorization.encode(), expected
+    ):
+        raise HTTPException(status_code=401, detail="invalid admin token")
+
+
+@app.get(path="/api/admin/graphs", dependencies=[Depends(require_admin)])
+async def graph_registry_stats() -> dict:
+    return SEARCH_ENGINES.stats()
+
+
+@app.post(path="/api/admin/graphs/{id}/load", dependencies=[Depends(require_admin)])
+async def load_graph(id: str) -> dict:
+    await run_in_threadpool(SEARCH_ENGINES.graph_objects, id)
+    return SEARCH_ENGINES.stats()
+
+
+@app.post(path="/api/admin/graphs/{id}/evict", dependencies=[Depends(require_admin)])
+async def evict_graph(id: str) -> dict:
+    return {"evicted": SEARCH_ENGINES.evict(id)}
+
+
 @app.get(path="/api/import-map")
 async def get_graphs() -> list[dict]:
-    return AVAILABLE_GRAPHS
+    GRAPH_CATALOG.refresh()
+    return [entry.as_dict() for entry in GRAPH_CATALOG.list()]
 
 
 @app.get(path="/api/graph/{id}")
-def get_graph_data(id: str):
+def get_graph_data(id: str, request: Request) -> Response:
     try:
-        import_map = AVAILABLE_GRAPHS
-
-        graph_info = next((item for item in import_map if item["id"] == id), None)
+        graph_info = GRAPH_CATALOG.get(id)
         if not graph_info:
             raise HTTPException(status_code=404, detail="Path not found")
 
-        graph_path = os.path.join(os.getcwd(), f"{graph_info['path']}/graph.json")
-        with open(graph_path, "r", encoding="utf-8") as f:
-            graph = json.load(f)
-
-        return {"name": graph_info["name"], "graph": graph}
+        graph_path = os.path.join(os.getcwd(), f"{graph_info.path}/graph.json")
+        payload = GRAPH_PAYLOADS.get(id, graph_info.name, graph_path)
+
+        encoding = choose_encoding(request.headers.get("accept-encoding"))
+        headers = {
+            "ETag": payload.etag(encoding),
+            "Cache-Control": "no-cache",
+            "Vary": "Accept-Encoding",
+        }
+        if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(
+            content=payload.body(encoding),
+            media_type="application/json",
+            headers=headers,
+        )
 
     except HTTPException:
         raise
@@ -131,6 +306,71 @@ def get_graph_data(id: str):
         raise HTTPException(status_code=500, detail="File read error")
 
 
+@app.get(path="/api/graph/{id}/artifacts/{name}")
+def get_graph_artifact(id: str, name: Literal["graph.json", "rep.json"], request: Request):
+    """A graph file as written by the exporter, using its .br/.gz copies when present."""
+    graph_info = GRAPH_CATALOG.get(id)
+    if not graph_info:
+        raise HTTPException(status_code=404, detail="Path not found")
+    path = os.path.join(graph_info.path, name)
+    if not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="File not found")
+
+    variant, encoding = precompressed_variant(
+        path, request.headers.get("accept-encoding")
+    )
+    headers = {
+        "ETag": file_etag(variant),
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return FileResponse(variant, media_type="application/json", headers=headers)
+
+
+@app.get(path="/api/graph/{id}/viewport")
+def get_graph_viewport(
+    id: str,
+    x0: float = Query(allow_inf_nan=False),
+    y0: float = Query(allow_inf_nan=False),
+    x1: float = Query(allow_inf_nan=False),
+    y1: float = Query(allow_inf_nan=False),
+    zoom: float = Query(default=1.0, gt=0, allow_inf_nan=False),
+    max_nodes: int = Query(default=5000, ge=1, le=50_000),
+) -> Response:
+    """
+    Nodes and links inside a bounding box, without description texts.
+    Zoomed out below GRAPH_DETAIL_ZOOM, or with more than `max_nodes` nodes
+    in the box, communities are returned instead of nodes.
+    """
+    if x0 > x1 or y0 > y1:
+        raise HTTPException(
+            status_code=422, detail="viewport needs x0 <= x1 and y0 <= y1"
+        )
+    graph_info = GRAPH_CATALOG.get(id)
+    if not graph_info:
+        raise HTTPException(status_code=404, detail="Path not found")
+    index = GRAPH_TILES.get(id, os.path.join(graph_info.path, "graph.json"))
+    viewport = Viewport(x0=x0, y0=y0, x1=x1, y1=y1)
+    result = index.query(viewport, zoom, settings.GRAPH_DETAIL_ZOOM, max_nodes)
+    return Response(content=orjson.dumps(result), media_type="application/json")
+
+
+@app.get(path="/api/graph/{id}/nodes/{node_id}")
+def get_graph_node(id: str, node_id: int) -> Response:
+    graph_info = GRAPH_CATALOG.get(id)
+    if not graph_info:
+        raise HTTPException(status_code=404, detail="Path not found")
+    index = GRAPH_TILES.get(id, os.path.join(graph_info.path, "graph.json"))
+    node = index.node_details(node_id)
+    if node is None:
+        raise HTTPException(status_code=404, detail="Node not found")
+    return Response(content=orjson.dumps(node), media_type="application/json")
+
+
 class SaveGraphRequest(BaseModel):
     originalId: str
     graph: dict
@@ -145,22 +385,17 @@ async def save_graph(request: SaveGraphRequest) -> dict:
                 status_code=400, detail="Graph data and originalId are required"
             )
 
-        logger.info(f"Found {len(AVAILABLE_GRAPHS)} graphs in import-map")
-
-        original_graph = next(
-            (item for item in AVAILABLE_GRAPHS if item["id"] == request.originalId),
-            None,
-        )
+        original_graph = GRAPH_CATALOG.get(request.originalId)
         if not original_graph:
             raise HTTPException(status_code=404, detail="Original graph not found")
 
         now = datetime.now()
         date_str = now.strftime("%Y%m%d")  # YYYYMMDD
         time_str = now.strftime("%H%M")  # HHMM
-        base_name = request.name or original_graph["name"]
+        base_name = request.name or original_graph.name
         new_name = f"{base_name}_{date_str}_{time_str}"
         new_id = f"{request.originalId}_{date_str}_{time_str}"
-        new_path = f"data/graphs/{new_id}"
+        new_path = os.path.join(settings.GRAPHS_DIR, new_id)
 
         graph_dir = os.path.join(os.getcwd(), new_path)
         logger.info(f"Creating graph directory: {graph_dir}")
@@ -179,16 +414,12 @@ async def save_graph(request: SaveGraphRequest) -> dict:
 
         new_graph_info = {"id": new_id, "name": new_name, "path": new_path}
 
-        existing_graph = next(
-            (item for item in AVAILABLE_GRAPHS if item["id"] == new_id), None
-        )
-        if existing_graph:
-            logger.warning(f"Graph with id {new_id} already exists, skipping add")
-        else:
-            AVAILABLE_GRAPHS.append(new_graph_info)
-
-        logger.info(f"Writing import-map.json with {len(AVAILABLE_GRAPHS)} graphs")
-        logger.info("Import-map.json synced to disk")
+        # prompts on the copy are answered with the original's tables
+        write_graph_meta(graph_dir, new_name, source=request.originalId)
+        GRAPH_PAYLOADS.invalidate(new_id)
+        GRAPH_TILES.invalidate(new_id)
+        GRAPH_CATALOG.refresh()
+        logger.info(f"Graph registered, {len(GRAPH_CATALOG.list())} graphs available")
 
         graph_exists = os.path.exists(graph_path)
         rep_exists = os.path.exists(rep_path)
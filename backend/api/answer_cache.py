@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol
+
+import asyncpg
+from fastapi.concurrency import run_in_threadpool
+from loguru import logger
+
+from pg import get_cached_prompt_response, save_prompt_response
+
+if TYPE_CHECKING:
+    # imported where the semantic tier uses it, numpy is slow to import
+    import numpy as np
+
+
+def normalize_prompt(text: str) -> str:
+    """Collapse whitespace and case so trivially different prompts share a key."""
+    return " ".join(text.split()).casefold()
+
+
+def request_key(
+    prompt: str, nodes: list[str] | None, graph: str, language: str | None
+) -> str:
+    """Canonical hash of a prompt request, as stored in `prompt_histories.request_hash`."""
+    payload = json.dumps(
+        [normalize_prompt(prompt), sorted(set(nodes or [])), graph, language],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AnswerStore(Protocol):
+    """Persistent tier of the answer cache."""
+
+    async def get(self, key: str) -> str | None: ...
+
+    async def put(
+        self,
+        key: str,
+        prompt: str,
+        response: str,
+        nodes: list[str] | None,
+        graph: str,
+        language: str | None,
+    ) -> None: ...
+
+
+class PostgresAnswerStore:
+    """Answers stored in `prompt_histories`, looked up by `request_hash`."""
+
+    def __init__(self, pool: Any):
+        # a pool or a callable returning the pool once it is connected
+        self._pool = pool
+
+    def _get_pool(self) -> asyncpg.Pool:
+        return self._pool() if callable(self._pool) else self._pool
+
+    async def get(self, key: str) -> str | None:
+        return await get_cached_prompt_response(self._get_pool(), key)
+
+    async def put(
+        self,
+        key: str,
+        prompt: str,
+        response: str,
+        nodes: list[str] | None,
+        graph: str,
+        language: str | None,
+    ) -> None:
+        await save_prompt_response(
+            self._get_pool(),
+            prompt,
+            response,
+            nodes,
+            graph,
+            language=language,
+            request_hash=key,
+        )
+
+
+class SQLiteAnswerStore:
+    """Stand-in for Postgres in tests and local runs without a database."""
+
+    def __init__(self, path: str = ":memory:"):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS answers (
+                    request_hash TEXT PRIMARY KEY,
+                    prompt TEXT,
+                    graph TEXT,
+                    language TEXT,
+                    nodes TEXT,
+                    response TEXT
+                )
+                """
+            )
+
+    def _get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM answers WHERE request_hash = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _put(
+        self,
+        key: str,
+        prompt: str,
+        response: str,
+        nodes: list[str] | None,
+        graph: str,
+        language: str | None,
+    ) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?)",
+                (key, prompt, graph, language, json.dumps(nodes or []), response),
+            )
+
+    async def get(self, key: str) -> str | None:
+        return await asyncio.to_thread(self._get, key)
+
+    async def put(
+        self,
+        key: str,
+        prompt: str,
+        response: str,
+        nodes: list[str] | None,
+        graph: str,
+        language: str | None,
+    ) -> None:
+        await asyncio.to_thread(
+            self._put, key, prompt, response, nodes, graph, language
+        )
+
+
+@dataclass
+class AnswerCacheStats:
+    memory_hits: int = 0
+    store_hits: int = 0
+    semantic_hits: int = 0
+    misses: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "memory_hits": self.memory_hits,
+            "store_hits": self.store_hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+        }
+
+
+@dataclass
+class _SemanticEntry:
+    # unit length, so a dot product is the cosine similarity
+    vector: np.ndarray
+    response: str
+
+
+class AnswerCache:
+    """
+    Two-tier answer cache for `/api/prompt`.
+
+    Lookups go to an in-process LRU keyed by `request_key`, then to the
+    persistent store. If an embedder and a similarity threshold are given,
+    a miss on both tiers is also compared against the embeddings of recent
+    prompts asked with the same graph, language and node selection. The
+    embeddings kept are bounded by `max_semantic_entries` per selection and
+    `max_semantic_scopes` selections, both least recently used first.
+    """
+
+    def __init__(
+        self,
+        store: AnswerStore,
+        max_entries: int = 1024,
+        embedder: Any | None = None,
+        similarity_threshold: float | None = None,
+        max_semantic_entries: int = 256,
+        max_semantic_scopes: int = 64,
+    ):
+        self.store = store
+        self.max_entries = max_entries
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        self.max_semantic_entries = max_semantic_entries
+        self.max_semantic_scopes = max_semantic_scopes
+        self.stats = AnswerCacheStats()
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._semantic: OrderedDict[tuple, OrderedDict[str, _SemanticEntry]] = (
+            OrderedDict()
+        )
+
+    @property
+    def semantic_enabled(self) -> bool:
+        return self.embedder is not None and self.similarity_threshold is not None
+
+    async def get(
+        self, prompt: str, nodes: list[str] | None, graph: str, language: str | None
+    ) -> str | None:
+        key = request_key(prompt, nodes, graph, language)
+
+        response = self._memory.get(key)
+        if response is not None:
+            self._memory.move_to_end(key)
+            self.stats.memory_hits += 1
+            return response
+
+        response = await self.store.get(key)
+        if response is not None:
+            self._remember(key, response)
+            self.stats.store_hits += 1
+            return response
+
+        if self.semantic_enabled:
+            response = await self._semantic_get(prompt, nodes, graph, language)
+            if response is not None:
+                self.stats.semantic_hits += 1
+                return response
+
+        self.stats.misses += 1
+        return None
+
+    async def put(
+        self,
+        prompt: str,
+        nodes: list[str] | None,
+        graph: str,
+        language: str | None,
+        response: str,
+    ) -> None:
+        key = request_key(prompt, nodes, graph, language)
+        await self.store.put(key, prompt, response, nodes, graph, language)
+        self._remember(key, response)
+        if self.semantic_enabled:
+            try:
+                await self._semantic_put(key, prompt, nodes, graph, language, response)
+            except Exception as exc:
+                logger.warning(f'msg="Failed to embed prompt for answer cache" {exc}')
+
+    def _remember(self, key: str, response: str) -> None:
+        self._memory[key] = response
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    async def _embed(self, prompt: str) -> np.ndarray:
+        import numpy as np
+
+        vector = await self.embedder.aembed(normalize_prompt(prompt))  # type: ignore
+        return _unit(np.asarray(vector, dtype=np.float32))
+
+    async def _semantic_get(
+        self, prompt: str, nodes: list[str] | None, graph: str, language: str | None
+    ) -> str | None:
+        scope_key = _scope_key(nodes, graph, language)
+        scope = self._semantic.get(scope_key)
+        if not scope:
+            return None
+        self._semantic.move_to_end(scope_key)
+        try:
+            vector = await self._embed(prompt)
+        except Exception as exc:
+            logger.warning(f'msg="Failed to embed prompt for answer cache" {exc}')
+            return None
+        # snapshot on the event loop, the scope may change during the scan
+        keys = list(scope)
+        vectors = [entry.vector for entry in scope.values()]
+        index, score = await run_in_threadpool(_best_match, vectors, vector)
+        if score < self.similarity_threshold:  # type: ignore
+            return None
+        entry = scope.get(keys[index])
+        if entry is None:
+            return None
+        scope.move_to_end(keys[index])
+        return entry.response
+
+    async def _semantic_put(
+        self,
+        key: str,
+        prompt: str,
+        nodes: list[str] | None,
+        graph: str,
+        language: str | None,
+        response: str,
+    ) -> None:
+        vector = await self._embed(prompt)
+        scope_key = _scope_key(nodes, graph, language)
+        scope = self._semantic.setdefault(scope_key, OrderedDict())
+        self._semantic.move_to_end(scope_key)
+        scope[key] = _SemanticEntry(vector=vector, response=response)
+        scope.move_to_end(key)
+        while len(scope) > self.max_semantic_entries:
+            scope.popitem(last=False)
+        while len(self._semantic) > self.max_semantic_scopes:
+            self._semantic.popitem(last=False)
+
+
+def _scope_key(nodes: list[str] | None, graph: str, language: str | None) -> tuple:
+    return (graph, language, frozenset(nodes or []))
+
+
+def _unit(vector: np.ndarray) -> np.ndarray:
+    import numpy as np
+
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def _best_match(vectors: list[np.ndarray], vector: np.ndarray) -> tuple[int, float]:
+    """Position and cosine similarity of the unit vector closest to `vector`."""
+    import numpy as np
+
+    scores = np.stack(vectors) @ vector
+    index = int(np.argmax(scores))
+    return index, float(scores[index])
@@ -0,0 +1,165 @@
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+
+from loguru import logger
+from settings import GraphSettings
+
+META_FILE = "meta.json"
+
+# graph-save names copies "<original id>_<YYYYMMDD>_<HHMM>"
+SAVED_GRAPH_ID = re.compile(r"^(?P<source>.+)_\d{8}_\d{4}$")
+
+
+@dataclass
+class GraphEntry:
+    """A graph directory with a `graph.json` for the viewer."""
+
+    id: str
+    name: str
+    path: str
+    # graph this one was saved from, it answers prompts with the source's tables
+    source: str | None = None
+    # indexing output of the graph itself
+    tables: GraphSettings | None = None
+
+    def as_dict(self) -> dict:
+        return {"id": self.id, "name": self.name, "path": self.path}
+
+
+def graph_settings_from_dir(output_dir: str, community_level: int) -> GraphSettings:
+    """Table paths of a graphrag indexing output directory."""
+    return GraphSettings(
+        COMMUNITY_LEVEL=community_level,
+        COMMUNITY_REPORT_TABLE=os.path.join(
+            output_dir, "create_final_community_reports.parquet"
+        ),
+        ENTITY_TABLE=os.path.join(output_dir, "create_final_nodes.parquet"),
+        ENTITY_EMBEDDING_TABLE=os.path.join(output_dir, "create_final_entities.parquet"),
+        TEXT_UNIT_TABLE=os.path.join(output_dir, "create_final_text_units.parquet"),
+        COMMUNITY_TABLE=os.path.join(output_dir, "create_final_communities.parquet"),
+        RELATIONSHIP_TABLE=os.path.join(
+            output_dir, "create_final_relationships.parquet"
+        ),
+    )
+
+
+class GraphCatalog:
+    """
+    Graphs discovered under `graphs_dir`.
+
+    Every subdirectory with a `graph.json` is a graph. An optional `meta.json`
+    gives its display `name`, the `source` graph it was saved from, or an
+    indexing `output_dir` (with `community_level`) it can be queried with.
+    Graphs listed in `configured` are queried with their configured tables.
+    Looking up an unknown id rescans the directory at most once every
+    `miss_refresh_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        graphs_dir: str,
+        configured: dict[str, GraphSettings],
+        aliases: dict[str, str] | None = None,
+        miss_refresh_interval: float = 1.0,
+    ):
+        self.graphs_dir = graphs_dir
+        self.configured = configured
+        self.aliases = aliases or {}
+        self.miss_refresh_interval = miss_refresh_interval
+        self._entries: dict[str, GraphEntry] = {}
+        self._refreshed_at = float("-inf")
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self) -> None:
+        entries = {}
+        if os.path.isdir(self.graphs_dir):
+            for graph_id in sorted(os.listdir(self.graphs_dir)):
+                path = os.path.join(self.graphs_dir, graph_id)
+                if os.path.isfile(os.path.join(path, "graph.json")):
+                    entries[graph_id] = self._read_entry(graph_id, path)
+        with self._lock:
+            self._entries = entries
+            self._refreshed_at = time.monotonic()
+
+    def list(self) -> list[GraphEntry]:
+        with self._lock:
+            return list(self._entries.values())
+
+    def get(self, graph_id: str) -> GraphEntry | None:
+        with self._lock:
+            entry = self._entries.get(graph_id)
+            stale = time.monotonic() - self._refreshed_at >= self.miss_refresh_interval
+        if entry is None and stale:
+            # saved by another worker since the last scan
+            self.refresh()
+            with self._lock:
+                entry = self._entries.get(graph_id)
+        return entry
+
+    def query_graph(self, graph_id: str) -> str | None:
+        """Id of the graph whose tables answer prompts for `graph_id`."""
+        seen = set()
+        graph_id = self.aliases.get(graph_id, graph_id)
+        while graph_id not in seen:
+            seen.add(graph_id)
+            if graph_id in self.configured:
+                return graph_id
+            entry = self.get(graph_id)
+            if entry is None:
+                return None
+            if entry.tables is not None:
+                return graph_id
+            if entry.source is None:
+                return None
+            graph_id = self.aliases.get(entry.source, entry.source)
+        return None
+
+    def table_settings(self, query_graph: str) -> GraphSettings:
+        if query_graph in self.configured:
+            return self.configured[query_graph]
+        entry = self.get(query_graph)
+        if entry is None or entry.tables is None:
+            raise KeyError(query_graph)
+        return entry.tables
+
+    def _read_entry(self, graph_id: str, path: str) -> GraphEntry:
+        meta = {}
+        meta_path = os.path.join(path, META_FILE)
+        if os.path.isfile(meta_path):
+            try:
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+            except (OSError, ValueError) as exc:
+                logger.warning(f'msg="Invalid graph meta" {meta_path=} {exc}')
+
+        source = meta.get("source")
+        if source is None and graph_id not in self.configured:
+            match = SAVED_GRAPH_ID.match(graph_id)
+            source = match.group("source") if match else None
+
+        tables = None
+        if meta.get("output_dir"):
+            tables = graph_settings_from_dir(
+                meta["output_dir"], int(meta.get("community_level", 2))
+            )
+
+        return GraphEntry(
+            id=graph_id,
+            name=meta.get("name", graph_id),
+            path=path,
+            source=source,
+            tables=tables,
+        )
+
+
+def write_graph_meta(path: str, name: str, source: str | None = None) -> None:
+    meta = {"name": name}
+    if source is not None:
+        meta["source"] = source
+    with open(os.path.join(path, META_FILE), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,142 @@
+import gzip
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import brotli
+import orjson
+
+_ETAG_SUFFIXES = {"identity": "", "gzip": "-gz", "br": "-br"}
+_PRECOMPRESSED_SUFFIXES = {"gzip": ".gz", "br": ".br"}
+
+
+@dataclass(frozen=True)
+class GraphPayload:
+    """A `/api/graph/{id}` response body, encoded once in every supported encoding."""
+
+    digest: str
+    identity: bytes
+    gzip: bytes
+    br: bytes
+    signature: tuple[int, int]
+
+    def body(self, encoding: str) -> bytes:
+        return getattr(self, encoding)
+
+    def etag(self, encoding: str) -> str:
+        """Strong ETag of the body in `encoding`; each encoding has its own bytes."""
+        return f'"{self.digest}{_ETAG_SUFFIXES[encoding]}"'
+
+
+def accepted_encodings(accept_encoding: str | None) -> list[str]:
+    """
+    `br` and `gzip`, in the order an Accept-Encoding header prefers them.
+
+    Codings the header does not list, directly or through `*`, or lists with
+    q=0 are left out; `br` goes first between equal q-values.
+    """
+    accepted = {}
+    for item in (accept_encoding or "").split(","):
+        coding, *params = item.split(";")
+        quality = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    wildcard = accepted.get("*", 0.0)
+    qualities = {coding: accepted.get(coding, wildcard) for coding in ("br", "gzip")}
+    return sorted(
+        (coding for coding, quality in qualities.items() if quality > 0),
+        key=lambda coding: -qualities[coding],
+    )
+
+
+def choose_encoding(accept_encoding: str | None) -> str:
+    """Best of `br`, `gzip` and `identity` allowed by an Accept-Encoding header."""
+    encodings = accepted_encodings(accept_encoding)
+    return encodings[0] if encodings else "identity"
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def precompressed_variant(path: str, accept_encoding: str | None) -> tuple[str, str]:
+    """
+    Path and encoding of the best pre-compressed copy of `path` written by
+    `scripts/graph.py export` that the client accepts, falling back to the
+    file itself when no accepted copy is there and up to date.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    for coding in accepted_encodings(accept_encoding):
+        variant = path + _PRECOMPRESSED_SUFFIXES[coding]
+        try:
+            if os.stat(variant).st_mtime_ns >= mtime:
+                return variant, coding
+        except FileNotFoundError:
+            continue
+    return path, "identity"
+
+
+def file_etag(path: str) -> str:
+    stat = os.stat(path)
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+class GraphPayloadCache:
+    """
+    LRU of encoded graph responses.
+
+    An entry is rebuilt when the size or mtime of its `graph.json` changes,
+    and dropped with `invalidate` when the API rewrites the file itself.
+    """
+
+    def __init__(self, max_entries: int = 16):
+        self.max_entries = max_entries
+        self._payloads: OrderedDict[str, GraphPayload] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, graph_id: str, name: str, graph_path: str) -> GraphPayload:
+        stat = os.stat(graph_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            payload = self._payloads.get(graph_id)
+            if payload is not None and payload.signature == signature:
+                self._payloads.move_to_end(graph_id)
+                return payload
+
+        payload = self._encode(name, graph_path, signature)
+        with self._lock:
+            self._payloads[graph_id] = payload
+            self._payloads.move_to_end(graph_id)
+            while len(self._payloads) > self.max_entries:
+                self._payloads.popitem(last=False)
+        return payload
+
+    def invalidate(self, graph_id: str) -> None:
+        with self._lock:
+            self._payloads.pop(graph_id, None)
+
+    @staticmethod
+    def _encode(
+        name: str, graph_path: str, signature: tuple[int, int]
+    ) -> GraphPayload:
+        with open(graph_path, "rb") as f:
+            graph = orjson.loads(f.read())
+        body = orjson.dumps({"name": name, "graph": graph})
+        return GraphPayload(
+            digest=hashlib.sha256(body).hexdigest()[:32],
+            identity=body,
+            gzip=gzip.compress(body, compresslevel=9),
+            br=brotli.compress(body, quality=9),
+            signature=signature,
+        )
@@ -0,0 +1,61 @@
+import fcntl
+import hashlib
+import os
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from loguru import logger
+
+
+def arrow_path(parquet_path: str, cache_dir: str) -> str:
+    """Location of the Arrow IPC copy of a parquet table."""
+    digest = hashlib.sha1(os.path.abspath(parquet_path).encode("utf-8")).hexdigest()
+    name = os.path.splitext(os.path.basename(parquet_path))[0]
+    return os.path.join(cache_dir, f"{name}-{digest[:12]}.arrow")
+
+
+def ensure_arrow(parquet_path: str, cache_dir: str) -> str:
+    """
+    Convert a parquet table to an uncompressed Arrow IPC file unless an
+    up-to-date copy already exists. Workers starting together take a file
+    lock, so only the first one converts and the rest reuse its output.
+    """
+    path = arrow_path(parquet_path, cache_dir)
+    if _is_fresh(path, parquet_path):
+        return path
+
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(f"{path}.lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        if not _is_fresh(path, parquet_path):
+            logger.info(f'msg="Converting table to arrow" {parquet_path=}')
+            table = pq.read_table(parquet_path)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with pa.OSFile(tmp_path, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, path)
+    return path
+
+
+def read_table(parquet_path: str, cache_dir: str | None) -> pa.Table:
+    """
+    Read an indexing output table through its memory-mapped Arrow copy.
+
+    The table is returned as Arrow, every column still pointing into the
+    mapping, which the OS shares between every worker that maps the same
+    file. Convert only the columns a query step needs, when it needs them.
+    Without `cache_dir` the parquet file is read into memory.
+    """
+    if cache_dir is None:
+        return pq.read_table(parquet_path)
+    path = ensure_arrow(parquet_path, cache_dir)
+    with pa.memory_map(path, "r") as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+def _is_fresh(path: str, parquet_path: str) -> bool:
+    try:
+        return os.stat(path).st_mtime_ns >= os.stat(parquet_path).st_mtime_ns
+    except FileNotFoundError:
+        return False
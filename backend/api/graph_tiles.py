@@ -0,0 +1,274 @@
+import math
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+import orjson
+
+# target number of nodes per grid cell
+NODES_PER_CELL = 32
+
+
+@dataclass
+class Viewport:
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+
+
+class GraphTileIndex:
+    """
+    Uniform grid over the node positions of a `graph.json`.
+
+    Viewport queries return the nodes inside a bounding box and the links
+    touching them, without the description texts. When the viewport is
+    zoomed out, or holds more than `max_nodes` nodes, communities are
+    returned instead: one point per community at the centroid of its
+    members, and one link per connected pair of communities.
+    """
+
+    def __init__(self, graph: dict):
+        nodes = graph.get("nodes", [])
+        links = graph.get("links", [])
+        self.nodes = nodes
+        self.links = links
+
+        self.x = np.array([node.get("x", 0.0) for node in nodes], dtype=np.float64)
+        self.y = np.array([node.get("y", 0.0) for node in nodes], dtype=np.float64)
+        self._position = {node["id"]: i for i, node in enumerate(nodes)}
+        self.source = np.array(
+            [self._position[link["source"]] for link in links], dtype=np.int64
+        )
+        self.target = np.array(
+            [self._position[link["target"]] for link in links], dtype=np.int64
+        )
+
+        # saved graphs carry the community id, older ones only its color
+        community_keys = [
+            str(node["data"].get("community", node["data"].get("color", "")))
+            for node in nodes
+        ]
+        keys, self.community = np.unique(community_keys, return_inverse=True)
+        self.community = self.community.astype(np.int64)
+        self.community_keys = keys.tolist()
+        self._build_communities()
+        self._build_grid()
+
+    def _build_communities(self) -> None:
+        count = len(self.community_keys)
+        self.community_size = np.bincount(self.community, minlength=count)
+        sizes = np.maximum(self.community_size, 1)
+        self.community_x = np.bincount(self.community, self.x, count) / sizes
+        self.community_y = np.bincount(self.community, self.y, count) / sizes
+        self.community_color = [""] * count
+        for node, community in zip(self.nodes, self.community.tolist(), strict=True):
+            if not self.community_color[community]:
+                self.community_color[community] = node["data"].get("color", "")
+
+        pairs = np.stack(
+            [self.community[self.source], self.community[self.target]], axis=1
+        )
+        pairs = np.sort(pairs, axis=1)
+        pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+        if len(pairs):
+            self.community_links, self.community_link_weight = np.unique(
+                pairs, axis=0, return_counts=True
+            )
+        else:
+            self.community_links = np.empty((0, 2), dtype=np.int64)
+            self.community_link_weight = np.empty(0, dtype=np.int64)
+
+    def _build_grid(self) -> None:
+        if len(self.nodes) == 0:
+            self.min_x = self.min_y = 0.0
+            self.cell_size = 1.0
+            self.cells: dict[tuple[int, int], np.ndarray] = {}
+            return
+        self.min_x, self.min_y = float(self.x.min()), float(self.y.min())
+        width = max(float(self.x.max()) - self.min_x, 1e-9)
+        height = max(float(self.y.max()) - self.min_y, 1e-9)
+        cells_wanted = max(len(self.nodes) / NODES_PER_CELL, 1.0)
+        self.cell_size = math.sqrt(width * height / cells_wanted) or 1.0
+
+        cell_x = ((self.x - self.min_x) // self.cell_size).astype(np.int64)
+        cell_y = ((self.y - self.min_y) // self.cell_size).astype(np.int64)
+        order = np.lexsort((cell_y, cell_x))
+        keys = np.stack([cell_x[order], cell_y[order]], axis=1)
+        starts = np.flatnonzero(np.any(np.diff(keys, axis=0) != 0, axis=1)) + 1
+        starts = np.concatenate([[0], starts])
+        ends = np.concatenate([starts[1:], [len(order)]])
+        self.cells = {
+            (int(keys[start, 0]), int(keys[start, 1])): order[start:end]
+            for start, end in zip(starts, ends, strict=True)
+        }
+
+    def nodes_in(self, viewport: Viewport) -> np.ndarray:
+        """Positions of the nodes inside the viewport."""
+        if not self.cells:
+            return np.empty(0, dtype=np.int64)
+        cx0 = int((viewport.x0 - self.min_x) // self.cell_size)
+        cx1 = int((viewport.x1 - self.min_x) // self.cell_size)
+        cy0 = int((viewport.y0 - self.min_y) // self.cell_size)
+        cy1 = int((viewport.y1 - self.min_y) // self.cell_size)
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self.cells):
+            candidates = [
+                members
+                for (cx, cy), members in self.cells.items()
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1
+            ]
+        else:
+            candidates = [
+                self.cells[(cx, cy)]
+                for cx in range(cx0, cx1 + 1)
+                for cy in range(cy0, cy1 + 1)
+                if (cx, cy) in self.cells
+            ]
+        if not candidates:
+            return np.empty(0, dtype=np.int64)
+        candidate = np.concatenate(candidates)
+        inside = (
+            (self.x[candidate] >= viewport.x0)
+            & (self.x[candidate] <= viewport.x1)
+            & (self.y[candidate] >= viewport.y0)
+            & (self.y[candidate] <= viewport.y1)
+        )
+        return np.sort(candidate[inside])
+
+    def query(
+        self, viewport: Viewport, zoom: float, detail_zoom: float, max_nodes: int
+    ) -> dict:
+        inside = self.nodes_in(viewport)
+        if zoom < detail_zoom or len(inside) > max_nodes:
+            return self._community_view(inside, max_links=max_nodes)
+        return self._node_view(inside)
+
+    def _node_view(self, inside: np.ndarray) -> dict:
+        inside_mask = np.zeros(len(self.nodes), dtype=bool)
+        inside_mask[inside] = True
+        link_positions = np.flatnonzero(
+            inside_mask[self.source] | inside_mask[self.target]
+        )
+        # endpoints outside the viewport are included so edges leaving it
+        # can be drawn
+        visible = np.union1d(
+            inside,
+            np.concatenate(
+                [self.source[link_positions], self.target[link_positions]]
+            ),
+        )
+        return {
+            "level": "nodes",
+            "nodes": [self._node_summary(int(i)) for i in visible],
+            "links": [
+                {
+                    "source": self.links[i]["source"],
+                    "target": self.links[i]["target"],
+                    "id": self.links[i]["data"].get("id", int(i)),
+                    "color": self.links[i]["data"].get("color"),
+                }
+                for i in link_positions.tolist()
+            ],
+        }
+
+    def _community_view(self, inside: np.ndarray, max_links: int) -> dict:
+        visible = np.unique(self.community[inside])
+        visible_mask = np.zeros(len(self.community_keys), dtype=bool)
+        visible_mask[visible] = True
+        link_positions = np.flatnonzero(
+            visible_mask[self.community_links[:, 0]]
+            & visible_mask[self.community_links[:, 1]]
+        )
+        if len(link_positions) > max_links:
+            # keep the strongest connections between communities
+            weights = self.community_link_weight[link_positions]
+            link_positions = link_positions[
+                np.argpartition(weights, -max_links)[-max_links:]
+            ]
+        return {
+            "level": "communities",
+            "nodes": [
+                {
+                    "id": self.community_keys[c],
+                    "x": float(self.community_x[c]),
+                    "y": float(self.community_y[c]),
+                    "size": int(self.community_size[c]),
+                    "color": self.community_color[c],
+                }
+                for c in visible.tolist()
+            ],
+            "links": [
+                {
+                    "source": self.community_keys[a],
+                    "target": self.community_keys[b],
+                    "weight": int(weight),
+                }
+                for (a, b), weight in zip(
+                    self.community_links[link_positions].tolist(),
+                    self.community_link_weight[link_positions].tolist(),
+                    strict=True,
+                )
+            ],
+        }
+
+    def _node_summary(self, position: int) -> dict:
+        node = self.nodes[position]
+        data = node.get("data", {})
+        return {
+            "id": node["id"],
+            "name": node.get("name"),
+            "x": node.get("x"),
+            "y": node.get("y"),
+            "color": data.get("color"),
+            "size": data.get("size"),
+            "community": self.community_keys[self.community[position]],
+        }
+
+    def node_details(self, node_id) -> dict | None:
+        """The full node, with its texts and the explanations of its links."""
+        position = self._position.get(node_id)
+        if position is None:
+            return None
+        node = self.nodes[position]
+        link_positions = np.flatnonzero(
+            (self.source == position) | (self.target == position)
+        )
+        return {
+            **node,
+            "links": [self.links[i] for i in link_positions.tolist()],
+        }
+
+
+class GraphTileCache:
+    """Tile indexes of recently viewed graphs, rebuilt when `graph.json` changes."""
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self._indexes: OrderedDict[str, tuple[tuple[int, int], GraphTileIndex]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, graph_id: str, graph_path: str) -> GraphTileIndex:
+        stat = os.stat(graph_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._indexes.get(graph_id)
+            if cached is not None and cached[0] == signature:
+                self._indexes.move_to_end(graph_id)
+                return cached[1]
+
+        with open(graph_path, "rb") as f:
+            index = GraphTileIndex(orjson.loads(f.read()))
+        with self._lock:
+            self._indexes[graph_id] = (signature, index)
+            self._indexes.move_to_end(graph_id)
+            while len(self._indexes) > self.max_entries:
+                self._indexes.popitem(last=False)
+        return index
+
+    def invalidate(self, graph_id: str) -> None:
+        with self._lock:
+            self._indexes.pop(graph_id, None)
@@ -1,24 +1,22 @@
+# The query stack (pandas, pyarrow, tiktoken, the YandexGPT SDK) is imported
+# on first use, so the API starts accepting connections without it and
+# loads it in the background warmup, see `warmup`.
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, is_dataclass, replace
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 from fastapi import HTTPException
+from graph_catalog import GraphCatalog
 from loguru import logger
-from yandex_cloud_ml_sdk import YCloudML
-from settings import settings
-
-import pandas as pd
-
-
-from graphrag.query.indexer_adapters import (
-    read_indexer_entities,
-    read_indexer_reports,
-)
-from graphrag.query.structured_search.global_search.community_context import (
-    GlobalCommunityContext,
-)
-from graphrag.query.structured_search.global_search.search import GlobalSearch
-import tiktoken
-import requests
+from settings import GraphSettings, settings
 
-
-from graphrag.query.structured_search.local_search.search import LocalSearch
 from graphrag.query.structured_search.local_search.system_prompt import (
     LOCAL_SEARCH_SYSTEM_PROMPT,
 )
@@ -29,6 +27,15 @@ from graphrag.query.structured_search.global_search.reduce_system_prompt import
     REDUCE_SYSTEM_PROMPT,
 )
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+    import tiktoken
+
+    from graphrag.model import CommunityReport, Entity
+    from graphrag.query.llm.yandex import YandexEmbedding, YandexGPTChat
+    from graphrag.query.structured_search.global_search.search import GlobalSearch
+    from graphrag.query.structured_search.local_search.search import LocalSearch
+
 
 def create_local_search_prompt_with_language(language: str | None) -> str:
     """Create a local search system prompt with language instruction."""
@@ -72,31 +79,6 @@ def create_reduce_system_prompt_with_language(language: str | None) -> str:
     return base_prompt
 
 
-class YandexGPTEmbeddingLLM:
-    def __init__(self):
-        pass
-
-    def embed(self, text):
-        query_uri = f"emb://{settings.YANDEX_FOLDER_ID}/text-search-query/latest"
-
-        embed_url = (
-            "https://llm.api.cloud.yandex.net:443/foundationModels/v1/textEmbedding"
-        )
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {settings.YANDEX_TOKEN}",
-            "x-folder-id": f"{settings.YANDEX_FOLDER_ID}",
-        }
-
-        query_data = {
-            "modelUri": query_uri,
-            "text": text,
-        }
-        res = requests.post(embed_url, json=query_data, headers=headers).json()
-
-        return res["embedding"]
-
-
 context_builder_params = {
     "use_community_summary": False,  # False means using full community reports. True means using community short summaries.
     "shuffle_data": True,
@@ -141,105 +123,474 @@ llm_params = {
 }
 
 
-PODCAST_ENTITY_DF = pd.read_parquet(settings.PODCAST.ENTITY_TABLE)
-PODCAST_REPORT_DF = pd.read_parquet(settings.PODCAST.COMMUNITY_REPORT_TABLE)
-PODCAST_ENTITY_EMBEDDING_DF = pd.read_parquet(settings.PODCAST.ENTITY_EMBEDDING_TABLE)
-PODCAST_TEXT_UNITS_DF = pd.read_parquet(settings.PODCAST.TEXT_UNIT_TABLE)
-PODCAST_COMMUNITIES_DF = pd.read_parquet(settings.PODCAST.COMMUNITY_TABLE)
-PODCAST_COMMUNITIES_DF = PODCAST_COMMUNITIES_DF.rename(columns={"id": "community"})
-PODCAST_RP_DF = pd.read_parquet(settings.PODCAST.RELATIONSHIP_TABLE)
+@dataclass
+class GraphData:
+    """
+    Indexing output tables of one graph, as Arrow tables.
+
+    With GRAPH_TABLE_CACHE_DIR set the tables point into memory-mapped files
+    whose pages every worker shares; columns are converted to pandas only
+    while the query objects are built from them.
+    """
+
+    entity_table: pa.Table
+    report_table: pa.Table
+    entity_embedding_table: pa.Table
+    community_level: int
+    community_table: pa.Table
+    text_unit_table: pa.Table
+    relationship_table: pa.Table
+    signature: tuple[int, ...]
+    memory_mapped: bool = False
+
+    def memory_usage(self) -> int:
+        """
+        Bytes the tables hold on this worker's heap. Memory-mapped tables
+        live in the shared page cache and count as zero.
+        """
+        if self.memory_mapped:
+            return 0
+        return sum(
+            table.nbytes
+            for table in (
+                self.entity_table,
+                self.report_table,
+                self.entity_embedding_table,
+                self.community_table,
+                self.text_unit_table,
+                self.relationship_table,
+            )
+        )
 
-GAZETA_ENTITY_DF = pd.read_parquet(settings.GAZETA.ENTITY_TABLE)
-GAZETA_REPORT_DF = pd.read_parquet(settings.GAZETA.COMMUNITY_REPORT_TABLE)
-GAZETA_ENTITY_EMBEDDING_DF = pd.read_parquet(settings.GAZETA.ENTITY_EMBEDDING_TABLE)
-GAZETA_TEXT_UNITS_DF = pd.read_parquet(settings.GAZETA.TEXT_UNIT_TABLE)
-GAZETA_COMMUNITIES_DF = pd.read_parquet(settings.GAZETA.COMMUNITY_TABLE)
-GAZETA_RP_DF = pd.read_parquet(settings.GAZETA.RELATIONSHIP_TABLE)
 
-TOKEN_ENCODER = tiktoken.get_encoding("cl100k_base")
+GRAPH_CATALOG = GraphCatalog(
+    settings.GRAPHS_DIR,
+    configured={"podcast": settings.PODCAST, "gazeta": settings.GAZETA},
+    aliases={"podcast-en": "podcast"},
+)
 
 
-class YandexGPT:
-    def __init__(self):
-        sdk = YCloudML(folder_id=settings.YANDEX_FOLDER_ID, auth=settings.YANDEX_TOKEN)
-        self.model = sdk.models.completions(
-            settings.YANDEX_MODEL, model_version=settings.YANDEX_MODEL_VERSION
-        )
+def _table_paths(graph_settings: GraphSettings) -> list[str]:
+    return [
+        graph_settings.ENTITY_TABLE,
+        graph_settings.COMMUNITY_REPORT_TABLE,
+        graph_settings.ENTITY_EMBEDDING_TABLE,
+        graph_settings.TEXT_UNIT_TABLE,
+        graph_settings.COMMUNITY_TABLE,
+        graph_settings.RELATIONSHIP_TABLE,
+    ]
+
+
+def graph_tables_signature(graph_settings: GraphSettings) -> tuple[int, ...]:
+    """Modification times of a graph's tables, used to detect re-indexing."""
+    return tuple(os.stat(path).st_mtime_ns for path in _table_paths(graph_settings))
+
+
+def read_graph_data(graph_settings: GraphSettings) -> GraphData:
+    from graph_store import read_table
+
+    signature = graph_tables_signature(graph_settings)
+    cache_dir = settings.GRAPH_TABLE_CACHE_DIR
+    return GraphData(
+        entity_table=read_table(graph_settings.ENTITY_TABLE, cache_dir),
+        report_table=read_table(graph_settings.COMMUNITY_REPORT_TABLE, cache_dir),
+        entity_embedding_table=read_table(
+            graph_settings.ENTITY_EMBEDDING_TABLE, cache_dir
+        ),
+        community_level=graph_settings.COMMUNITY_LEVEL,
+        community_table=read_table(graph_settings.COMMUNITY_TABLE, cache_dir),
+        text_unit_table=read_table(graph_settings.TEXT_UNIT_TABLE, cache_dir),
+        relationship_table=read_table(graph_settings.RELATIONSHIP_TABLE, cache_dir),
+        signature=signature,
+        memory_mapped=cache_dir is not None,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_token_encoder() -> tiktoken.Encoding:
+    import tiktoken
+
+    return tiktoken.get_encoding("cl100k_base")
+
+
+@lru_cache(maxsize=1)
+def get_llm() -> YandexGPTChat:
+    from graphrag.query.llm.yandex import YandexGPTChat
+
+    # the default yandexgpt version, which global search has always used
+    return YandexGPTChat(
+        folder_id=settings.YANDEX_FOLDER_ID,
+        token=settings.YANDEX_TOKEN,
+        max_workers=settings.YANDEX_MAX_WORKERS,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_text_embedder() -> YandexEmbedding:
+    from graphrag.query.llm.yandex import YandexEmbedding
+
+    return YandexEmbedding(
+        folder_id=settings.YANDEX_FOLDER_ID,
+        token=settings.YANDEX_TOKEN,
+        max_connections=settings.YANDEX_MAX_WORKERS,
+        cache_size=settings.EMBEDDING_CACHE_SIZE,
+    )
+
+
+async def close_llm() -> None:
+    if get_llm.cache_info().currsize:
+        get_llm().close()
+    if get_text_embedder.cache_info().currsize:
+        await get_text_embedder().aclose()
+
+
+def canonical_graph(graph: str) -> str:
+    """Id of the graph whose tables answer prompts for `graph`."""
+    query_graph = GRAPH_CATALOG.query_graph(graph)
+    if query_graph is None:
+        logger.error('msg="Unknown graph"')
+        raise HTTPException(status_code=404, detail="graph not found")
+    return query_graph
+
+
+@dataclass
+class GraphObjects:
+    """Query model objects materialized once per graph."""
+
+    reports: list[CommunityReport]
+    entities: list[Entity]
+    community_by_title: dict[str, str]
+    signature: tuple[int, ...]
+
+    def memory_usage(self) -> int:
+        """Approximate deep size of the objects in bytes."""
+        return deep_size((self.reports, self.entities, self.community_by_title))
+
+
+def deep_size(obj: object, seen: set[int] | None = None) -> int:
+    """Size of an object and everything it references, each object counted once."""
+    seen = set() if seen is None else seen
+    size = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, list | tuple | set | frozenset):
+            stack.extend(item)
+        elif is_dataclass(item) and not isinstance(item, type):
+            stack.append(vars(item))
+    return size
+
+
+def load_graph_objects(data: GraphData) -> GraphObjects:
+    from graphrag.query.indexer_adapters import (
+        read_indexer_entities,
+        read_indexer_reports,
+    )
+
+    # the pandas copies only live while the objects are built
+    entity_df = data.entity_table.select(
+        ["title", "degree", "community", "level"]
+    ).to_pandas()
+    report_df = data.report_table.to_pandas()
+    # global search never reads the description embeddings, leaving them out
+    # keeps a list of Python floats per entity out of every worker
+    entity_embedding_table = data.entity_embedding_table
+    if "description_embedding" in entity_embedding_table.column_names:
+        entity_embedding_table = entity_embedding_table.drop(["description_embedding"])
+    entity_embedding_df = entity_embedding_table.to_pandas()
+    community_level = data.community_level
+
+    reports = read_indexer_reports(report_df, entity_df, community_level)
+    entities = read_indexer_entities(entity_df, entity_embedding_df, community_level)
+
+    # same "max community under level" rule read_indexer_reports uses to pick
+    # the reports of the selected nodes
+    level_df = entity_df[entity_df.level <= community_level]
+    community_by_title = (
+        level_df["community"]
+        .fillna(-1)
+        .astype(int)
+        .groupby(level_df["title"])
+        .max()
+        .astype(str)
+        .to_dict()
+    )
+    return GraphObjects(
+        reports=reports,
+        entities=entities,
+        community_by_title=community_by_title,
+        signature=data.signature,
+    )
+
+
+def build_search_engine(
+    objects: GraphObjects, nodes: list[str] | None, language: str | None = None
+) -> GlobalSearch:
+    from graphrag.query.structured_search.global_search.community_context import (
+        GlobalCommunityContext,
+    )
+    from graphrag.query.structured_search.global_search.search import GlobalSearch
 
-    def generate(self, prompt):
-        response = self.model.run(prompt)
-        result = {
-            "output": response[0].text,
-            "history": [],
+    if nodes:
+        selected = set(nodes)
+        communities = {
+            objects.community_by_title[title]
+            for title in selected
+            if title in objects.community_by_title
         }
+        reports = [r for r in objects.reports if r.community_id in communities]
+        entities = [e for e in objects.entities if e.title in selected]
+    else:
+        reports = objects.reports
+        entities = objects.entities
+
+    # community weights are written into report attributes by the context
+    # builder, so every engine gets its own report copies
+    reports = [
+        replace(r, attributes=dict(r.attributes) if r.attributes else None)
+        for r in reports
+    ]
+
+    global_context_builder = GlobalCommunityContext(
+        community_reports=reports,
+        entities=entities,  # default to None if you don't want to use community weights for ranking
+        token_encoder=get_token_encoder(),
+        cache_context=True,
+    )
+    custom_map_prompt = create_map_system_prompt_with_language(language)
+    custom_reduce_prompt = create_reduce_system_prompt_with_language(language)
+    return GlobalSearch(
+        context_builder=global_context_builder,
+        folder_id=settings.YANDEX_FOLDER_ID,
+        token=settings.YANDEX_TOKEN,
+        token_encoder=get_token_encoder(),
+        max_data_tokens=12_000,
+        map_llm_params=map_llm_params,
+        reduce_llm_params=reduce_llm_params,
+        context_builder_params=context_builder_params,
+        response_type="multiple paragraphs",
+        map_system_prompt=custom_map_prompt,
+        reduce_system_prompt=custom_reduce_prompt,
+        llm=get_llm(),
+    )
+
+
+def engine_memory_usage(engine: GlobalSearch) -> int:
+    """
+    Approximate bytes an engine holds on top of its graph's objects: its own
+    report copies and entity list. Their strings are shared with the graph.
+    """
+    reports = engine.context_builder.community_reports
+    size = sys.getsizeof(reports) + sys.getsizeof(engine.context_builder.entities)
+    for report in reports:
+        size += sys.getsizeof(report) + sys.getsizeof(vars(report))
+        if report.attributes:
+            size += deep_size(report.attributes)
+    return size
+
+
+EngineKey = tuple[str, str | None, frozenset[str] | None]
+
+
+@dataclass
+class ResidentGraph:
+    """Tables and query objects of a loaded graph."""
+
+    data: GraphData
+    objects: GraphObjects
+    size_bytes: int
+    load_seconds: float
+
+
+@dataclass
+class GraphLoadStats:
+    loads: int = 0
+    evictions: int = 0
+
+
+class SearchEngineRegistry:
+    """
+    Lazily loaded graphs plus an LRU of ready-to-use search engines.
+
+    A graph's tables and query objects are loaded on its first prompt. When
+    the loaded graphs and their engines exceed `memory_budget` bytes, the
+    least recently used graphs are evicted together with their engines.
+    """
+
+    def __init__(self, max_engines: int, memory_budget: int | None = None):
+        self.max_engines = max_engines
+        self.memory_budget = memory_budget
+        self._graphs: OrderedDict[str, ResidentGraph] = OrderedDict()
+        self._engines: OrderedDict[EngineKey, GlobalSearch] = OrderedDict()
+        self._engine_bytes: dict[EngineKey, int] = {}
+        self._stats: dict[str, GraphLoadStats] = {}
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+
+    def graph_objects(self, graph: str) -> GraphObjects:
+        graph = canonical_graph(graph)
+        graph_settings = GRAPH_CATALOG.table_settings(graph)
+        signature = graph_tables_signature(graph_settings)
+        with self._lock:
+            resident = self._graphs.get(graph)
+            if resident is not None and resident.objects.signature == signature:
+                self._graphs.move_to_end(graph)
+                return resident.objects
+
+        with self._load_lock:
+            resident = self._graphs.get(graph)
+            if resident is None or resident.objects.signature != signature:
+                logger.info(f'msg="Loading graph objects" {graph=}')
+                start = time.perf_counter()
+                data = read_graph_data(graph_settings)
+                objects = load_graph_objects(data)
+                resident = ResidentGraph(
+                    data=data,
+                    objects=objects,
+                    size_bytes=data.memory_usage() + objects.memory_usage(),
+                    load_seconds=time.perf_counter() - start,
+                )
+                with self._lock:
+                    self._graphs[graph] = resident
+                    self._stats.setdefault(graph, GraphLoadStats()).loads += 1
+                    self._drop_engines(graph)
+                    self._enforce_budget(keep=graph)
+            return resident.objects
+
+    def get(
+        self, graph: str, nodes: list[str] | None, language: str | None = None
+    ) -> GlobalSearch:
+        # also reloads the graph and drops its engines if the tables changed
+        objects = self.graph_objects(graph)
+        graph = canonical_graph(graph)
+        key = (graph, language, frozenset(nodes) if nodes else None)
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is not None:
+                self._engines.move_to_end(key)
+                return engine
+
+        engine = build_search_engine(objects, nodes, language)
+        engine_bytes = engine_memory_usage(engine)
+
+        with self._lock:
+            resident = self._graphs.get(graph)
+            if resident is None or resident.objects is not objects:
+                # the graph was reloaded or evicted while this engine was built
+                return engine
+            self._engines[key] = engine
+            self._engines.move_to_end(key)
+            self._engine_bytes[key] = engine_bytes
+            while len(self._engines) > self.max_engines:
+                self._remove_engine(next(iter(self._engines)))
+            self._enforce_budget(keep=graph)
+        return engine
+
+    def evict(self, graph: str) -> bool:
+        graph = canonical_graph(graph)
+        with self._lock:
+            return self._evict(graph)
+
+    def stats(self) -> dict:
+        with self._lock:
+            resident = {
+                graph: {
+                    "size_bytes": item.size_bytes,
+                    "engine_bytes": self._engines_size(graph),
+                    "load_seconds": round(item.load_seconds, 3),
+                    "engines": sum(1 for key in self._engines if key[0] == graph),
+                }
+                for graph, item in self._graphs.items()
+            }
+            return {
+                "memory_budget_bytes": self.memory_budget,
+                "resident_bytes": sum(map(self._graph_size, self._graphs)),
+                "engines": len(self._engines),
+                "graphs": {
+                    graph: {
+                        "resident": graph in resident,
+                        "loads": item.loads,
+                        "evictions": item.evictions,
+                        **resident.get(graph, {}),
+                    }
+                    for graph, item in self._stats.items()
+                },
+            }
 
-        return result
+    def preload(self, graphs: list[str]) -> None:
+        for graph in graphs:
+            self.graph_objects(graph)
+
+    def _enforce_budget(self, keep: str) -> None:
+        if self.memory_budget is None:
+            return
+        total = sum(map(self._graph_size, self._graphs))
+        for graph in list(self._graphs):
+            if total <= self.memory_budget:
+                break
+            if graph == keep:
+                continue
+            total -= self._graph_size(graph)
+            logger.info(f'msg="Evicting graph over memory budget" {graph=}')
+            self._evict(graph)
+
+    def _evict(self, graph: str) -> bool:
+        if self._graphs.pop(graph, None) is None:
+            return False
+        self._stats.setdefault(graph, GraphLoadStats()).evictions += 1
+        self._drop_engines(graph)
+        return True
+
+    def _graph_size(self, graph: str) -> int:
+        return self._graphs[graph].size_bytes + self._engines_size(graph)
+
+    def _engines_size(self, graph: str) -> int:
+        return sum(size for key, size in self._engine_bytes.items() if key[0] == graph)
+
+    def _remove_engine(self, key: EngineKey) -> None:
+        del self._engines[key]
+        del self._engine_bytes[key]
+
+    def _drop_engines(self, graph: str) -> None:
+        for key in list(self._engines):
+            if key[0] == graph:
+                self._remove_engine(key)
+
+
+SEARCH_ENGINES = SearchEngineRegistry(
+    max_engines=settings.SEARCH_ENGINE_CACHE_SIZE,
+    memory_budget=(
+        settings.GRAPH_MEMORY_BUDGET_MB * 1024 * 1024
+        if settings.GRAPH_MEMORY_BUDGET_MB is not None
+        else None
+    ),
+)
 
-    async def agenerate(self, messages, *args, **kwargs):
-        history = []
-        for prompt in messages:
-            prompt["text"] = prompt.pop("content")
-            response = self.model.run(prompt)
-            result = {
-                "output": response[0].text,
-                "history": [],
-            }
-            history.append(result)
-
-        return history
-
-
-def get_graph_data(
-    graph: str,
-) -> tuple[
-    pd.DataFrame,
-    pd.DataFrame,
-    pd.DataFrame,
-    int,
-    pd.DataFrame,
-    pd.DataFrame,
-    pd.DataFrame,
-]:
-    match graph:
-        case "podcast" | "podcast-en":
-            return (
-                PODCAST_ENTITY_DF,
-                PODCAST_REPORT_DF,
-                PODCAST_ENTITY_EMBEDDING_DF,
-                settings.PODCAST.COMMUNITY_LEVEL,
-                PODCAST_COMMUNITIES_DF,
-                PODCAST_TEXT_UNITS_DF,
-                PODCAST_RP_DF,
-            )
-        case "gazeta":
-            return (
-                GAZETA_ENTITY_DF,
-                GAZETA_REPORT_DF,
-                GAZETA_ENTITY_EMBEDDING_DF,
-                settings.GAZETA.COMMUNITY_LEVEL,
-                GAZETA_COMMUNITIES_DF,
-                GAZETA_TEXT_UNITS_DF,
-                GAZETA_RP_DF,
-            )
-        case _:
-            logger.error('msg="Unknown graph"')
-            raise HTTPException(status_code=404, detail="graph not found")
+
+def warmup() -> None:
+    """Import the query stack, create the clients and load PRELOAD_GRAPHS."""
+    start = time.perf_counter()
+    from graphrag.query.structured_search.global_search.search import (  # noqa: F401
+        GlobalSearch,
+    )
+
+    get_token_encoder()
+    get_llm()
+    SEARCH_ENGINES.preload(settings.PRELOAD_GRAPHS)
+    logger.info(f'msg="Warmup finished" seconds={time.perf_counter() - start:.2f}')
 
 
 def get_search_engine(
     graph: str, nodes: list[str] | None, language: str | None = None
 ) -> GlobalSearch | LocalSearch:
     logger.info('msg="New prompting"')
-    (
-        entity_df,
-        report_df,
-        entity_embedding_df,
-        community_level,
-        communities_df,
-        text_units_df,
-        rp_df,
-    ) = get_graph_data(graph)
-
     if nodes:
         logger.info(f'msg="Nodes selected" {nodes=}')
         # relationships = read_indexer_relationships(rp_df)
@@ -260,83 +611,18 @@ def get_search_engine(
         #     entities=_entities,
         #     relationships=relationships,
         #     entity_text_embeddings=description_embedding_store,
-        #     text_embedder=YandexGPTEmbeddingLLM(),  # type: ignore
-        #     token_encoder=TOKEN_ENCODER,
+        #     text_embedder=get_text_embedder(),
+        #     token_encoder=get_token_encoder(),
         # )
         # custom_system_prompt = create_local_search_prompt_with_language(language)
         # search_engine = LocalSearch(
-        #     llm=YandexGPT(),  # type: ignore
+        #     llm=get_llm(),
         #     context_builder=context_builder,
-        #     token_encoder=TOKEN_ENCODER,
+        #     token_encoder=get_token_encoder(),
         #     llm_params=llm_params,
         #     context_builder_params=local_context_params,
         #     response_type="multiple paragraphs",  # free form text describing the response type and format, can be anything, e.g. prioritized list, single paragraph, multiple paragraphs, multiple-page report
         #     system_prompt=custom_system_prompt,
         # )
 
-        global_reports = read_indexer_reports(
-            report_df,
-            entity_df[entity_df.title.isin(nodes)],  # type: ignore
-            community_level,
-        )
-        global_entities = read_indexer_entities(
-            entity_df[entity_df.title.isin(nodes)],  # type: ignore
-            entity_embedding_df,  # type: ignore
-            community_level,
-        )
-        global_context_builder = GlobalCommunityContext(
-            community_reports=global_reports,
-            entities=global_entities,  # default to None if you don't want to use community weights for ranking
-            token_encoder=TOKEN_ENCODER,
-        )
-        custom_map_prompt = create_map_system_prompt_with_language(language)
-        custom_reduce_prompt = create_reduce_system_prompt_with_language(language)
-        global_search_engine = GlobalSearch(
-            context_builder=global_context_builder,
-            folder_id=settings.YANDEX_FOLDER_ID,
-            token=settings.YANDEX_TOKEN,
-            token_encoder=TOKEN_ENCODER,
-            max_data_tokens=12_000,
-            map_llm_params=map_llm_params,
-            reduce_llm_params=reduce_llm_params,
-            context_builder_params=context_builder_params,
-            response_type="multiple paragraphs",
-            map_system_prompt=custom_map_prompt,
-            reduce_system_prompt=custom_reduce_prompt,
-        )
-
-        return global_search_engine
-
-    else:
-        global_reports = read_indexer_reports(
-            report_df,
-            entity_df,  # type: ignore
-            community_level,
-        )
-        global_entities = read_indexer_entities(
-            entity_df,  # type: ignore
-            entity_embedding_df,  # type: ignore
-            community_level,
-        )
-        global_context_builder = GlobalCommunityContext(
-            community_reports=global_reports,
-            entities=global_entities,  # default to None if you don't want to use community weights for ranking
-            token_encoder=TOKEN_ENCODER,
-        )
-        custom_map_prompt = create_map_system_prompt_with_language(language)
-        custom_reduce_prompt = create_reduce_system_prompt_with_language(language)
-        global_search_engine = GlobalSearch(
-            context_builder=global_context_builder,
-            folder_id=settings.YANDEX_FOLDER_ID,
-            token=settings.YANDEX_TOKEN,
-            token_encoder=TOKEN_ENCODER,
-            max_data_tokens=12_000,
-            map_llm_params=map_llm_params,
-            reduce_llm_params=reduce_llm_params,
-            context_builder_params=context_builder_params,
-            response_type="multiple paragraphs",
-            map_system_prompt=custom_map_prompt,
-            reduce_system_prompt=custom_reduce_prompt,
-        )
-
-        return global_search_engine
+    return SEARCH_ENGINES.get(graph, nodes, language)
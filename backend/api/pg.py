@@ -54,78 +54,82 @@ def get_connection_pool() -> Pool:
     return db.pool
 
 
-async def check_historical_prompt_response(
-    pg: Pool, text: str, nodes: list[str] | None = None
-) -> str | None:
+async def get_cached_prompt_response(pg: Pool, request_hash: str) -> str | None:
     async with pg.acquire() as conn:
-        async with conn.transaction():
-            if not nodes:
-                nodes = []
-
-            rows = await conn.fetch(
-                """
-                SELECT
-                    ph.prompt,
-                    ph.response,
-                    COALESCE(array_agg(psn.node) FILTER (WHERE psn.node IS NOT NULL), '{}') AS nodes
-                FROM prompt_histories ph
-                LEFT JOIN prompt_selected_nodes psn ON psn.prompt_id = ph.id
-                WHERE ph.prompt = $1
-                GROUP BY ph.id
-                ORDER BY ph.id DESC;
-                """,
-                text,
-            )
-
-            for row in rows:
-                row_nodes = row["nodes"]
-                if sorted(row_nodes) == sorted(nodes):
-                    return row["response"]
-
-            return None
+        return await conn.fetchval(
+            """
+            SELECT response
+            FROM prompt_histories
+            WHERE request_hash = $1
+            ORDER BY id DESC
+            LIMIT 1;
+            """,
+            request_hash,
+        )
 
 
 async def save_prompt_response(
-    pg: Pool, prompt: str, response: str, selected_nodes: list[str] | None, graph: str
+    pg: Pool,
+    prompt: str,
+    response: str,
+    selected_nodes: list[str] | None,
+    graph: str,
+    language: str | None = None,
+    request_hash: str | None = None,
 ) -> None:
     async with pg.acquire() as conn:
-        async with conn.transaction():
-            prompt_id = await conn.fetchrow(
-                "INSERT INTO prompt_histories (prompt, response, graph) VALUES ($1, $2, $3) RETURNING id",
-                prompt,
-                response,
-                graph,
+        await conn.execute(
+            """
+            WITH prompt_row AS (
+                INSERT INTO prompt_histories (prompt, response, graph, language, request_hash)
+                VALUES ($1, $2, $3, $4, $5)
+                RETURNING id
             )
-            if prompt_id:
-                prompt_id = prompt_id[0]
-            else:
-                logger.error(
-                    'msg="Smth goes wrong while saving prompt. Prompt_id None"'
-                )
-                return
-
-            if selected_nodes and prompt_id:
-                await conn.executemany(
-                    "INSERT INTO prompt_selected_nodes (prompt_id, node) VALUES ($1, $2)",
-                    [(prompt_id, node) for node in selected_nodes],
-                )
-
-
-async def get_prompts_history(pg: Pool, graph: str) -> list[dict]:
+            INSERT INTO prompt_selected_nodes (prompt_id, node)
+            SELECT prompt_row.id, node
+            FROM prompt_row, unnest($6::text[]) AS node;
+            """,
+            prompt,
+            response,
+            graph,
+            language,
+            request_hash,
+            selected_nodes or [],
+        )
+
+
+async def get_prompts_history(
+    pg: Pool, graph: str, limit: int = 50, before_id: int | None = None
+) -> list[dict]:
+    """Page of prompts for a graph, newest first, starting below `before_id`."""
     async with pg.acquire() as conn:
-        async with conn.transaction():
-            rows = await conn.fetch(
-                """
-                SELECT
-                    ph.prompt,
-                    COALESCE(array_agg(psn.node) FILTER (WHERE psn.node IS NOT NULL), '{}') AS nodes
-                FROM prompt_histories ph
-                LEFT JOIN prompt_selected_nodes psn ON psn.prompt_id = ph.id
-                WHERE ph.graph = $1
-                GROUP BY ph.id
-                ORDER BY ph.id DESC;
-                """,
-                graph,
+        rows = await conn.fetch(
+            """
+            WITH page AS (
+                SELECT id, prompt
+                FROM prompt_histories
+                WHERE graph = $1 AND ($3::int IS NULL OR id < $3)
+                ORDER BY id DESC
+                LIMIT $2
             )
+            SELECT
+                page.id,
+                page.prompt,
+                COALESCE(
+                    (SELECT array_agg(psn.node ORDER BY psn.id)
+                     FROM prompt_selected_nodes psn
+                     WHERE psn.prompt_id = page.id),
+                    '{}'
+                ) AS nodes
+            FROM page
+            ORDER BY page.id DESC;
+            """,
+            graph,
+            limit,
+            before_id,
+        )
 
-            return [{"prompt": row["prompt"], "nodes": row["nodes"]} for row in rows]
+        return [
+            {"id": row["id"], "prompt": row["prompt"], "nodes": row["nodes"]}
+            for row in rows
+        ]
@@ -30,6 +30,26 @@ class Settings(BaseSettings):
     YANDEX_TOKEN: str
     YANDEX_MODEL: str
     YANDEX_MODEL_VERSION: str
+    YANDEX_MAX_WORKERS: int = 16
+    EMBEDDING_CACHE_SIZE: int = 4096
+
+    GRAPHS_DIR: str = "data/graphs"
+    # graphs loaded at startup, the rest load on their first prompt
+    PRELOAD_GRAPHS: list[str] = []
+    # least recently used graphs are evicted above this size, None keeps all
+    GRAPH_MEMORY_BUDGET_MB: int | None = None
+    SEARCH_ENGINE_CACHE_SIZE: int = 64
+    # bearer token for /api/admin, the admin endpoints are disabled without it
+    ADMIN_TOKEN: str | None = None
+    GRAPH_PAYLOAD_CACHE_SIZE: int = 16
+    # viewport zoom below which /api/graph/{id}/viewport returns communities
+    GRAPH_DETAIL_ZOOM: float = 0.5
+    # memory-mapped Arrow copies of the graph tables; None reads parquet directly
+    GRAPH_TABLE_CACHE_DIR: str | None = "data/.arrow"
+    ANSWER_CACHE_SIZE: int = 1024
+    # cosine similarity above which a cached answer is reused for a
+    # differently worded prompt; None disables the embedding lookup
+    ANSWER_CACHE_SIMILARITY_THRESHOLD: float | None = None
 
     PG_HOST: str
     PG_PORT: int = 5432
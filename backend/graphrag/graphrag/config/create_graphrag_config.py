@@ -359,6 +359,11 @@ def create_graphrag_config(
                 storage_account_blob_url=reader.str(Fragment.storage_account_blob_url),
                 container_name=reader.str(Fragment.container_name),
                 base_dir=reader.str(Fragment.base_dir) or defs.CACHE_BASE_DIR,
+                compression_level=reader.int("compression_level")
+                or defs.CACHE_COMPRESSION_LEVEL,
+                batch_size=reader.int("batch_size") or defs.CACHE_BATCH_SIZE,
+                memory_budget_mb=reader.int("memory_budget_mb")
+                or defs.CACHE_MEMORY_BUDGET_MB,
             )
         with (
             reader.envvar_prefix(Section.reporting),
@@ -428,6 +433,8 @@ def create_graphrag_config(
                 entity_types=reader.list("entity_types")
                 or defs.ENTITY_EXTRACTION_ENTITY_TYPES,
                 max_gleanings=max_gleanings,
+                concurrent_documents=reader.int("concurrent_documents")
+                or defs.ENTITY_EXTRACTION_CONCURRENT_DOCUMENTS,
                 prompt=reader.str("prompt", Fragment.prompt_file),
                 strategy=entity_extraction_config.get("strategy"),
                 encoding_model=reader.str(Fragment.encoding_model),
@@ -490,8 +497,13 @@ def create_graphrag_config(
             )
 
         with reader.use(values.get("cluster_graph")):
+            use_lcc = reader.bool("use_lcc")
             cluster_graph_model = ClusterGraphConfig(
-                max_cluster_size=reader.int("max_cluster_size") or defs.MAX_CLUSTER_SIZE
+                max_cluster_size=reader.int("max_cluster_size") or defs.MAX_CLUSTER_SIZE,
+                backend=reader.str("backend") or defs.CLUSTER_GRAPH_BACKEND,
+                num_workers=reader.int("num_workers") or defs.CLUSTER_GRAPH_NUM_WORKERS,
+                use_lcc=defs.CLUSTER_GRAPH_USE_LCC if use_lcc is None else use_lcc,
+                output=reader.str("output") or defs.CLUSTER_GRAPH_OUTPUT,
             )
 
         with (
@@ -45,6 +45,9 @@ EMBEDDING_TARGET = TextEmbeddingTarget.required
 
 CACHE_TYPE = CacheType.file
 CACHE_BASE_DIR = "cache"
+CACHE_COMPRESSION_LEVEL = None
+CACHE_BATCH_SIZE = 256
+CACHE_MEMORY_BUDGET_MB = None
 CHUNK_SIZE = 1200
 CHUNK_OVERLAP = 100
 CHUNK_GROUP_BY_COLUMNS = ["id"]
@@ -54,10 +57,15 @@ CLAIM_DESCRIPTION = (
 CLAIM_MAX_GLEANINGS = 1
 CLAIM_EXTRACTION_ENABLED = False
 MAX_CLUSTER_SIZE = 10
+CLUSTER_GRAPH_BACKEND = "graspologic"
+CLUSTER_GRAPH_NUM_WORKERS = 1
+CLUSTER_GRAPH_USE_LCC = True
+CLUSTER_GRAPH_OUTPUT = "graphs"
 COMMUNITY_REPORT_MAX_LENGTH = 2000
 COMMUNITY_REPORT_MAX_INPUT_LENGTH = 8000
 ENTITY_EXTRACTION_ENTITY_TYPES = ["organization", "person", "geo", "event"]
 ENTITY_EXTRACTION_MAX_GLEANINGS = 1
+ENTITY_EXTRACTION_CONCURRENT_DOCUMENTS = 4
 INPUT_FILE_TYPE = InputFileType.text
 INPUT_TYPE = InputType.file
 INPUT_BASE_DIR = "input"
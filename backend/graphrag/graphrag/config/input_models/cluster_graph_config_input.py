@@ -10,4 +10,8 @@ class ClusterGraphConfigInput(TypedDict):
     """Configuration section for clustering graphs."""
 
     max_cluster_size: NotRequired[int | None]
+    backend: NotRequired[str | None]
+    num_workers: NotRequired[int | None]
+    use_lcc: NotRequired[bool | None]
+    output: NotRequired[str | None]
     strategy: NotRequired[dict | None]
@@ -27,3 +27,15 @@ class CacheConfig(BaseModel):
     storage_account_blob_url: str | None = Field(
         description="The storage account blob url to use.", default=None
     )
+    compression_level: int | None = Field(
+        description="The zstd compression level of sqlite cache entries, None to store them uncompressed.",
+        default=defs.CACHE_COMPRESSION_LEVEL,
+    )
+    memory_budget_mb: int | None = Field(
+        description="The size of the in-memory LRU kept in front of the cache, None for no memory tier.",
+        default=defs.CACHE_MEMORY_BUDGET_MB,
+    )
+    batch_size: int = Field(
+        description="The number of sqlite cache writes committed together.",
+        default=defs.CACHE_BATCH_SIZE,
+    )
@@ -14,6 +14,22 @@ class ClusterGraphConfig(BaseModel):
     max_cluster_size: int = Field(
         description="The maximum cluster size to use.", default=defs.MAX_CLUSTER_SIZE
     )
+    backend: str = Field(
+        description="The Leiden implementation to use: graspologic or leidenalg.",
+        default=defs.CLUSTER_GRAPH_BACKEND,
+    )
+    num_workers: int = Field(
+        description="The number of processes clustering connected components in parallel; 1 clusters the whole graph in-process.",
+        default=defs.CLUSTER_GRAPH_NUM_WORKERS,
+    )
+    use_lcc: bool = Field(
+        description="Whether to cluster only the largest connected component.",
+        default=defs.CLUSTER_GRAPH_USE_LCC,
+    )
+    output: str = Field(
+        description="What the base entity graph holds: graphs, one graph per level, or membership, one graph whose nodes list their community at every level.",
+        default=defs.CLUSTER_GRAPH_OUTPUT,
+    )
     strategy: dict | None = Field(
         description="The cluster strategy to use.", default=None
     )
@@ -22,7 +38,19 @@ class ClusterGraphConfig(BaseModel):
         """Get the resolved cluster strategy."""
         from graphrag.index.operations.cluster_graph import GraphCommunityStrategyType
 
-        return self.strategy or {
+        if self.strategy:
+            return self.strategy
+        if self.num_workers > 1:
+            return {
+                "type": GraphCommunityStrategyType.parallel_leiden,
+                "max_cluster_size": self.max_cluster_size,
+                "backend": self.backend,
+                "num_workers": self.num_workers,
+                "use_lcc": self.use_lcc,
+            }
+        return {
             "type": GraphCommunityStrategyType.leiden,
             "max_cluster_size": self.max_cluster_size,
+            "backend": self.backend,
+            "use_lcc": self.use_lcc,
         }
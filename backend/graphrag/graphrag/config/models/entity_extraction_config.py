@@ -26,6 +26,10 @@ class EntityExtractionConfig(LLMConfig):
         description="The maximum number of entity gleanings to use.",
         default=defs.ENTITY_EXTRACTION_MAX_GLEANINGS,
     )
+    concurrent_documents: int = Field(
+        description="The number of texts of a batch extracted concurrently.",
+        default=defs.ENTITY_EXTRACTION_CONCURRENT_DOCUMENTS,
+    )
     strategy: dict | None = Field(
         description="Override the default entity extraction strategy", default=None
     )
@@ -49,6 +53,7 @@ class EntityExtractionConfig(LLMConfig):
             if self.prompt
             else None,
             "max_gleanings": self.max_gleanings,
+            "concurrent_documents": self.concurrent_documents,
             # It's prechunked in create_base_text_units
             "encoding_name": self.encoding_model or encoding_model,
             "prechunked": True,
@@ -23,6 +23,7 @@ from .config import (
     PipelineNoneCacheConfig,
     PipelineReportingConfig,
     PipelineReportingConfigTypes,
+    PipelineSqliteCacheConfig,
     PipelineStorageConfig,
     PipelineStorageConfigTypes,
     PipelineTextInputConfig,
@@ -62,6 +63,7 @@ __all__ = [
     "PipelineNoneCacheConfig",
     "PipelineReportingConfig",
     "PipelineReportingConfigTypes",
+    "PipelineSqliteCacheConfig",
     "PipelineStorage",
     "PipelineStorageConfig",
     "PipelineStorageConfigTypes",
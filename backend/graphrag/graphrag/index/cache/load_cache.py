@@ -5,12 +5,14 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 from graphrag.config.enums import CacheType
 from graphrag.index.config.cache import (
     PipelineBlobCacheConfig,
     PipelineFileCacheConfig,
+    PipelineSqliteCacheConfig,
 )
 from graphrag.index.storage import BlobPipelineStorage, FilePipelineStorage
 
@@ -22,6 +24,8 @@ if TYPE_CHECKING:
 from .json_pipeline_cache import JsonPipelineCache
 from .memory_pipeline_cache import create_memory_cache
 from .noop_pipeline_cache import NoopPipelineCache
+from .sqlite_pipeline_cache import DEFAULT_CACHE_FILE, SqlitePipelineCache
+from .tiered_pipeline_cache import TieredPipelineCache
 
 
 def load_cache(config: PipelineCacheConfig | None, root_dir: str | None):
@@ -29,6 +33,14 @@ def load_cache(config: PipelineCacheConfig | None, root_dir: str | None):
     if config is None:
         return NoopPipelineCache()
 
+    cache = _load_backend(config, root_dir)
+    if config.memory_budget_mb and config.type != CacheType.none:
+        backend = NoopPipelineCache() if config.type == CacheType.memory else cache
+        return TieredPipelineCache(backend, config.memory_budget_mb * 1024 * 1024)
+    return cache
+
+
+def _load_backend(config: PipelineCacheConfig, root_dir: str | None):
     match config.type:
         case CacheType.none:
             return NoopPipelineCache()
@@ -38,6 +50,13 @@ def load_cache(config: PipelineCacheConfig | None, root_dir: str | None):
             config = cast(PipelineFileCacheConfig, config)
             storage = FilePipelineStorage(root_dir).child(config.base_dir)
             return JsonPipelineCache(storage)
+        case CacheType.sqlite:
+            config = cast(PipelineSqliteCacheConfig, config)
+            return SqlitePipelineCache(
+                str(Path(root_dir or "", config.base_dir or "", DEFAULT_CACHE_FILE)),
+                compression_level=config.compression_level,
+                batch_size=config.batch_size,
+            )
         case CacheType.blob:
             config = cast(PipelineBlobCacheConfig, config)
             storage = BlobPipelineStorage(
@@ -65,3 +65,6 @@ class PipelineCache(metaclass=ABCMeta):
         Args:
             - name - The name to create the sub cache with.
         """
+
+    def flush(self) -> None:
+        """Write buffered entries through; caches that do not buffer have nothing to do."""
@@ -0,0 +1,313 @@
+"""A module containing the 'SqlitePipelineCache' model, a single-file cache."""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from .pipeline_cache import PipelineCache
+
+DEFAULT_CACHE_FILE = "cache.sqlite"
+DEFAULT_BATCH_SIZE = 256
+
+# values are stored with a one byte header telling how the payload is encoded
+_PLAIN = b"j"
+_ZSTD = b"z"
+
+
+class _CacheDatabase:
+    """The SQLite file shared by a cache and all of its children."""
+
+    def __init__(
+        self,
+        path: str,
+        compression_level: int | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.batch_size = max(batch_size, 1)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL
+            ) WITHOUT ROWID;
+            """
+        )
+        self._lock = threading.Lock()
+        # writes not flushed yet, None marks a pending delete
+        self._pending: dict[str, bytes | None] = {}
+        self.compression_level = compression_level
+        # zstd contexts must not be shared between threads, each worker
+        # thread of `asyncio.to_thread` gets its own
+        self._codecs = threading.local()
+        if compression_level is not None:
+            # fail on a missing zstandard here rather than on the first write
+            import zstandard  # noqa: F401
+        atexit.register(self.close)
+
+    def encode(self, data: dict) -> bytes:
+        payload = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        if self.compression_level is None:
+            return _PLAIN + payload
+        compressor = getattr(self._codecs, "compressor", None)
+        if compressor is None:
+            import zstandard
+
+            compressor = self._codecs.compressor = zstandard.ZstdCompressor(
+                level=self.compression_level
+            )
+        return _ZSTD + compressor.compress(payload)
+
+    def decode(self, value: bytes) -> dict | None:
+        header, payload = value[:1], value[1:]
+        if header == _ZSTD:
+            import zstandard
+
+            decompressor = getattr(self._codecs, "decompressor", None)
+            if decompressor is None:
+                decompressor = self._codecs.decompressor = (
+                    zstandard.ZstdDecompressor()
+                )
+            try:
+                payload = decompressor.decompress(payload)
+            except zstandard.ZstdError:
+                return None
+        try:
+            return json.loads(payload.decode("utf-8"))
+        except (UnicodeDecodeError, json.decoder.JSONDecodeError):
+            return None
+
+    def get_many(self, keys: list[str]) -> dict[str, bytes]:
+        found: dict[str, bytes] = {}
+        with self._lock:
+            missing = []
+            for key in keys:
+                if key in self._pending:
+                    value = self._pending[key]
+                    if value is not None:
+                        found[key] = value
+                else:
+                    missing.append(key)
+            # stay below SQLite's default limit of 999 host parameters
+            for start in range(0, len(missing), 900):
+                chunk = missing[start : start + 900]
+                placeholders = ",".join("?" * len(chunk))
+                found.update(
+                    self._connection.execute(
+                        f"SELECT key, value FROM cache WHERE key IN ({placeholders})",  # noqa: S608
+                        chunk,
+                    ).fetchall()
+                )
+        return found
+
+    def put_many(self, items: Iterable[tuple[str, bytes | None]]) -> None:
+        with self._lock:
+            self._pending.update(items)
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+
+    def discard(self, items: Iterable[tuple[str, bytes]]) -> None:
+        """Delete the entries still holding the values they were read with."""
+        with self._lock:
+            for key, value in items:
+                if key in self._pending:
+                    current = self._pending[key]
+                else:
+                    row = self._connection.execute(
+                        "SELECT value FROM cache WHERE key = ?", (key,)
+                    ).fetchone()
+                    current = row[0] if row else None
+                if current == value:
+                    self._pending[key] = None
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            self._flush()
+            if prefix:
+                self._connection.execute(
+                    "DELETE FROM cache WHERE substr(key, 1, ?) = ?",
+                    (len(prefix), prefix),
+                )
+            else:
+                self._connection.execute("DELETE FROM cache")
+            self._connection.commit()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        writes = [(k, v) for k, v in self._pending.items() if v is not None]
+        deletes = [(k,) for k, v in self._pending.items() if v is None]
+        with self._connection:
+            if writes:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)", writes
+                )
+            if deletes:
+                self._connection.executemany("DELETE FROM cache WHERE key = ?", deletes)
+        self._pending.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is None:
+                return
+            self._flush()
+            self._connection.close()
+            self._connection = None
+        atexit.unregister(self.close)
+
+
+class SqlitePipelineCache(PipelineCache):
+    """
+    Pipeline cache kept in a single SQLite file.
+
+    Entries have the same `{"result": ..., **debug_data}` shape as the JSON
+    file cache, optionally zstd-compressed. Child caches share the file and
+    prefix their keys with `<name>/`, like the directories of the file cache.
+    Writes are buffered and committed `batch_size` at a time, and on `flush`
+    or interpreter exit. SQLite and zstd calls run in worker threads, off the
+    event loop. Entries that cannot be decoded count as missing and are
+    deleted.
+    """
+
+    _db: _CacheDatabase
+    _prefix: str
+
+    def __init__(
+        self,
+        path: str,
+        compression_level: int | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        _db: _CacheDatabase | None = None,
+        _prefix: str = "",
+    ):
+        """Init method definition."""
+        self._db = _db or _CacheDatabase(path, compression_level, batch_size)
+        self._prefix = _prefix
+
+    async def get(self, key: str) -> Any:
+        """Get method definition."""
+        return (await self.get_many([key])).get(key)
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get the results stored for several keys with one query."""
+        return await asyncio.to_thread(self._get_many, keys)
+
+    async def set(self, key: str, value: Any, debug_data: dict | None = None) -> None:
+        """Set method definition."""
+        if value is None:
+            return
+        await self.set_many([(key, value, debug_data)])
+
+    async def set_many(self, items: Iterable[tuple[str, Any, dict | None]]) -> None:
+        """Store several `(key, value, debug_data)` entries."""
+        await asyncio.to_thread(self._set_many, list(items))
+
+    async def has(self, key: str) -> bool:
+        """Has method definition."""
+        return key in await self.get_many([key])
+
+    async def delete(self, key: str) -> None:
+        """Delete method definition."""
+        await asyncio.to_thread(self._db.put_many, [(self._prefix + key, None)])
+
+    async def clear(self) -> None:
+        """Clear method definition."""
+        await asyncio.to_thread(self._db.delete_prefix, self._prefix)
+
+    def child(self, name: str) -> SqlitePipelineCache:
+        """Child method definition."""
+        return SqlitePipelineCache(
+            self._db.path, _db=self._db, _prefix=f"{self._prefix}{name}/"
+        )
+
+    def flush(self) -> None:
+        """Commit buffered writes."""
+        self._db.flush()
+
+    def close(self) -> None:
+        """Commit buffered writes and close the file."""
+        self._db.close()
+
+    def _get_many(self, keys: list[str]) -> dict[str, Any]:
+        found = self._db.get_many([self._prefix + key for key in keys])
+        results = {}
+        corrupt = []
+        for key in keys:
+            value = found.get(self._prefix + key)
+            if value is None:
+                continue
+            data = self._db.decode(value)
+            if data is None:
+                corrupt.append((self._prefix + key, value))
+            else:
+                results[key] = data.get("result")
+        if corrupt:
+            # a concurrent set may have replaced the value since it was read
+            self._db.discard(corrupt)
+        return results
+
+    def _set_many(self, items: list[tuple[str, Any, dict | None]]) -> None:
+        self._db.put_many(
+            (
+                self._prefix + key,
+                self._db.encode({"result": value, **(debug_data or {})}),
+            )
+            for key, value, debug_data in items
+            if value is not None
+        )
+
+
+async def migrate_json_cache(
+    cache_dir: str,
+    cache: SqlitePipelineCache,
+    encoding: str = "utf-8",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> tuple[int, int]:
+    """
+    Copy the entries of a JSON file cache directory into `cache`.
+
+    Keys are the paths relative to `cache_dir`, so child caches find the
+    entries their file cache counterparts wrote. Returns the number of
+    entries copied and of unreadable files skipped.
+    """
+    copied = skipped = 0
+    batch: list[tuple[str, Any, dict | None]] = []
+    root = Path(cache_dir)
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = Path(dirpath) / filename
+            try:
+                data = json.loads(path.read_text(encoding=encoding))
+            except (UnicodeDecodeError, json.decoder.JSONDecodeError):
+                skipped += 1
+                continue
+            if not isinstance(data, dict) or data.get("result") is None:
+                skipped += 1
+                continue
+            result = data.pop("result")
+            batch.append((path.relative_to(root).as_posix(), result, data))
+            copied += 1
+            if len(batch) >= batch_size:
+                await cache.set_many(batch)
+                batch = []
+    await cache.set_many(batch)
+    cache.flush()
+    return copied, skipped
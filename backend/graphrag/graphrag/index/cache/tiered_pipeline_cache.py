@@ -0,0 +1,179 @@
+"""A module containing the 'TieredPipelineCache' model, a memory LRU over another cache."""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+from .pipeline_cache import PipelineCache
+
+if TYPE_CHECKING:
+    from datashaper import WorkflowCallbacks
+
+
+@dataclass
+class TieredCacheStats:
+    """Counters of a tiered cache, shared by the cache and its children."""
+
+    memory_hits: int = 0
+    backend_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    memory_bytes: int = 0
+
+
+def _estimate_size(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if isinstance(value, bytes):
+        return len(value)
+    return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+class _MemoryTier:
+    """Byte-bounded LRU of values, keyed by the full child path of the key."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.stats = TieredCacheStats()
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            self._entries.move_to_end(key)
+            self.stats.memory_hits += 1
+            return True, entry[0]
+
+    def put(self, key: str, value: Any) -> None:
+        size = _estimate_size(value)
+        with self._lock:
+            self._remove(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self.stats.memory_bytes += size
+            while self.stats.memory_bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.stats.memory_bytes -= evicted
+                self.stats.evictions += 1
+            self.stats.entries = len(self._entries)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+            self.stats.entries = len(self._entries)
+
+    def discard_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                self._remove(key)
+            self.stats.entries = len(self._entries)
+
+    def count(self, backend_hit: bool) -> None:
+        with self._lock:
+            if backend_hit:
+                self.stats.backend_hits += 1
+            else:
+                self.stats.misses += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.stats.memory_bytes -= entry[1]
+
+
+class TieredPipelineCache(PipelineCache):
+    """
+    Pipeline cache with a bounded in-memory LRU in front of another cache.
+
+    Reads are served from memory when possible and fall back to `backend`,
+    whose hits are then kept in memory. Writes go to both tiers. The memory
+    tier holds at most `max_bytes` of values (as measured by their UTF-8 /
+    JSON size) across the cache and all of its children.
+    """
+
+    _backend: PipelineCache
+    _memory: _MemoryTier
+    _prefix: str
+
+    def __init__(
+        self,
+        backend: PipelineCache,
+        max_bytes: int,
+        _memory: _MemoryTier | None = None,
+        _prefix: str = "",
+    ):
+        """Init method definition."""
+        self._backend = backend
+        self._memory = _memory or _MemoryTier(max_bytes)
+        self._prefix = _prefix
+
+    @property
+    def stats(self) -> TieredCacheStats:
+        """Hit, miss and eviction counters of the whole cache tree."""
+        return self._memory.stats
+
+    async def get(self, key: str) -> Any:
+        """Get method definition."""
+        found, value = self._memory.get(self._prefix + key)
+        if found:
+            return value
+        value = await self._backend.get(key)
+        self._memory.count(backend_hit=value is not None)
+        if value is not None:
+            self._memory.put(self._prefix + key, value)
+        return value
+
+    async def set(self, key: str, value: Any, debug_data: dict | None = None) -> None:
+        """Set method definition."""
+        if value is None:
+            return
+        await self._backend.set(key, value, debug_data)
+        self._memory.put(self._prefix + key, value)
+
+    async def has(self, key: str) -> bool:
+        """Has method definition."""
+        found, _ = self._memory.get(self._prefix + key)
+        return found or await self._backend.has(key)
+
+    async def delete(self, key: str) -> None:
+        """Delete method definition."""
+        self._memory.discard(self._prefix + key)
+        await self._backend.delete(key)
+
+    async def clear(self) -> None:
+        """Clear method definition."""
+        self._memory.discard_prefix(self._prefix)
+        await self._backend.clear()
+
+    def child(self, name: str) -> TieredPipelineCache:
+        """Child method definition."""
+        return TieredPipelineCache(
+            self._backend.child(name),
+            self._memory.max_bytes,
+            _memory=self._memory,
+            _prefix=f"{self._prefix}{name}/",
+        )
+
+    def flush(self) -> None:
+        """Flush the backend, the memory tier holds nothing it lacks."""
+        self._backend.flush()
+
+    def report(self, callbacks: WorkflowCallbacks, workflow: str | None = None) -> None:
+        """Log the counters through the workflow callbacks."""
+        stats = asdict(self.stats)
+        lookups = stats["memory_hits"] + stats["backend_hits"] + stats["misses"]
+        hit_rate = (stats["memory_hits"] + stats["backend_hits"]) / max(lookups, 1)
+        callbacks.on_log(
+            f"Cache: {lookups} lookups, {hit_rate:.1%} hits "
+            f"({stats['memory_hits']} from memory), {stats['evictions']} evictions",
+            details={"workflow": workflow, **stats},
+        )
@@ -10,6 +10,7 @@ from .cache import (
     PipelineFileCacheConfig,
     PipelineMemoryCacheConfig,
     PipelineNoneCacheConfig,
+    PipelineSqliteCacheConfig,
 )
 from .input import (
     PipelineCSVInputConfig,
@@ -60,6 +61,7 @@ __all__ = [
     "PipelineNoneCacheConfig",
     "PipelineReportingConfig",
     "PipelineReportingConfigTypes",
+    "PipelineSqliteCacheConfig",
     "PipelineStorageConfig",
     "PipelineStorageConfigTypes",
     "PipelineTextInputConfig",
@@ -20,6 +20,12 @@ class PipelineCacheConfig(BaseModel, Generic[T]):
 
     type: T
 
+    memory_budget_mb: int | None = pydantic_Field(
+        description="The size of the in-memory LRU kept in front of the cache.",
+        default=None,
+    )
+    """The size of the in-memory LRU kept in front of the cache, None for no memory tier."""
+
 
 class PipelineFileCacheConfig(PipelineCacheConfig[Literal[CacheType.file]]):
     """Represent the file cache configuration for the pipeline."""
@@ -74,9 +80,32 @@ class PipelineBlobCacheConfig(PipelineCacheConfig[Literal[CacheType.blob]]):
     """The storage account blob url for cache"""
 
 
+class PipelineSqliteCacheConfig(PipelineCacheConfig[Literal[CacheType.sqlite]]):
+    """Represent the single-file SQLite cache configuration for the pipeline."""
+
+    type: Literal[CacheType.sqlite] = CacheType.sqlite
+    """The type of cache."""
+
+    base_dir: str | None = pydantic_Field(
+        description="The base directory for the cache.", default=None
+    )
+    """The base directory for the cache."""
+
+    compression_level: int | None = pydantic_Field(
+        description="The zstd compression level of cache entries.", default=None
+    )
+    """The zstd compression level of cache entries, None to store them uncompressed."""
+
+    batch_size: int = pydantic_Field(
+        description="The number of writes committed together.", default=256
+    )
+    """The number of writes committed together."""
+
+
 PipelineCacheConfigTypes = (
     PipelineFileCacheConfig
     | PipelineMemoryCacheConfig
     | PipelineBlobCacheConfig
     | PipelineNoneCacheConfig
+    | PipelineSqliteCacheConfig
 )
@@ -24,6 +24,7 @@ from graphrag.index.config.cache import (
     PipelineFileCacheConfig,
     PipelineMemoryCacheConfig,
     PipelineNoneCacheConfig,
+    PipelineSqliteCacheConfig,
 )
 from graphrag.index.config.input import (
     PipelineCSVInputConfig,
@@ -300,7 +301,8 @@ def _graph_workflows(
                 "graphml_snapshot": settings.snapshots.graphml,
                 "embed_graph_enabled": settings.embed_graph.enabled,
                 "cluster_graph": {
-                    "strategy": settings.cluster_graph.resolved_strategy()
+                    "strategy": settings.cluster_graph.resolved_strategy(),
+                    "output": settings.cluster_graph.output,
                 },
                 "embed_graph": {"strategy": settings.embed_graph.resolved_strategy()},
             },
@@ -532,6 +534,15 @@ def _get_cache_config(
     settings: GraphRagConfig,
 ) -> PipelineCacheConfigTypes:
     """Get the cache type from the settings."""
+    config = _get_cache_backend_config(settings)
+    config.memory_budget_mb = settings.cache.memory_budget_mb
+    return config
+
+
+def _get_cache_backend_config(
+    settings: GraphRagConfig,
+) -> PipelineCacheConfigTypes:
+    """Get the config of the cache behind the optional memory tier."""
     match settings.cache.type:
         case CacheType.memory:
             return PipelineMemoryCacheConfig()
@@ -540,6 +551,13 @@ def _get_cache_config(
             return PipelineFileCacheConfig(base_dir=settings.cache.base_dir)
         case CacheType.none:
             return PipelineNoneCacheConfig()
+        case CacheType.sqlite:
+            # relative to root dir
+            return PipelineSqliteCacheConfig(
+                base_dir=settings.cache.base_dir,
+                compression_level=settings.cache.compression_level,
+                batch_size=settings.cache.batch_size,
+            )
         case CacheType.blob:
             connection_string = settings.cache.connection_string
             storage_account_blob_url = settings.cache.storage_account_blob_url
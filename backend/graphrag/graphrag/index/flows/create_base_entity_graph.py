@@ -23,8 +23,14 @@ async def create_base_entity_graph(
     clustering_strategy: dict[str, Any],
     embedding_strategy: dict[str, Any] | None,
     graphml_snapshot_enabled: bool = False,
+    clustering_output: str = "graphs",
 ) -> pd.DataFrame:
-    """All the steps to create the base entity graph."""
+    """
+    All the steps to create the base entity graph.
+
+    With `clustering_output="membership"` the table has one row per input
+    graph instead of one per level, and its `level` column lists the levels.
+    """
     clustered = cluster_graph(
         entities,
         callbacks,
@@ -32,6 +38,7 @@ async def create_base_entity_graph(
         strategy=clustering_strategy,
         to="clustered_graph",
         level_to="level",
+        output=clustering_output,
     )
 
     if graphml_snapshot_enabled:
@@ -40,7 +47,7 @@ async def create_base_entity_graph(
             column="clustered_graph",
             base_name="clustered_graph",
             storage=storage,
-            formats=[{"format": "text", "extension": "graphml"}],
+            formats=[{"format": "graphml", "extension": "graphml"}],
         )
 
     if embedding_strategy:
@@ -59,7 +66,7 @@ async def create_base_entity_graph(
             column="entity_graph",
             base_name="embedded_graph",
             storage=storage,
-            formats=[{"format": "text", "extension": "graphml"}],
+            formats=[{"format": "graphml", "extension": "graphml"}],
         )
 
     final_columns = ["level", "clustered_graph"]
@@ -73,7 +73,7 @@ async def create_base_extracted_entities(
             base_name="merged_graph",
             column="entity_graph",
             storage=storage,
-            formats=[{"format": "text", "extension": "graphml"}],
+            formats=[{"format": "graphml", "extension": "graphml"}],
         )
 
     return merged_graph
@@ -8,6 +8,7 @@ from datashaper import (
     VerbCallbacks,
 )
 
+from graphrag.index.operations.cluster_graph import ensure_cluster_levels
 from graphrag.index.operations.unpack_graph import unpack_graph
 
 
@@ -16,6 +17,9 @@ def create_final_communities(
     callbacks: VerbCallbacks,
 ) -> pd.DataFrame:
     """All the steps to transform final communities."""
+    entity_graph = ensure_cluster_levels(
+        entity_graph, callbacks, column="clustered_graph", level_to="level"
+    )
     graph_nodes = unpack_graph(entity_graph, callbacks, "clustered_graph", "nodes")
     graph_edges = unpack_graph(entity_graph, callbacks, "clustered_graph", "edges")
 
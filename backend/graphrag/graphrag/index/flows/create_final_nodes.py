@@ -10,6 +10,7 @@ from datashaper import (
     VerbCallbacks,
 )
 
+from graphrag.index.operations.cluster_graph import ensure_cluster_levels
 from graphrag.index.operations.layout_graph import layout_graph
 from graphrag.index.operations.snapshot import snapshot
 from graphrag.index.operations.unpack_graph import unpack_graph
@@ -25,6 +26,9 @@ async def create_final_nodes(
     snapshot_top_level_nodes: bool = False,
 ) -> pd.DataFrame:
     """All the steps to transform final nodes."""
+    entity_graph = ensure_cluster_levels(
+        entity_graph, callbacks, column="clustered_graph", level_to="level"
+    )
     laid_out_entity_graph = cast(
         pd.DataFrame,
         layout_graph(
@@ -11,6 +11,7 @@ from datashaper import (
 )
 
 from graphrag.index.cache import PipelineCache
+from graphrag.index.operations.cluster_graph import ensure_cluster_levels
 from graphrag.index.operations.compute_edge_combined_degree import (
     compute_edge_combined_degree,
 )
@@ -26,6 +27,9 @@ async def create_final_relationships(
     description_text_embed: dict | None = None,
 ) -> pd.DataFrame:
     """All the steps to transform final relationships."""
+    entity_graph = ensure_cluster_levels(
+        entity_graph, callbacks, column="clustered_graph", level_to="level"
+    )
     graph_edges = unpack_graph(entity_graph, callbacks, "clustered_graph", "edges")
 
     graph_edges.rename(columns={"source_id": "text_unit_ids"}, inplace=True)
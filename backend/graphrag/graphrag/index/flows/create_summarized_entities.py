@@ -44,7 +44,7 @@ async def create_summarized_entities(
             column="entity_graph",
             base_name="summarized_graph",
             storage=storage,
-            formats=[{"format": "text", "extension": "graphml"}],
+            formats=[{"format": "graphml", "extension": "graphml"}],
         )
 
     return summarized
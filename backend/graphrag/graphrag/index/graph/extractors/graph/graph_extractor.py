@@ -3,6 +3,7 @@
 
 """A module containing 'GraphExtractionResult' and 'GraphExtractor' models."""
 
+import asyncio
 import logging
 import re
 import traceback
@@ -69,6 +70,7 @@ class GraphExtractor:
     _summarization_prompt: str
     _loop_args: dict[str, Any]
     _max_gleanings: int
+    _concurrent_documents: int
     _on_error: ErrorHandlerFn
 
     def __init__(
@@ -84,6 +86,8 @@ class GraphExtractor:
         join_descriptions=True,
         encoding_model: str | None = None,
         max_gleanings: int | None = None,
+        concurrent_documents: int | None = None,
+        loop_args: dict[str, Any] | None = None,
         on_error: ErrorHandlerFn | None = None,
     ):
         """Init method definition."""
@@ -103,9 +107,15 @@ class GraphExtractor:
             if max_gleanings is not None
             else defs.ENTITY_EXTRACTION_MAX_GLEANINGS
         )
+        self._concurrent_documents = max(
+            concurrent_documents or defs.ENTITY_EXTRACTION_CONCURRENT_DOCUMENTS, 1
+        )
         self._on_error = on_error or (lambda _e, _s, _d: None)
 
         # Construct the looping arguments
+        if loop_args is not None:
+            self._loop_args = loop_args
+            return
 
         # encoding = tiktoken.get_encoding(encoding_model or "cl100k_base")
         # yes = encoding.encode("YES")
@@ -142,22 +152,36 @@ class GraphExtractor:
             ),
         }
 
-        for doc_index, text in enumerate(texts):
-            try:
-                # Invoke the entity extraction
-                result = await self._process_document(text, prompt_variables)
+        # Documents are extracted concurrently, each one still runs its
+        # gleaning calls in order. The LLM's own limiter bounds the requests
+        # in flight across extractors, this bounds the documents of one batch.
+        semaphore = asyncio.Semaphore(self._concurrent_documents)
+
+        async def extract(doc_index: int, text: str) -> str | None:
+            async with semaphore:
+                try:
+                    # Invoke the entity extraction
+                    return await self._process_document(text, prompt_variables)
+                except Exception as e:
+                    logging.exception("error extracting graph")
+                    self._on_error(
+                        e,
+                        traceback.format_exc(),
+                        {
+                            "doc_index": doc_index,
+                            "text": text,
+                        },
+                    )
+                    return None
+
+        results = await asyncio.gather(*(
+            extract(doc_index, text) for doc_index, text in enumerate(texts)
+        ))
+        # records are merged in document order, whatever order they finished in
+        for doc_index, (text, result) in enumerate(zip(texts, results, strict=True)):
+            if result is not None:
                 source_doc_map[doc_index] = text
                 all_records[doc_index] = result
-            except Exception as e:
-                logging.exception("error extracting graph")
-                self._on_error(
-                    e,
-                    traceback.format_exc(),
-                    {
-                        "doc_index": doc_index,
-                        "text": text,
-                    },
-                )
 
         output = await self._process_results(
             all_records,
@@ -212,7 +236,7 @@ class GraphExtractor:
 
             response = await self._llm(
                 LOOP_PROMPT,
-                self._loop_args,
+                **self._loop_args,
             )
 
             # response = await self._llm(
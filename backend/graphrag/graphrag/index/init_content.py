@@ -121,6 +121,10 @@ community_reports:
 
 cluster_graph:
   max_cluster_size: {defs.MAX_CLUSTER_SIZE}
+  # backend: {defs.CLUSTER_GRAPH_BACKEND} # or leidenalg
+  # num_workers: {defs.CLUSTER_GRAPH_NUM_WORKERS} # > 1 clusters connected components in a process pool
+  # use_lcc: {str(defs.CLUSTER_GRAPH_USE_LCC).lower()} # false clusters every connected component, not only the largest
+  # output: {defs.CLUSTER_GRAPH_OUTPUT} # or membership, one graph per row instead of one per level
 
 embed_graph:
   enabled: false # if true, will generate node2vec embeddings for nodes
@@ -14,6 +14,7 @@ from typing import Any, TYPE_CHECKING
 
 import requests
 
+import graphrag.config.defaults as defs
 from graphrag.config.enums import LLMType
 from graphrag.llm import (
     CompletionLLM,
@@ -21,6 +22,7 @@ from graphrag.llm import (
     LLMCache,
     LLMLimiter,
 )
+from graphrag.llm.base._create_cache_key import create_hash_key
 
 import os
 
@@ -49,6 +51,10 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# the model documents are embedded with
+EMBEDDING_MODEL = "text-search-doc"
+EMBEDDING_MODEL_VERSION = "latest"
+
 _semaphores: dict[str, asyncio.Semaphore] = {}
 _rate_limiters: dict[str, LLMLimiter] = {}
 
@@ -96,7 +102,22 @@ def _load_yandex_completion_llm(
 
     model = sdk.models.completions(model_name, model_version=model_version)
 
-    return YandexGPTLLM(model, on_error=on_error, cache=cache)
+    return YandexGPTLLM(
+        model,
+        on_error=on_error,
+        cache=cache,
+        semaphore=_get_semaphore(
+            "yandex_completion",
+            config.get("concurrent_requests", defs.LLM_CONCURRENT_REQUESTS),
+        ),
+    )
+
+
+def _get_semaphore(name: str, concurrent_requests: int) -> asyncio.Semaphore:
+    """The limiter shared by every LLM of this name in the process."""
+    if name not in _semaphores:
+        _semaphores[name] = asyncio.Semaphore(concurrent_requests)
+    return _semaphores[name]
 
 
 def load_llm_embeddings(
@@ -119,6 +140,8 @@ def load_llm_embeddings(
         EmbeddingLLM: Объект для работы с эмбеддингами.
     """
     on_error = _create_error_handler(callbacks)
+    if cache:
+        cache = cache.child(name)
     sdk = YCloudML(folder_id=folder_id, auth=token)
     model = sdk.models.completions(model_name)
 
@@ -138,12 +161,13 @@ loaders = {
 
 
 class YandexGPTLLM(CompletionLLM):
-    def __init__(self, model, on_error, cache):
+    def __init__(self, model, on_error, cache, semaphore=None):
         self.model = model
         # self.max_tokens = max_tokens
         # self.temperature = temperature
         self.on_error = on_error
         self.cache = cache
+        self.semaphore = semaphore or asyncio.Semaphore(defs.LLM_CONCURRENT_REQUESTS)
 
     async def __call__(self, prompt: str, **kwargs) -> dict:
         """
@@ -158,6 +182,23 @@ class YandexGPTLLM(CompletionLLM):
             dict: Ответ модели.
         """
         try:
+            # the answer depends on the model, the prompt and these two
+            # settings, like the keys of CachingLLM
+            parameters = {
+                "model": model_name,
+                "model_version": model_version,
+                **{
+                    key: kwargs[key]
+                    for key in ("temperature", "max_tokens")
+                    if key in kwargs
+                },
+            }
+            cache_key = create_hash_key("yandex-chat", prompt, parameters, None)
+            if self.cache is not None:
+                cached = await self.cache.get(cache_key)
+                if cached is not None:
+                    return {"output": cached, "history": []}
+
             sdk = YCloudML(folder_id=folder_id, auth=token)
 
             new_model = sdk.models.completions(model_name)
@@ -166,15 +207,21 @@ class YandexGPTLLM(CompletionLLM):
             if "max_tokens" in kwargs:
                 new_model = new_model.configure(max_tokens=kwargs["max_tokens"])
 
-            response = new_model.run(prompt)
+            # the SDK call blocks, run it off the event loop so that
+            # concurrent extractions overlap
+            async with self.semaphore:
+                response = await asyncio.to_thread(new_model.run, prompt)
             result = {
                 "output": response[0].text,
                 "history": [],
             }
 
-            # Сохраняем в кэш
-            # if self.cache:
-            #     self.cache.set(cache_key, result)
+            if self.cache is not None:
+                await self.cache.set(
+                    cache_key,
+                    result["output"],
+                    {"input": prompt, "parameters": parameters},
+                )
 
             return result
         except Exception as e:
@@ -199,15 +246,7 @@ class YandexGPTEmbeddingLLM(EmbeddingLLM):
             list[float]: Эмбеддинги текста.
         """
         try:
-            # Кэширование запросов
-            # cache_key = f"embedding-{text}"
-            # if self.cache and cache_key in self.cache:
-            #     return self.cache.get(cache_key)
-
-            # if cache is not None:
-            #     cache = cache.child(name)
-
-            doc_uri = f"emb://{folder_id}/text-search-doc/latest"
+            doc_uri = f"emb://{folder_id}/{EMBEDDING_MODEL}/{EMBEDDING_MODEL_VERSION}"
             query_uri = f"emb://{folder_id}/text-search-query/latest"
 
             embed_url = (
@@ -241,10 +280,26 @@ class YandexGPTEmbeddingLLM(EmbeddingLLM):
 
                     return res["embedding"]
 
-            embeddings = [get_embedding(t) for t in text]
-
-            # if self.cache:
-            #     self.cache.set(cache_key, embeddings)
+            # cached per text, so a batch that differs by one text reuses the rest
+            embeddings = []
+            for t in text:
+                cache_key = create_hash_key(
+                    "yandex-embedding",
+                    t,
+                    {
+                        "model": EMBEDDING_MODEL,
+                        "model_version": EMBEDDING_MODEL_VERSION,
+                    },
+                    None,
+                )
+                embedding = (
+                    await self.cache.get(cache_key) if self.cache is not None else None
+                )
+                if embedding is None:
+                    embedding = get_embedding(t)
+                    if self.cache is not None:
+                        await self.cache.set(cache_key, embedding, {"input": t})
+                embeddings.append(embedding)
 
             return embeddings
 
@@ -0,0 +1,291 @@
+"""Hierarchical Leiden over the connected components of a graph, with pluggable backends."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+
+import networkx as nx
+
+log = logging.getLogger(__name__)
+
+# (source, target, weight) with source < target, in sorted order
+Edges = list[tuple[str, str, float]]
+# (level, local cluster id, node); ids are unique across the levels of a component
+Hierarchy = list[tuple[int, int, str]]
+
+# components with fewer edges than this are batched into one worker task
+_TASK_EDGES = 20_000
+_SLOWEST_REPORTED = 5
+
+
+class LeidenBackend(str, Enum):
+    """Implementations of hierarchical Leiden clustering."""
+
+    graspologic = "graspologic"
+    leidenalg = "leidenalg"
+
+    def __repr__(self):
+        """Get a string representation."""
+        return f'"{self.value}"'
+
+
+def leidenalg_seed(seed: int) -> int:
+    """
+    A seed leidenalg accepts, derived from `seed`.
+
+    leidenalg takes a C int, so larger seeds, like the 0xDEADBEEF clustering
+    defaults to, raise OverflowError; they are folded into 0..2**31 - 1.
+    """
+    return seed & 0x7FFFFFFF
+
+
+def connected_components(
+    graph: nx.Graph, use_lcc: bool = False
+) -> list[tuple[list[str], Edges]]:
+    """
+    Split a graph into its (weakly) connected components.
+
+    Components come largest first, ties broken by their smallest node, with
+    their nodes and edges sorted so that the same graph always clusters the
+    same way. With `use_lcc` only the largest component is returned.
+    """
+    components = (
+        nx.weakly_connected_components(graph)
+        if graph.is_directed()
+        else nx.connected_components(graph)
+    )
+    node_sets = sorted(
+        (sorted(component) for component in components),
+        key=lambda nodes: (-len(nodes), nodes[0]),
+    )
+    if use_lcc:
+        node_sets = node_sets[:1]
+    component_of = {
+        node: index for index, nodes in enumerate(node_sets) for node in nodes
+    }
+    edges: list[Edges] = [[] for _ in node_sets]
+    for source, target, weight in graph.edges(data="weight", default=1.0):
+        index = component_of.get(source)
+        if index is None or source == target:
+            continue
+        if source > target:
+            source, target = target, source
+        edges[index].append((source, target, float(weight)))
+    return [
+        (nodes, sorted(component_edges))
+        for nodes, component_edges in zip(node_sets, edges, strict=True)
+    ]
+
+
+def cluster_component(
+    nodes: list[str],
+    edges: Edges,
+    backend: LeidenBackend | str,
+    max_cluster_size: int,
+    seed: int,
+    resolution: float = 1.0,
+) -> Hierarchy:
+    """
+    Hierarchical Leiden over one connected component.
+
+    Level 0 partitions the whole component; every cluster larger than
+    `max_cluster_size` is partitioned again on the next level, like
+    graspologic's `hierarchical_leiden` does.
+    """
+    if not edges:
+        return [(0, 0, node) for node in nodes]
+    match backend:
+        case LeidenBackend.graspologic:
+            return _cluster_graspologic(edges, max_cluster_size, seed, resolution)
+        case LeidenBackend.leidenalg:
+            return _cluster_leidenalg(nodes, edges, max_cluster_size, seed, resolution)
+        case _:
+            msg = f"Unknown leiden backend {backend}"
+            raise ValueError(msg)
+
+
+def _cluster_graspologic(
+    edges: Edges, max_cluster_size: int, seed: int, resolution: float
+) -> Hierarchy:
+    from graspologic.partition import hierarchical_leiden
+
+    graph = nx.Graph()
+    graph.add_weighted_edges_from(edges)
+    return [
+        (partition.level, partition.cluster, partition.node)
+        for partition in hierarchical_leiden(
+            graph,
+            max_cluster_size=max_cluster_size,
+            resolution=resolution,
+            random_seed=seed,
+        )
+    ]
+
+
+def _cluster_leidenalg(
+    nodes: list[str],
+    edges: Edges,
+    max_cluster_size: int,
+    seed: int,
+    resolution: float,
+) -> Hierarchy:
+    import igraph as ig
+    import leidenalg
+
+    index = {node: i for i, node in enumerate(nodes)}
+    graph = ig.Graph(
+        n=len(nodes), edges=[(index[source], index[target]) for source, target, _ in edges]
+    )
+    graph.es["weight"] = [weight for _, _, weight in edges]
+
+    hierarchy: Hierarchy = []
+    next_id = 0
+    # (level, subgraph, component vertex id of each subgraph vertex) still to partition
+    pending = deque([(0, graph, list(range(len(nodes))))])
+    while pending:
+        level, subgraph, vertices = pending.popleft()
+        partition = leidenalg.find_partition(
+            subgraph,
+            leidenalg.RBConfigurationVertexPartition,
+            weights="weight",
+            resolution_parameter=resolution,
+            n_iterations=2,
+            seed=leidenalg_seed(seed),
+        )
+        for cluster in partition:
+            cluster_id = next_id
+            next_id += 1
+            hierarchy.extend((level, cluster_id, nodes[vertices[v]]) for v in cluster)
+            # a cluster Leiden did not split is final, whatever its size
+            if len(cluster) > max_cluster_size and len(partition) > 1:
+                pending.append((
+                    level + 1,
+                    subgraph.induced_subgraph(cluster),
+                    [vertices[v] for v in cluster],
+                ))
+    return hierarchy
+
+
+def _cluster_task(
+    components: list[tuple[int, list[str], Edges]],
+    backend: str,
+    max_cluster_size: int,
+    seed: int,
+    resolution: float,
+) -> list[tuple[int, Hierarchy, float]]:
+    results = []
+    for index, nodes, edges in components:
+        start = time.perf_counter()
+        hierarchy = cluster_component(
+            nodes, edges, backend, max_cluster_size, seed, resolution
+        )
+        results.append((index, hierarchy, time.perf_counter() - start))
+    return results
+
+
+def _tasks(
+    components: list[tuple[list[str], Edges]],
+) -> list[list[tuple[int, list[str], Edges]]]:
+    """Group the components into worker tasks of roughly `_TASK_EDGES` edges."""
+    tasks: list[list[tuple[int, list[str], Edges]]] = []
+    current: list[tuple[int, list[str], Edges]] = []
+    current_edges = 0
+    for index, (nodes, edges) in enumerate(components):
+        current.append((index, nodes, edges))
+        current_edges += len(edges)
+        if current_edges >= _TASK_EDGES:
+            tasks.append(current)
+            current, current_edges = [], 0
+    if current:
+        tasks.append(current)
+    return tasks
+
+
+def compute_component_communities(
+    graph: nx.Graph,
+    max_cluster_size: int,
+    use_lcc: bool = False,
+    seed: int = 0xDEADBEEF,
+    backend: LeidenBackend | str = LeidenBackend.graspologic,
+    num_workers: int = 1,
+    resolution: float = 1.0,
+) -> dict[int, dict[str, int]]:
+    """
+    Cluster every connected component of a graph, `num_workers` processes at a time.
+
+    Returns the community of every node at every level it was clustered at,
+    in the shape of `_compute_leiden_communities`. Community ids are unique
+    across components and levels. The time spent on each component is
+    logged, the slowest ones at info level.
+    """
+    backend = LeidenBackend(backend)
+    components = connected_components(graph, use_lcc=use_lcc)
+    tasks = _tasks(components)
+    start = time.perf_counter()
+    if num_workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(num_workers, len(tasks))) as pool:
+            futures = [
+                pool.submit(
+                    _cluster_task, task, backend, max_cluster_size, seed, resolution
+                )
+                for task in tasks
+            ]
+            results = [result for future in futures for result in future.result()]
+    else:
+        results = [
+            result
+            for task in tasks
+            for result in _cluster_task(
+                task, backend, max_cluster_size, seed, resolution
+            )
+        ]
+    elapsed = time.perf_counter() - start
+
+    results.sort(key=lambda result: result[0])
+    communities: dict[int, dict[str, int]] = defaultdict(dict)
+    next_id = 0
+    for _, hierarchy, _ in results:
+        global_ids: dict[int, int] = {}
+        for level, cluster, node in hierarchy:
+            if cluster not in global_ids:
+                global_ids[cluster] = next_id
+                next_id += 1
+            communities[level][node] = global_ids[cluster]
+
+    _report_timings(components, results, backend, num_workers, elapsed)
+    return dict(sorted(communities.items()))
+
+
+def _report_timings(
+    components: list[tuple[list[str], Edges]],
+    results: list[tuple[int, Hierarchy, float]],
+    backend: LeidenBackend,
+    num_workers: int,
+    elapsed: float,
+) -> None:
+    for index, _, seconds in results:
+        nodes, edges = components[index]
+        log.debug(
+            "Component %d: %d nodes, %d edges clustered in %.3fs",
+            index,
+            len(nodes),
+            len(edges),
+            seconds,
+        )
+    slowest = sorted(results, key=lambda result: -result[2])[:_SLOWEST_REPORTED]
+    log.info(
+        "Clustered %d components with %s on %d workers in %.2fs; slowest: %s",
+        len(components),
+        backend.value,
+        num_workers,
+        elapsed,
+        ", ".join(
+            f"#{index} ({len(components[index][0])} nodes) {seconds:.2f}s"
+            for index, _, seconds in slowest
+        ),
+    )
+
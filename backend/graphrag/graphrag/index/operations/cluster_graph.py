@@ -4,6 +4,8 @@
 """A module containing cluster_graph, apply_clustering and run_layout methods definition."""
 
 import logging
+import os
+from collections.abc import Iterable
 from enum import Enum
 from random import Random
 from typing import Any, cast
@@ -13,7 +15,11 @@ from datashaper import VerbCallbacks, progress_iterable
 from graspologic.partition import hierarchical_leiden, modularity
 import bayanpy
 from graphrag.index.graph.utils import stable_largest_connected_component
-from graphrag.index.utils import gen_uuid, load_graph
+from graphrag.index.operations.cluster_components import (
+    LeidenBackend,
+    compute_component_communities,
+)
+from graphrag.index.utils import dump_graph, dump_graph_items, gen_uuid, load_graph
 
 Communities = list[tuple[int, str, list[str]]]
 
@@ -22,6 +28,7 @@ class GraphCommunityStrategyType(str, Enum):
     """GraphCommunityStrategyType class definition."""
 
     leiden = "leiden"
+    parallel_leiden = "parallel_leiden"
 
     def __repr__(self):
         """Get a string representation."""
@@ -38,44 +45,98 @@ def cluster_graph(
     column: str,
     to: str,
     level_to: str | None = None,
+    output: str = "graphs",
 ) -> pd.DataFrame:
-    """Apply a hierarchical clustering algorithm to a graph."""
-    results = input[column].apply(lambda graph: run_layout(strategy, graph))
-
-    community_map_to = "communities"
-    input[community_map_to] = results
-
+    """
+    Apply a hierarchical clustering algorithm to a graph.
+
+    Every graph is parsed, and its degrees and ids computed, once. With
+    `output="graphs"` each row is then exploded into one row per community
+    level, holding the graph with the `cluster` and `level` of that level.
+    With `output="membership"` each row keeps a single graph whose nodes
+    carry a `clusters` list, their community at each of the levels in
+    `level_to`; `expand_cluster_levels` or `materialize_level` build the
+    per-level graphs from it when they are needed.
+    """
+    if output not in ("graphs", "membership"):
+        msg = f"Unknown clustering output {output}"
+        raise ValueError(msg)
     level_to = level_to or f"{to}_level"
-    input[level_to] = input.apply(
-        lambda x: list({level for level, _, _ in x[community_map_to]}), axis=1
-    )
-    input[to] = None
-
-    num_total = len(input)
 
     # Create a seed for this run (if not provided)
     seed = strategy.get("seed", Random().randint(0, 0xFFFFFFFF))  # noqa S311
 
-    # Go through each of the rows
-    graph_level_pairs_column: list[list[tuple[int, str]]] = []
-    for _, row in progress_iterable(input.iterrows(), callbacks.progress, num_total):
-        levels = row[level_to]
-        graph_level_pairs: list[tuple[int, str]] = []
-
-        # For each of the levels, get the graph and add it to the list
-        for level in levels:
-            graph = "\n".join(
-                nx.generate_graphml(
-                    apply_clustering(
-                        cast(str, row[column]),
-                        cast(Communities, row[community_map_to]),
-                        level,
-                        seed=seed,
-                    )
-                )
+    graphs: list[nx.Graph] = []
+    levels_column: list[list[int]] = []
+    for _, row in progress_iterable(input.iterrows(), callbacks.progress, len(input)):
+        graph = load_graph(cast(str | bytes | nx.Graph, row[column]))
+        if graph is row[column]:
+            graph = graph.copy()
+        communities = run_layout(strategy, graph)
+        levels = sorted({level for level, _, _ in communities})
+        graphs.append(apply_cluster_membership(graph, communities, levels, seed=seed))
+        levels_column.append(levels)
+    input[level_to] = levels_column
+
+    if output == "membership":
+        input[to] = [dump_graph(graph) for graph in graphs]
+        return input
+    return _explode_levels(input, graphs, to, level_to)
+
+
+def expand_cluster_levels(
+    input: pd.DataFrame,
+    callbacks: VerbCallbacks,
+    column: str,
+    to: str,
+    level_to: str,
+) -> pd.DataFrame:
+    """Explode the rows of a `cluster_graph(output="membership")` table into one row per level."""
+    graphs = [
+        load_graph(cast(str | bytes | nx.Graph, graph))
+        for graph in progress_iterable(input[column], callbacks.progress, len(input))
+    ]
+    return _explode_levels(input, graphs, to, level_to)
+
+
+def ensure_cluster_levels(
+    input: pd.DataFrame,
+    callbacks: VerbCallbacks,
+    column: str,
+    level_to: str,
+) -> pd.DataFrame:
+    """
+    A table with one row per level, whichever `cluster_graph` output it came from.
+
+    A membership table, recognized by the level lists in `level_to`, is
+    expanded by `expand_cluster_levels` into a new table; a table of per-level
+    graphs is returned as is.
+    """
+    if input.empty or pd.api.types.is_scalar(input[level_to].iloc[0]):
+        return input
+    return expand_cluster_levels(input.copy(), callbacks, column, column, level_to)
+
+
+def _explode_levels(
+    input: pd.DataFrame, graphs: list[nx.Graph], to: str, level_to: str
+) -> pd.DataFrame:
+    graph_level_pairs_column: list[list[tuple[int, bytes]]] = []
+    for graph, levels in zip(graphs, input[level_to], strict=True):
+        # the node and edge lists are shared by the levels, only their attributes change
+        nodes = list(graph.nodes(data=True))
+        edges = list(graph.edges(data=True))
+        attributes = _level_attributes(graph)
+        graph_level_pairs_column.append([
+            (
+                level,
+                dump_graph_items(
+                    graph.is_directed(),
+                    attributes,
+                    *_level_items(graph, nodes, edges, level),
+                ),
             )
-            graph_level_pairs.append((level, graph))
-        graph_level_pairs_column.append(graph_level_pairs)
+            for level in levels
+        ])
     input[to] = graph_level_pairs_column
 
     # explode the list of (level, graph) pairs into separate rows
@@ -84,42 +145,123 @@ def cluster_graph(
     # split the (level, graph) pairs into separate columns
     # TODO: There is probably a better way to do this
     input[[level_to, to]] = pd.DataFrame(input[to].tolist(), index=input.index)
-
-    # clean up the community map
-    input.drop(columns=[community_map_to], inplace=True)
     return input
 
 
-# TODO: This should support str | nx.Graph as a graphml param
-def apply_clustering(
-    graphml: str, communities: Communities, level: int = 0, seed: int | None = None
+def apply_cluster_membership(
+    graph: nx.Graph,
+    communities: Communities,
+    levels: list[int],
+    seed: int | None = None,
 ) -> nx.Graph:
-    """Apply clustering to a graphml string."""
+    """
+    Add the level-invariant clustering attributes to a graph, in place.
+
+    Nodes get their `degree`, `human_readable_id` and `id`, and a `clusters`
+    list with their community at each of `levels` (None where they are not
+    clustered). Edges get their `id` and `human_readable_id`. The levels are
+    kept in `graph.graph["levels"]`.
+    """
     random = Random(seed)  # noqa S311
-    graph = nx.parse_graphml(graphml)
+    index = {level: i for i, level in enumerate(levels)}
+    clusters: dict[str, list[str | None]] = {}
     for community_level, community_id, nodes in communities:
-        if level == community_level:
+        if community_level in index:
             for node in nodes:
-                graph.nodes[node]["cluster"] = community_id
-                graph.nodes[node]["level"] = level
-
-    # add node degree
-    for node_degree in graph.degree:
-        graph.nodes[str(node_degree[0])]["degree"] = int(node_degree[1])
-
-    # add node uuid and incremental record id (a human readable id used as reference in the final report)
-    for index, node in enumerate(graph.nodes()):
-        graph.nodes[node]["human_readable_id"] = index
-        graph.nodes[node]["id"] = str(gen_uuid(random))
+                if node not in clusters:
+                    clusters[node] = [None] * len(levels)
+                clusters[node][index[community_level]] = community_id
+
+    # add node degree, uuid and incremental record id (a human readable id used as reference in the final report)
+    for human_readable_id, (node, degree) in enumerate(graph.degree):
+        graph.nodes[node].update(
+            degree=int(degree),
+            human_readable_id=human_readable_id,
+            id=str(gen_uuid(random)),
+            clusters=clusters.get(node, [None] * len(levels)),
+        )
 
     # add ids to edges
-    for index, edge in enumerate(graph.edges()):
+    for human_readable_id, edge in enumerate(graph.edges()):
         graph.edges[edge]["id"] = str(gen_uuid(random))
-        graph.edges[edge]["human_readable_id"] = index
-        graph.edges[edge]["level"] = level
+        graph.edges[edge]["human_readable_id"] = human_readable_id
+
+    graph.graph["levels"] = list(levels)
     return graph
 
 
+_LEVEL_INVARIANT_ATTRIBUTES = ("degree", "human_readable_id", "id")
+
+
+def materialize_level(graph: nx.Graph, level: int) -> nx.Graph:
+    """Build the graph of one level from a graph annotated by `apply_cluster_membership`."""
+    nodes, edges = _level_items(
+        graph, graph.nodes(data=True), graph.edges(data=True), level
+    )
+    result = nx.DiGraph() if graph.is_directed() else nx.Graph()
+    result.graph.update(_level_attributes(graph))
+    result.add_nodes_from(nodes)
+    result.add_edges_from(edges)
+    return result
+
+
+def _level_attributes(graph: nx.Graph) -> dict[str, Any]:
+    return {key: value for key, value in graph.graph.items() if key != "levels"}
+
+
+def _level_items(
+    graph: nx.Graph,
+    nodes: Iterable[tuple[str, dict[str, Any]]],
+    edges: Iterable[tuple[str, str, dict[str, Any]]],
+    level: int,
+) -> tuple[list[tuple[str, dict[str, Any]]], list[tuple[str, str, dict[str, Any]]]]:
+    position = graph.graph["levels"].index(level)
+    level_nodes = []
+    for node, data in nodes:
+        # keep the attribute order apply_clustering has always produced
+        attributes = {
+            key: value
+            for key, value in data.items()
+            if key != "clusters" and key not in _LEVEL_INVARIANT_ATTRIBUTES
+        }
+        community_id = data["clusters"][position]
+        if community_id is not None:
+            attributes["cluster"] = community_id
+            attributes["level"] = level
+        for key in _LEVEL_INVARIANT_ATTRIBUTES:
+            attributes[key] = data[key]
+        level_nodes.append((node, attributes))
+    level_edges = [
+        (source, target, {**data, "level": level}) for source, target, data in edges
+    ]
+    return level_nodes, level_edges
+
+
+def cluster_membership(graph_data: str | bytes | nx.Graph) -> pd.DataFrame:
+    """The community of every node at every level, as a node x level table."""
+    graph = load_graph(graph_data)
+    return pd.DataFrame.from_dict(
+        dict(graph.nodes(data="clusters")),
+        orient="index",
+        columns=graph.graph["levels"],
+    )
+
+
+def apply_clustering(
+    graphml: str | bytes | nx.Graph,
+    communities: Communities,
+    level: int = 0,
+    seed: int | None = None,
+) -> nx.Graph:
+    """Apply clustering to a serialized graph, returning a new graph."""
+    graph = load_graph(graphml)
+    if graph is graphml:
+        graph = graph.copy()
+    return materialize_level(
+        apply_cluster_membership(graph, communities, [level], seed=seed), level
+    )
+
+
 def run_bayan(graph: nx.Graph, args: dict[str, Any]) -> dict[int, dict[str, list[str]]]:
     """Run the Bayan algorithm and return communities by level."""
     max_cluster_size = args.get("max_cluster_size", 10)
@@ -147,7 +289,7 @@ def run_bayan(graph: nx.Graph, args: dict[str, Any]) -> dict[int, dict[str, list
 
 
 def run_layout(
-    strategy: dict[str, Any], graphml_or_graph: str | nx.Graph
+    strategy: dict[str, Any], graphml_or_graph: str | bytes | nx.Graph
 ) -> Communities:
     """Run layout method definition."""
     graph = load_graph(graphml_or_graph)
@@ -160,6 +302,8 @@ def run_layout(
     match strategy_type:
         case GraphCommunityStrategyType.leiden:
             clusters = run_leiden(graph, strategy)
+        case GraphCommunityStrategyType.parallel_leiden:
+            clusters = run_parallel_leiden(graph, strategy)
         case _:
             msg = f"Unknown clustering strategy {strategy_type}"
             raise ValueError(msg)
@@ -187,9 +331,32 @@ def run_leiden(
         max_cluster_size=max_cluster_size,
         use_lcc=use_lcc,
         seed=args.get("seed", 0xDEADBEEF),
+        backend=args.get("backend", LeidenBackend.graspologic),
     )
-    levels = args.get("levels")
+    return _communities_by_level(node_id_to_community_map, args.get("levels"))
+
 
+def run_parallel_leiden(
+    graph: nx.Graph, args: dict[str, Any]
+) -> dict[int, dict[str, list[str]]]:
+    """Run hierarchical Leiden on every connected component, in a process pool."""
+    # same LCC handling as run_leiden, so the worker count only changes speed
+    if args.get("use_lcc", True):
+        graph = stable_largest_connected_component(graph)
+    node_id_to_community_map = compute_component_communities(
+        graph,
+        max_cluster_size=args.get("max_cluster_size", 10),
+        seed=args.get("seed", 0xDEADBEEF),
+        backend=args.get("backend", LeidenBackend.graspologic),
+        num_workers=args.get("num_workers") or os.cpu_count() or 1,
+        resolution=args.get("resolution", 1.0),
+    )
+    return _communities_by_level(node_id_to_community_map, args.get("levels"))
+
+
+def _communities_by_level(
+    node_id_to_community_map: dict[int, dict[str, int]], levels: list[int] | None
+) -> dict[int, dict[str, list[str]]]:
     # If they don't pass in levels, use them all
     if levels is None:
         levels = sorted(node_id_to_community_map.keys())
@@ -212,10 +379,15 @@ def _compute_leiden_communities(
     max_cluster_size: int,
     use_lcc: bool,
     seed=0xDEADBEEF,
+    backend: LeidenBackend | str = LeidenBackend.graspologic,
 ) -> dict[int, dict[str, int]]:
     """Return Leiden root communities."""
     if use_lcc:
         graph = stable_largest_connected_component(graph)
+    if backend != LeidenBackend.graspologic:
+        return compute_component_communities(
+            graph, max_cluster_size=max_cluster_size, seed=seed, backend=backend
+        )
 
     community_mapping = hierarchical_leiden(
         graph, max_cluster_size=max_cluster_size, random_seed=seed
@@ -35,12 +35,12 @@ async def embed_graph(
     num_threads: int = 4,
 ):
     """
-    Embed a graph into a vector space. The graph is expected to be in graphml format. The operation outputs a new column containing a mapping between node_id and vector.
+    Embed a graph into a vector space. The graph is expected to be serialized with `dump_graph` (graphml is also accepted). The operation outputs a new column containing a mapping between node_id and vector.
 
     ## Usage
     ```yaml
     args:
-        column: clustered_graph # The name of the column containing the graph, should be a graphml graph
+        column: clustered_graph # The name of the column containing the graph, serialized with `dump_graph`
         to: embeddings # The name of the column to output the embeddings to
         strategy: <strategy config> # See strategies section below
     ```
@@ -80,7 +80,7 @@ async def embed_graph(
 
 def run_embeddings(
     strategy: EmbedGraphStrategyType,
-    graphml_or_graph: str | nx.Graph,
+    graphml_or_graph: str | bytes | nx.Graph,
     args: dict[str, Any],
 ) -> NodeEmbeddings:
     """Run embeddings method definition."""
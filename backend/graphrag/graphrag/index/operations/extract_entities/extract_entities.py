@@ -134,7 +134,7 @@ async def extract_entities(
             strategy_config,
         )
         num_started += 1
-        return [result.entities, result.graphml_graph]
+        return [result.entities, result.graph_data]
 
     results = await derive_from_rows(
         input,
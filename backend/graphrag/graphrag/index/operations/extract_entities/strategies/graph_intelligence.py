@@ -3,7 +3,6 @@
 
 """A module containing run_graph_intelligence,  run_extract_entities and _create_text_splitter methods to run graph intelligence."""
 
-import networkx as nx
 from datashaper import VerbCallbacks
 
 import graphrag.config.defaults as defs
@@ -15,6 +14,7 @@ from graphrag.index.text_splitting import (
     TextSplitter,
     TokenTextSplitter,
 )
+from graphrag.index.utils import dump_graph
 from graphrag.llm import CompletionLLM
 
 from .typing import (
@@ -62,6 +62,9 @@ async def run_extract_entities(
     extraction_prompt = args.get("extraction_prompt", None)
     encoding_model = args.get("encoding_name", None)
     max_gleanings = args.get("max_gleanings", defs.ENTITY_EXTRACTION_MAX_GLEANINGS)
+    concurrent_documents = args.get(
+        "concurrent_documents", defs.ENTITY_EXTRACTION_CONCURRENT_DOCUMENTS
+    )
 
     # note: We're not using UnipartiteGraphChain.from_params
     # because we want to pass "timeout" to the llm_kwargs
@@ -74,6 +77,7 @@ async def run_extract_entities(
         prompt=extraction_prompt,
         encoding_model=encoding_model,
         max_gleanings=max_gleanings,
+        concurrent_documents=concurrent_documents,
         on_error=lambda e, s, d: (
             callbacks.error("Entity Extraction Error", e, s, d) if callbacks else None
         ),
@@ -114,8 +118,7 @@ async def run_extract_entities(
         if item is not None
     ]
 
-    graph_data = "".join(nx.generate_graphml(graph))
-    return EntityExtractionResult(entities, graph_data)
+    return EntityExtractionResult(entities, dump_graph(graph))
 
 
 def _create_text_splitter(
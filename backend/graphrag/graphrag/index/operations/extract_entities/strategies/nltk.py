@@ -9,6 +9,7 @@ from datashaper import VerbCallbacks
 from nltk.corpus import words
 
 from graphrag.index.cache import PipelineCache
+from graphrag.index.utils import dump_graph
 
 from .typing import Document, EntityExtractionResult, EntityTypes, StrategyConfig
 
@@ -57,5 +58,5 @@ async def run(  # noqa RUF029 async is required for interface
             {"type": entity_type, "name": name}
             for name, entity_type in entity_map.items()
         ],
-        graphml_graph="".join(nx.generate_graphml(graph)),
+        graph_data=dump_graph(graph),
     )
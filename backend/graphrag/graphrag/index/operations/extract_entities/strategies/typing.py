@@ -29,7 +29,8 @@ class EntityExtractionResult:
     """Entity extraction result class definition."""
 
     entities: list[ExtractedEntity]
-    graphml_graph: str | None
+    graph_data: bytes | None
+    """The extracted graph, serialized with `dump_graph`."""
 
 
 EntityExtractStrategy = Callable[
@@ -12,7 +12,7 @@ from datashaper import VerbCallbacks, progress_callback
 
 from graphrag.index.graph.visualization import GraphLayout
 from graphrag.index.operations.embed_graph import NodeEmbeddings
-from graphrag.index.utils import load_graph
+from graphrag.index.utils import dump_graph, load_graph
 
 
 class LayoutGraphStrategyType(str, Enum):
@@ -36,12 +36,12 @@ def layout_graph(
     graph_to: str | None = None,
 ):
     """
-    Apply a layout algorithm to a graph. The graph is expected to be in graphml format. The verb outputs a new column containing the laid out graph.
+    Apply a layout algorithm to a graph. The graph is expected to be serialized with `dump_graph` (graphml is also accepted). The verb outputs a new column containing the laid out graph.
 
     ## Usage
     ```yaml
     args:
-        graph_column: clustered_graph # The name of the column containing the graph, should be a graphml graph
+        graph_column: clustered_graph # The name of the column containing the graph, serialized with `dump_graph`
         embeddings_column: embeddings # The name of the column containing the embeddings
         to: node_positions # The name of the column to output the node positions to
         graph_to: positioned_graph # The name of the column to output the positioned graph to
@@ -94,7 +94,7 @@ def layout_graph(
 
 def _run_layout(
     strategy: LayoutGraphStrategyType,
-    graphml_or_graph: str | nx.Graph,
+    graphml_or_graph: str | bytes | nx.Graph,
     embeddings: NodeEmbeddings,
     args: dict[str, Any],
     callbacks: VerbCallbacks,
@@ -124,12 +124,12 @@ def _run_layout(
 
 
 def _apply_layout_to_graph(
-    graphml_or_graph: str | nx.Graph, layout: GraphLayout
-) -> str:
+    graphml_or_graph: str | bytes | nx.Graph, layout: GraphLayout
+) -> bytes:
     graph = load_graph(graphml_or_graph)
     for node_position in layout:
         if node_position.label in graph.nodes:
             graph.nodes[node_position.label]["x"] = node_position.x
             graph.nodes[node_position.label]["y"] = node_position.y
             graph.nodes[node_position.label]["size"] = node_position.size
-    return "\n".join(nx.generate_graphml(graph))
+    return dump_graph(graph)
@@ -9,7 +9,7 @@ import networkx as nx
 import pandas as pd
 from datashaper import VerbCallbacks, progress_iterable
 
-from graphrag.index.utils import load_graph
+from graphrag.index.utils import dump_graph, load_graph
 
 from .typing import (
     BasicMergeOperation,
@@ -43,7 +43,7 @@ def merge_graphs(
     edges: dict[str, Any] = DEFAULT_EDGE_OPERATIONS,
 ) -> pd.DataFrame:
     """
-    Merge multiple graphs together. The graphs are expected to be in graphml format. The verb outputs a new column containing the merged graph.
+    Merge multiple graphs together. The graphs are expected to be serialized with `dump_graph` (graphml is also accepted). The verb outputs a new column containing the merged graph.
 
     > Note: This will merge all rows into a single graph.
 
@@ -51,7 +51,7 @@ def merge_graphs(
     ```yaml
     verb: merge_graph
     args:
-        column: clustered_graph # The name of the column containing the graph, should be a graphml graph
+        column: clustered_graph # The name of the column containing the graph, serialized with `dump_graph`
         to: merged_graph # The name of the column to output the merged graph to
         nodes: <node operations> # See node operations section below
         edges: <edge operations> # See edge operations section below
@@ -104,11 +104,11 @@ def merge_graphs(
     mega_graph = nx.Graph()
     num_total = len(input)
     for graphml in progress_iterable(input[column], callbacks.progress, num_total):
-        graph = load_graph(cast(str | nx.Graph, graphml))
+        graph = load_graph(cast(str | bytes | nx.Graph, graphml))
         merge_nodes(mega_graph, graph, node_ops)
         merge_edges(mega_graph, graph, edge_ops)
 
-    output[to] = ["\n".join(nx.generate_graphml(mega_graph))]
+    output[to] = [dump_graph(mega_graph)]
 
     return output
 
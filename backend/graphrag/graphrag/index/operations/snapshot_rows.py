@@ -10,6 +10,7 @@ from typing import Any
 import pandas as pd
 
 from graphrag.index.storage import PipelineStorage
+from graphrag.index.utils import graph_to_graphml
 
 
 @dataclass
@@ -57,6 +58,13 @@ async def snapshot_rows(
                     msg = "column must be specified for text format"
                     raise ValueError(msg)
                 await storage.set(f"{row_name}.{extension}", str(row[column]))
+            elif fmt.format == "graphml":
+                if column is None:
+                    msg = "column must be specified for graphml format"
+                    raise ValueError(msg)
+                await storage.set(
+                    f"{row_name}.{extension}", graph_to_graphml(row[column])
+                )
 
 
 def _parse_formats(formats: list[str | dict[str, Any]]) -> list[FormatSpecifier]:
@@ -81,5 +89,7 @@ def _get_format_extension(fmt: str) -> str:
         return "parquet"
     if fmt == "csv":
         return "csv"
+    if fmt == "graphml":
+        return "graphml"
     msg = f"Unknown format: {fmt}"
     raise ValueError(msg)
@@ -16,7 +16,7 @@ from datashaper import (
 )
 
 from graphrag.index.cache import PipelineCache
-from graphrag.index.utils import load_graph
+from graphrag.index.utils import dump_graph, load_graph
 
 from .typing import (
     DescriptionSummarizeRow,
@@ -49,8 +49,8 @@ async def summarize_descriptions(
     {
         "verb": "",
         "args": {
-            "column": "the_document_text_column_to_extract_descriptions_from", /* Required: This will be a graphml graph in string form which represents the entities and their relationships */
-            "to": "the_column_to_output_the_summarized_descriptions_to", /* Required: This will be a graphml graph in string form which represents the entities and their relationships after being summarized */
+            "column": "the_document_text_column_to_extract_descriptions_from", /* Required: This will be a graph serialized with `dump_graph` which represents the entities and their relationships */
+            "to": "the_column_to_output_the_summarized_descriptions_to", /* Required: This will be a graph serialized with `dump_graph` which represents the entities and their relationships after being summarized */
             "strategy": {...} <strategy_config>, see strategies section below
         }
     }
@@ -100,7 +100,9 @@ async def summarize_descriptions(
     strategy_config = {**strategy}
 
     async def get_resolved_entities(row, semaphore: asyncio.Semaphore):
-        graph: nx.Graph = load_graph(cast(str | nx.Graph, getattr(row, column)))
+        graph: nx.Graph = load_graph(
+            cast(str | bytes | nx.Graph, getattr(row, column))
+        )
 
         ticker_length = len(graph.nodes) + len(graph.edges)
 
@@ -135,7 +137,7 @@ async def summarize_descriptions(
                 graph.edges[graph_item]["description"] = result.description
 
         return DescriptionSummarizeRow(
-            graph="\n".join(nx.generate_graphml(graph)),
+            graph=dump_graph(graph),
         )
 
     async def do_summarize_descriptions(
@@ -43,7 +43,7 @@ def unpack_graph(
         result.extend([
             {**cleaned_row, **graph_id}
             for graph_id in _run_unpack(
-                cast(str | nx.Graph, row[column]),
+                cast(str | bytes | nx.Graph, row[column]),
                 type,
                 embeddings,
             )
@@ -53,7 +53,7 @@ def unpack_graph(
 
 
 def _run_unpack(
-    graphml_or_graph: str | nx.Graph,
+    graphml_or_graph: str | bytes | nx.Graph,
     unpack_type: str,
     embeddings: dict[str, list[float]],
 ) -> list[dict[str, Any]]:
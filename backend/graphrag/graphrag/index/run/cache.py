@@ -3,7 +3,9 @@
 
 """Cache functions for the GraphRAG update module."""
 
-from graphrag.index.cache import load_cache
+from datashaper import WorkflowCallbacks
+
+from graphrag.index.cache import TieredPipelineCache, load_cache
 from graphrag.index.cache.pipeline_cache import PipelineCache
 from graphrag.index.config.cache import (
     PipelineCacheConfigTypes,
@@ -15,3 +17,10 @@ def _create_cache(
     config: PipelineCacheConfigTypes | None, root_dir: str
 ) -> PipelineCache:
     return load_cache(config or PipelineMemoryCacheConfig(), root_dir=root_dir)
+
+
+def _report_cache_stats(
+    cache: PipelineCache, callbacks: WorkflowCallbacks, workflow: str
+) -> None:
+    if isinstance(cache, TieredPipelineCache):
+        cache.report(callbacks, workflow)
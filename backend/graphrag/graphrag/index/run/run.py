@@ -3,6 +3,7 @@
 
 """Different methods to run the pipeline."""
 
+import asyncio
 import gc
 import logging
 import time
@@ -22,7 +23,7 @@ from graphrag.index.config import (
 )
 from graphrag.index.emit import TableEmitterType, create_table_emitters
 from graphrag.index.load_pipeline_config import load_pipeline_config
-from graphrag.index.run.cache import _create_cache
+from graphrag.index.run.cache import _create_cache, _report_cache_stats
 from graphrag.index.run.postprocess import (
     _create_postprocess_steps,
     _run_post_process_steps,
@@ -147,7 +148,9 @@ async def run_pipeline_with_config(
         ):
             tables_dict[table.workflow] = table.result
 
-        await update_dataframe_outputs(tables_dict, storage)
+        await update_dataframe_outputs(
+            tables_dict, storage, _clustering_strategy(workflows)
+        )
 
     else:
         async for table in run_pipeline(
@@ -261,6 +264,9 @@ async def run_pipeline(
                 start_time,
                 is_resume_run,
             )
+            _report_cache_stats(context.cache, callbacks, last_workflow)
+            # a killed run keeps the LLM results of the workflows it finished
+            await asyncio.to_thread(context.cache.flush)
             if result:
                 yield result
 
@@ -272,3 +278,11 @@ async def run_pipeline(
             "Error running pipeline!", e, traceback.format_exc()
         )
         yield PipelineRunResult(last_workflow, None, [e])
+
+
+def _clustering_strategy(workflows: list[PipelineWorkflowReference]) -> dict | None:
+    """The cluster_graph strategy configured for the entity graph workflow."""
+    for workflow in workflows:
+        if workflow.name == "create_base_entity_graph":
+            return (workflow.config or {}).get("cluster_graph", {}).get("strategy")
+    return None
@@ -18,6 +18,7 @@ from graphrag.index.cache.pipeline_cache import PipelineCache
 from graphrag.index.config.cache import (
     PipelineBlobCacheConfig,
     PipelineFileCacheConfig,
+    PipelineSqliteCacheConfig,
 )
 from graphrag.index.config.input import PipelineInputConfigTypes
 from graphrag.index.config.pipeline import PipelineConfig
@@ -83,7 +84,12 @@ def _apply_substitutions(config: PipelineConfig, run_id: str) -> PipelineConfig:
             substitutions
         )
     if (
-        isinstance(config.cache, PipelineFileCacheConfig | PipelineBlobCacheConfig)
+        isinstance(
+            config.cache,
+            PipelineFileCacheConfig
+            | PipelineBlobCacheConfig
+            | PipelineSqliteCacheConfig,
+        )
         and config.cache.base_dir
     ):
         config.cache.base_dir = Template(config.cache.base_dir).substitute(
@@ -0,0 +1,438 @@
+"""Incremental community maintenance for update runs."""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any
+
+import pandas as pd
+
+from graphrag.index.operations.cluster_components import (
+    LeidenBackend,
+    cluster_component,
+    leidenalg_seed,
+)
+
+log = logging.getLogger(__name__)
+
+# values of the `change` column of CommunityUpdate.changes
+COMMUNITY_NEW = "new"
+COMMUNITY_CHANGED = "changed"
+COMMUNITY_REMOVED = "removed"
+
+# {level: {node title: community id}}
+Membership = dict[int, dict[str, str]]
+
+
+@dataclass
+class CommunityUpdate:
+    """Dataclass to hold the result of an incremental re-clustering.
+
+    Attributes
+    ----------
+    membership : Membership
+        The community of every clustered node at every level.
+    changes : pd.DataFrame
+        The new, changed and removed communities, with `id`, `level` and
+        `change` columns. Reports of the other communities are still valid.
+    """
+
+    membership: Membership
+    changes: pd.DataFrame
+
+
+def previous_membership(nodes: pd.DataFrame) -> Membership:
+    """Read the membership of a previous run from its create_final_nodes table.
+
+    Parameters
+    ----------
+    nodes : pd.DataFrame
+        The create_final_nodes table, one row per node and level.
+
+    Returns
+    -------
+    Membership
+        The community of every node at every level it was clustered at.
+    """
+    clustered = nodes.loc[
+        nodes["community"].notna(), ["title", "level", "community"]
+    ]
+    membership: Membership = defaultdict(dict)
+    for title, level, community in clustered.itertuples(index=False):
+        membership[int(level)][title] = str(community)
+    return dict(membership)
+
+
+def recluster_communities(
+    previous: Membership,
+    relationships: pd.DataFrame,
+    touched: set[str],
+    max_cluster_size: int = 10,
+    seed: int = 0xDEADBEEF,
+    backend: LeidenBackend | str = LeidenBackend.leidenalg,
+    resolution: float = 1.0,
+) -> CommunityUpdate:
+    """Update a community hierarchy for new nodes and relationships.
+
+    Level 0 is re-optimized with Leiden seeded from the previous membership,
+    with only the `touched` nodes and their neighbours free to move. Every
+    level 0 community that contains a touched node, or gained or lost nodes,
+    is affected: its sub-communities are clustered again like
+    `hierarchical_leiden` would, the hierarchy of the others is kept.
+
+    Parameters
+    ----------
+    previous : Membership
+        The membership of the previous run.
+    relationships : pd.DataFrame
+        The `source`, `target` and `weight` of all relationships, old and new.
+    touched : set[str]
+        The nodes that got new relationships or descriptions.
+    max_cluster_size : int
+        Communities larger than this are split on the next level.
+    seed : int
+        The seed of the Leiden runs.
+    backend : LeidenBackend | str
+        The implementation used to split the affected communities.
+    resolution : float
+        The resolution of the modularity.
+
+    Returns
+    -------
+    CommunityUpdate
+        The new membership and the communities whose reports are stale.
+    """
+    edges = _weighted_edges(relationships)
+    previous_level0 = previous.get(0, {})
+    level0, next_id = _recluster_level0(
+        previous_level0,
+        edges,
+        touched,
+        _next_community_id(previous),
+        seed,
+        resolution,
+    )
+
+    # level 0 communities whose members or relationships changed
+    affected = {level0[node] for node in touched if node in level0}
+    for node in set(previous_level0) | set(level0):
+        if previous_level0.get(node) != level0.get(node):
+            affected.update(
+                community
+                for community in (previous_level0.get(node), level0.get(node))
+                if community is not None
+            )
+
+    membership: Membership = defaultdict(dict)
+    membership[0] = level0
+    for level, communities in previous.items():
+        if level == 0:
+            continue
+        for node, community in communities.items():
+            if previous_level0.get(node) not in affected:
+                membership[level][node] = community
+
+    members: dict[str, list[str]] = defaultdict(list)
+    for node, community in level0.items():
+        if community in affected:
+            members[community].append(node)
+    new_communities: list[tuple[str, int]] = []
+    for community in sorted(members, key=_community_order):
+        nodes = sorted(members[community])
+        if len(nodes) <= max_cluster_size:
+            continue
+        hierarchy = cluster_component(
+            nodes,
+            _induced_edges(edges, set(nodes)),
+            backend,
+            max_cluster_size,
+            seed,
+            resolution,
+        )
+        ids: dict[int, str] = {}
+        for level, local_id, node in hierarchy:
+            if local_id not in ids:
+                ids[local_id] = str(next_id)
+                next_id += 1
+                new_communities.append((ids[local_id], level + 1))
+            membership[level + 1][node] = ids[local_id]
+
+    changes = _changes(previous, membership, affected, new_communities)
+    log.info(
+        "Re-clustered %d of %d level 0 communities around %d touched nodes",
+        len(affected),
+        len(set(level0.values())),
+        len(touched),
+    )
+    return CommunityUpdate(dict(sorted(membership.items())), changes)
+
+
+def community_rows(
+    membership: Membership,
+    community_ids: set[str],
+    relationships: pd.DataFrame,
+    entities: pd.DataFrame,
+) -> pd.DataFrame:
+    """Build create_final_communities rows for some communities of a membership.
+
+    Parameters
+    ----------
+    membership : Membership
+        The community of every node at every level.
+    community_ids : set[str]
+        The communities to build rows for.
+    relationships : pd.DataFrame
+        The merged relationships, with `id`, `source` and `target`.
+    entities : pd.DataFrame
+        The merged entities, with `name` and `text_unit_ids`.
+
+    Returns
+    -------
+    pd.DataFrame
+        The `id`, `title`, `level`, `relationship_ids` and `text_unit_ids`
+        of the communities.
+    """
+    text_units = {
+        name: _text_unit_list(text_unit_ids)
+        for name, text_unit_ids in zip(
+            entities["name"], entities["text_unit_ids"], strict=True
+        )
+    }
+    incident: dict[str, list[str]] = defaultdict(list)
+    for relationship_id, source, target in zip(
+        relationships["id"],
+        relationships["source"],
+        relationships["target"],
+        strict=True,
+    ):
+        incident[source].append(relationship_id)
+        incident[target].append(relationship_id)
+
+    rows = []
+    for level, communities in membership.items():
+        members: dict[str, list[str]] = defaultdict(list)
+        for node, community in communities.items():
+            if community in community_ids:
+                members[community].append(node)
+        for community in sorted(members, key=_community_order):
+            nodes = members[community]
+            rows.append({
+                "id": community,
+                "title": f"Community {community}",
+                "level": level,
+                "relationship_ids": list(
+                    dict.fromkeys(r for node in nodes for r in incident.get(node, []))
+                ),
+                "text_unit_ids": list(
+                    dict.fromkeys(t for node in nodes for t in text_units.get(node, []))
+                ),
+            })
+    return pd.DataFrame(
+        rows, columns=["id", "title", "level", "relationship_ids", "text_unit_ids"]
+    )
+
+
+def membership_table(membership: Membership) -> pd.DataFrame:
+    """Flatten a membership into `title`, `level` and `community` rows."""
+    return pd.DataFrame(
+        [
+            (node, level, community)
+            for level, communities in membership.items()
+            for node, community in communities.items()
+        ],
+        columns=["title", "level", "community"],
+    )
+
+
+def _weighted_edges(relationships: pd.DataFrame) -> dict[tuple[str, str], float]:
+    weights = (
+        relationships["weight"].astype(float)
+        if "weight" in relationships.columns
+        else pd.Series(1.0, index=relationships.index)
+    )
+    edges: dict[tuple[str, str], float] = defaultdict(float)
+    for source, target, weight in zip(
+        relationships["source"], relationships["target"], weights, strict=True
+    ):
+        if source == target:
+            continue
+        key = (source, target) if source < target else (target, source)
+        edges[key] += weight
+    return dict(sorted(edges.items()))
+
+
+def _induced_edges(
+    edges: dict[tuple[str, str], float], nodes: set[str]
+) -> list[tuple[str, str, float]]:
+    return [
+        (source, target, weight)
+        for (source, target), weight in edges.items()
+        if source in nodes and target in nodes
+    ]
+
+
+def _recluster_level0(
+    previous: dict[str, str],
+    edges: dict[tuple[str, str], float],
+    touched: set[str],
+    next_id: int,
+    seed: int,
+    resolution: float,
+) -> tuple[dict[str, str], int]:
+    """Re-optimize level 0 with only the neighbourhood of `touched` free to move."""
+    import igraph as ig
+    import leidenalg
+
+    free = {node for node in touched if node in previous}
+    for source, target in edges:
+        if source in touched or target in touched:
+            free.update((source, target))
+
+    names = sorted(set(previous) | free)
+    index = {name: i for i, name in enumerate(names)}
+    graph_edges = [
+        (index[source], index[target], weight)
+        for (source, target), weight in edges.items()
+        if source in index and target in index
+    ]
+    graph = ig.Graph(n=len(names), edges=[(s, t) for s, t, _ in graph_edges])
+    graph.es["weight"] = [weight for _, _, weight in graph_edges]
+
+    # previous communities keep their label, new nodes start as singletons
+    labels = {
+        community: i for i, community in enumerate(sorted(set(previous.values())))
+    }
+    singletons = iter(range(len(labels), len(labels) + len(names)))
+    initial = [
+        labels[previous[name]] if name in previous else next(singletons)
+        for name in names
+    ]
+
+    partition = leidenalg.RBConfigurationVertexPartition(
+        graph,
+        initial_membership=initial,
+        weights="weight",
+        resolution_parameter=resolution,
+    )
+    optimiser = leidenalg.Optimiser()
+    optimiser.set_rng_seed(leidenalg_seed(seed))
+    optimiser.optimise_partition(
+        partition,
+        n_iterations=2,
+        is_membership_fixed=[name not in free for name in names],
+    )
+    return _match_previous_ids(previous, names, partition.membership, next_id)
+
+
+def _match_previous_ids(
+    previous: dict[str, str], names: list[str], membership: list[int], next_id: int
+) -> tuple[dict[str, str], int]:
+    """Give every new community the id of the previous community it overlaps most."""
+    clusters: dict[int, list[str]] = defaultdict(list)
+    for name, label in zip(names, membership, strict=True):
+        clusters[label].append(name)
+
+    overlaps: list[tuple[int, str, int]] = []
+    for label, nodes in clusters.items():
+        counts: dict[str, int] = defaultdict(int)
+        for node in nodes:
+            if node in previous:
+                counts[previous[node]] += 1
+        overlaps.extend(
+            (count, community, label) for community, count in counts.items()
+        )
+
+    ids: dict[int, str] = {}
+    taken: set[str] = set()
+    for _, community, label in sorted(
+        overlaps, key=lambda o: (-o[0], _community_order(o[1]), o[2])
+    ):
+        if label not in ids and community not in taken:
+            ids[label] = community
+            taken.add(community)
+
+    result = {}
+    for label in sorted(clusters, key=lambda label: min(clusters[label])):
+        if label not in ids:
+            ids[label] = str(next_id)
+            next_id += 1
+        for node in clusters[label]:
+            result[node] = ids[label]
+    return result, next_id
+
+
+def _next_community_id(membership: Membership) -> int:
+    numeric = [
+        int(community)
+        for communities in membership.values()
+        for community in communities.values()
+        if community.isdigit()
+    ]
+    return max(numeric, default=-1) + 1
+
+
+def _community_order(community: str) -> tuple[int, Any]:
+    return (0, int(community)) if community.isdigit() else (1, community)
+
+
+def _changes(
+    previous: Membership,
+    membership: Membership,
+    affected: set[str],
+    created: list[tuple[str, int]],
+) -> pd.DataFrame:
+    previous_ids = {
+        (community, level)
+        for level, communities in previous.items()
+        for community in communities.values()
+    }
+    current_ids = {
+        (community, level)
+        for level, communities in membership.items()
+        for community in communities.values()
+    }
+    previous_level0 = previous.get(0, {})
+    # the sub-communities of affected communities are all clustered again
+    removed = {
+        (community, level)
+        for level, communities in previous.items()
+        if level > 0
+        for node, community in communities.items()
+        if previous_level0.get(node) in affected
+    }
+
+    rows = []
+    for community in affected:
+        if (community, 0) not in current_ids:
+            rows.append((community, 0, COMMUNITY_REMOVED))
+        elif (community, 0) in previous_ids:
+            rows.append((community, 0, COMMUNITY_CHANGED))
+        else:
+            rows.append((community, 0, COMMUNITY_NEW))
+    rows.extend((community, level, COMMUNITY_REMOVED) for community, level in removed)
+    rows.extend((community, level, COMMUNITY_NEW) for community, level in created)
+    rows.sort(key=lambda row: (row[1], _community_order(row[0])))
+    return pd.DataFrame(rows, columns=["id", "level", "change"])
+
+
+def _text_unit_list(text_unit_ids: Any) -> list[str]:
+    if isinstance(text_unit_ids, str):
+        return [t for t in text_unit_ids.split(",") if t]
+    if text_unit_ids is None:
+        return []
+    return [str(t) for t in text_unit_ids]
+
+
+def clustering_parameters(strategy: dict[str, Any] | None) -> dict[str, Any]:
+    """The `recluster_communities` arguments set in a cluster_graph strategy."""
+    strategy = strategy or {}
+    parameters: dict[str, Any] = {
+        "max_cluster_size": strategy.get("max_cluster_size", 10),
+        "seed": strategy.get("seed", 0xDEADBEEF),
+        "resolution": strategy.get("resolution", 1.0),
+    }
+    if "backend" in strategy:
+        parameters["backend"] = strategy["backend"]
+    return parameters
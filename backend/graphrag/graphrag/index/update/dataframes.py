@@ -10,6 +10,14 @@ import numpy as np
 import pandas as pd
 
 from graphrag.index.storage.typing import PipelineStorage
+from graphrag.index.update.communities import (
+    COMMUNITY_REMOVED,
+    clustering_parameters,
+    community_rows,
+    membership_table,
+    previous_membership,
+    recluster_communities,
+)
 from graphrag.utils.storage import _load_table_from_storage
 
 mergeable_outputs = [
@@ -72,6 +80,7 @@ async def get_delta_docs(
 async def update_dataframe_outputs(
     dataframe_dict: dict[str, pd.DataFrame],
     storage: PipelineStorage,
+    clustering_strategy: dict | None = None,
 ) -> None:
     """Update the mergeable outputs.
 
@@ -81,6 +90,8 @@ async def update_dataframe_outputs(
         The dictionary of dataframes.
     storage : PipelineStorage
         The storage used to store the dataframes.
+    clustering_strategy : dict | None
+        The cluster_graph strategy of the index, used to re-cluster communities.
     """
     await _concat_dataframes("create_base_text_units", dataframe_dict, storage)
     await _concat_dataframes("create_final_documents", dataframe_dict, storage)
@@ -97,6 +108,90 @@ async def update_dataframe_outputs(
         "create_final_entities_new.parquet", merged_entities_df.to_parquet()
     )
 
+    await _update_communities(
+        dataframe_dict, storage, merged_entities_df, clustering_strategy
+    )
+
+
+async def _update_communities(
+    dataframe_dict: dict[str, pd.DataFrame],
+    storage: PipelineStorage,
+    merged_entities: pd.DataFrame,
+    clustering_strategy: dict | None,
+) -> None:
+    """Re-cluster the communities around the new entities and relationships.
+
+    Only the neighbourhoods of the delta are clustered again. Rows of the
+    affected communities are rebuilt, the others are kept, and the affected
+    communities are listed in `stale_community_reports.parquet` so that only
+    their reports need to be generated again.
+
+    Parameters
+    ----------
+    dataframe_dict : dict[str, pd.DataFrame]
+        The dictionary of dataframes from a pipeline run.
+    storage : PipelineStorage
+        The storage used to store the dataframes.
+    merged_entities : pd.DataFrame
+        The entities of the index merged with the delta entities.
+    clustering_strategy : dict | None
+        The cluster_graph strategy of the index.
+    """
+    old_nodes = await _load_table_from_storage("create_final_nodes.parquet", storage)
+    old_relationships = await _load_table_from_storage(
+        "create_final_relationships.parquet", storage
+    )
+    old_communities = await _load_table_from_storage(
+        "create_final_communities.parquet", storage
+    )
+    delta_entities = dataframe_dict["create_final_entities"]
+    delta_relationships = dataframe_dict["create_final_relationships"]
+
+    relationships = pd.concat([old_relationships, delta_relationships], copy=False)
+    touched = (
+        set(delta_entities["name"])
+        | set(delta_relationships["source"])
+        | set(delta_relationships["target"])
+    )
+    update = recluster_communities(
+        previous_membership(old_nodes),
+        relationships,
+        touched,
+        **clustering_parameters(clustering_strategy),
+    )
+
+    changed_ids = set(update.changes["id"])
+    stale_ids = set(
+        update.changes.loc[update.changes["change"] != COMMUNITY_REMOVED, "id"]
+    )
+    communities = pd.concat(
+        [
+            old_communities.loc[~old_communities["id"].astype(str).isin(changed_ids)],
+            community_rows(update.membership, stale_ids, relationships, merged_entities),
+        ],
+        ignore_index=True,
+    )
+
+    # TODO: Using _new in the mean time, to compare outputs without overwriting the original
+    await storage.set(
+        "create_final_communities_new.parquet", communities.to_parquet()
+    )
+    await storage.set(
+        "community_membership_new.parquet",
+        membership_table(update.membership).to_parquet(),
+    )
+    await storage.set("stale_community_reports.parquet", update.changes.to_parquet())
+
+    # reports of the affected communities are dropped until they are regenerated
+    if await storage.has("create_final_community_reports.parquet"):
+        reports = await _load_table_from_storage(
+            "create_final_community_reports.parquet", storage
+        )
+        reports = reports.loc[~reports["community"].astype(str).isin(changed_ids)]
+        await storage.set(
+            "create_final_community_reports_new.parquet", reports.to_parquet()
+        )
+
 
 async def _concat_dataframes(name, dataframe_dict, storage):
     """Concatenate the dataframes.
@@ -3,9 +3,101 @@
 
 """Networkx load_graph utility definition."""
 
+import json
+import pickle
+from typing import Any
+
 import networkx as nx
 
+# Graphs move between verbs, and through the parquet tables of intermediate
+# workflows, as this header followed by a pickled (directed, graph attributes,
+# nodes, edges) tuple. GraphML is only written for snapshots.
+GRAPH_BINARY_HEADER = b"GRAPHv1\n"
+
+SerializedGraph = str | bytes | nx.Graph
+
+
+def dump_graph(graph: nx.Graph) -> bytes:
+    """Serialize a graph into the binary interchange format."""
+    return dump_graph_items(
+        graph.is_directed(),
+        graph.graph,
+        list(graph.nodes(data=True)),
+        list(graph.edges(data=True)),
+    )
+
+
+def dump_graph_items(
+    directed: bool,
+    attributes: dict,
+    nodes: list[tuple[Any, dict]],
+    edges: list[tuple[Any, Any, dict]],
+) -> bytes:
+    """Serialize the parts of a graph without building it, as `dump_graph` would."""
+    return GRAPH_BINARY_HEADER + pickle.dumps(
+        (directed, attributes, nodes, edges), protocol=pickle.HIGHEST_PROTOCOL
+    )
+
+
+def load_graph(graphml: SerializedGraph) -> nx.Graph:
+    """Load a graph from the binary interchange format, a graphml string or a networkx graph."""
+    if isinstance(graphml, nx.Graph):
+        return graphml
+    if isinstance(graphml, bytes | bytearray | memoryview):
+        data = bytes(graphml)
+        if not data.startswith(GRAPH_BINARY_HEADER):
+            msg = "Not a serialized graph"
+            raise ValueError(msg)
+        directed, attributes, nodes, edges = pickle.loads(  # noqa: S301
+            data[len(GRAPH_BINARY_HEADER) :]
+        )
+        graph = nx.DiGraph() if directed else nx.Graph()
+        graph.graph.update(attributes)
+        graph.add_nodes_from(nodes)
+        graph.add_edges_from(edges)
+        return graph
+    return nx.parse_graphml(graphml)
+
+
+def graph_to_graphml(graph: SerializedGraph) -> str:
+    """
+    GraphML text of a graph in any of the forms `load_graph` accepts.
+
+    GraphML only holds scalar values, so list and dict attributes, such as the
+    `clusters` of a membership graph, are written as JSON strings.
+    """
+    if isinstance(graph, str):
+        return graph
+    return "\n".join(nx.generate_graphml(_graphml_compatible(load_graph(graph))))
+
+
+def _graphml_compatible(graph: nx.Graph) -> nx.Graph:
+    attribute_dicts = [
+        graph.graph,
+        *(data for _, data in graph.nodes(data=True)),
+        *(data for _, _, data in graph.edges(data=True)),
+    ]
+    if not any(
+        isinstance(value, _NON_SCALAR_TYPES)
+        for data in attribute_dicts
+        for value in data.values()
+    ):
+        return graph
+    graph = graph.copy()
+    graph.graph.update(_json_values(graph.graph))
+    for _, data in graph.nodes(data=True):
+        data.update(_json_values(data))
+    for _, _, data in graph.edges(data=True):
+        data.update(_json_values(data))
+    return graph
+
+
+_NON_SCALAR_TYPES = (list, tuple, dict)
+
 
-def load_graph(graphml: str | nx.Graph) -> nx.Graph:
-    """Load a graph from a graphml file or a networkx graph."""
-    return nx.parse_graphml(graphml) if isinstance(graphml, str) else graphml
+def _json_values(data: dict) -> dict:
+    return {
+        key: json.dumps(value, ensure_ascii=False)
+        for key, value in data.items()
+        if isinstance(value, _NON_SCALAR_TYPES)
+    }
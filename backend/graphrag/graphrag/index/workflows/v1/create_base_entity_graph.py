@@ -22,6 +22,7 @@ def build_steps(
         {"strategy": {"type": "leiden"}},
     )
     clustering_strategy = clustering_config.get("strategy")
+    clustering_output = clustering_config.get("output", "graphs")
 
     embed_graph_config = config.get(
         "embed_graph",
@@ -46,6 +47,7 @@ def build_steps(
             "verb": "create_base_entity_graph",
             "args": {
                 "clustering_strategy": clustering_strategy,
+                "clustering_output": clustering_output,
                 "graphml_snapshot_enabled": graphml_snapshot_enabled,
                 "embedding_strategy": embedding_strategy
                 if embed_graph_enabled
@@ -31,6 +31,7 @@ async def create_base_entity_graph(
     clustering_strategy: dict[str, Any],
     embedding_strategy: dict[str, Any] | None,
     graphml_snapshot_enabled: bool = False,
+    clustering_output: str = "graphs",
     **_kwargs: dict,
 ) -> VerbResult:
     """All the steps to create the base entity graph."""
@@ -43,6 +44,7 @@ async def create_base_entity_graph(
         clustering_strategy,
         embedding_strategy,
         graphml_snapshot_enabled=graphml_snapshot_enabled,
+        clustering_output=clustering_output,
     )
 
     return create_verb_result(cast(Table, output))
@@ -6,10 +6,7 @@
 from enum import Enum
 
 from graphrag.model import Entity, Relationship
-from graphrag.query.input.retrieval.entities import (
-    get_entity_by_key,
-    get_entity_by_name,
-)
+from graphrag.query.input.retrieval.entities import EntityIndex
 from graphrag.query.llm.base import BaseTextEmbedding
 from graphrag.vector_stores import BaseVectorStore
 
@@ -42,8 +39,11 @@ def map_query_to_entities(
     exclude_entity_names: list[str] | None = None,
     k: int = 10,
     oversample_scaler: int = 2,
+    entity_index: EntityIndex | None = None,
 ) -> list[Entity]:
     """Extract entities that match a given query using semantic similarity of text embeddings of query and entity descriptions."""
+    if entity_index is None:
+        entity_index = EntityIndex(all_entities)
     if include_entity_names is None:
         include_entity_names = []
     if exclude_entity_names is None:
@@ -58,10 +58,8 @@ def map_query_to_entities(
             k=k * oversample_scaler,
         )
         for result in search_results:
-            matched = get_entity_by_key(
-                entities=all_entities,
-                key=embedding_vectorstore_key,
-                value=result.document.id,
+            matched = entity_index.get_by_key(
+                key=embedding_vectorstore_key, value=result.document.id
             )
             if matched:
                 matched_entities.append(matched)
@@ -80,7 +78,7 @@ def map_query_to_entities(
     # add entities in the include_entity list
     included_entities = []
     for entity_name in include_entity_names:
-        included_entities.extend(get_entity_by_name(all_entities, entity_name))
+        included_entities.extend(entity_index.get_by_name(entity_name))
     return included_entities + matched_entities
 
 
@@ -92,13 +90,16 @@ def find_nearest_neighbors_by_graph_embeddings(
     embedding_vectorstore_key: str = EntityVectorStoreKey.ID,
     k: int = 10,
     oversample_scaler: int = 2,
+    entity_index: EntityIndex | None = None,
 ) -> list[Entity]:
     """Retrieve related entities by graph embeddings."""
+    if entity_index is None:
+        entity_index = EntityIndex(all_entities)
     if exclude_entity_names is None:
         exclude_entity_names = []
     # find nearest neighbors of this entity using graph embedding
-    query_entity = get_entity_by_key(
-        entities=all_entities, key=embedding_vectorstore_key, value=entity_id
+    query_entity = entity_index.get_by_key(
+        key=embedding_vectorstore_key, value=entity_id
     )
     query_embedding = query_entity.graph_embedding if query_entity else None
 
@@ -109,10 +110,8 @@ def find_nearest_neighbors_by_graph_embeddings(
             query_embedding=query_embedding, k=k * oversample_scaler
         )
         for result in search_results:
-            matched = get_entity_by_key(
-                entities=all_entities,
-                key=embedding_vectorstore_key,
-                value=result.document.id,
+            matched = entity_index.get_by_key(
+                key=embedding_vectorstore_key, value=result.document.id
             )
             if matched:
                 matched_entities.append(matched)
@@ -136,24 +135,24 @@ def find_nearest_neighbors_by_entity_rank(
     all_relationships: list[Relationship],
     exclude_entity_names: list[str] | None = None,
     k: int | None = 10,
+    entity_index: EntityIndex | None = None,
 ) -> list[Entity]:
     """Retrieve entities that have direct connections with the target entity, sorted by entity rank."""
+    if entity_index is None:
+        entity_index = EntityIndex(all_entities, all_relationships)
     if exclude_entity_names is None:
         exclude_entity_names = []
-    entity_relationships = [
-        rel
-        for rel in all_relationships
-        if rel.source == entity_name or rel.target == entity_name
-    ]
-    source_entity_names = {rel.source for rel in entity_relationships}
-    target_entity_names = {rel.target for rel in entity_relationships}
-    related_entity_names = (source_entity_names.union(target_entity_names)).difference(
+    related_entity_names = entity_index.neighbor_names(entity_name).difference(
         set(exclude_entity_names)
     )
     top_relations = [
-        entity for entity in all_entities if entity.title in related_entity_names
+        entity
+        for name in related_entity_names
+        for entity in entity_index.get_by_name(name)
     ]
-    top_relations.sort(key=lambda x: x.rank if x.rank else 0, reverse=True)
+    top_relations.sort(
+        key=lambda x: (-(x.rank if x.rank else 0), entity_index.position(x))
+    )
     if k:
         return top_relations[:k]
     return top_relations
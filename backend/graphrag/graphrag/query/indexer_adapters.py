@@ -11,13 +11,13 @@ from typing import cast
 import pandas as pd
 
 from graphrag.model import CommunityReport, Covariate, Entity, Relationship, TextUnit
-from graphrag.query.input.loaders.dfs import (
+from graphrag.query.input.loaders.columnar import (
     read_community_reports,
-    read_covariates,
     read_entities,
     read_relationships,
     read_text_units,
 )
+from graphrag.query.input.loaders.dfs import read_covariates
 
 
 def read_indexer_text_units(final_text_units: pd.DataFrame) -> list[TextUnit]:
@@ -0,0 +1,262 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+
+"""
+Load data from dataframes into collections of data objects, column by column.
+
+These loaders mirror the ones in `dfs.py` but convert each column in a single
+pass instead of walking the dataframe with `iterrows`. Embedding columns are
+stacked into one contiguous float32 matrix before being split per object.
+"""
+
+import pandas as pd
+
+from graphrag.model import CommunityReport, Entity, Relationship, TextUnit
+from graphrag.query.input.loaders.utils import (
+    column_to_attributes,
+    column_to_optional_dict,
+    column_to_optional_float,
+    column_to_optional_int,
+    column_to_optional_list,
+    column_to_optional_str,
+    column_to_optional_vectors,
+    column_to_str,
+)
+
+
+def _short_ids(df: pd.DataFrame, short_id_col: str | None) -> list[str | None]:
+    if short_id_col:
+        return column_to_optional_str(df, short_id_col)
+    return [str(idx) for idx in df.index]
+
+
+def read_entities(
+    df: pd.DataFrame,
+    id_col: str = "id",
+    short_id_col: str | None = "short_id",
+    title_col: str = "title",
+    type_col: str | None = "type",
+    description_col: str | None = "description",
+    name_embedding_col: str | None = "name_embedding",
+    description_embedding_col: str | None = "description_embedding",
+    graph_embedding_col: str | None = "graph_embedding",
+    community_col: str | None = "community_ids",
+    text_unit_ids_col: str | None = "text_unit_ids",
+    document_ids_col: str | None = "document_ids",
+    rank_col: str | None = "degree",
+    attributes_cols: list[str] | None = None,
+) -> list[Entity]:
+    """Read entities from a dataframe."""
+    columns = zip(
+        column_to_str(df, id_col),
+        _short_ids(df, short_id_col),
+        column_to_str(df, title_col),
+        column_to_optional_str(df, type_col),
+        column_to_optional_str(df, description_col),
+        column_to_optional_vectors(df, name_embedding_col),
+        column_to_optional_vectors(df, description_embedding_col),
+        column_to_optional_vectors(df, graph_embedding_col),
+        column_to_optional_list(df, community_col, item_type=str),
+        column_to_optional_list(df, text_unit_ids_col),
+        column_to_optional_list(df, document_ids_col),
+        column_to_optional_int(df, rank_col),
+        column_to_attributes(df, attributes_cols),
+        strict=True,
+    )
+    return [
+        Entity(
+            id=item_id,
+            short_id=short_id,
+            title=title,
+            type=entity_type,
+            description=description,
+            name_embedding=name_embedding,
+            description_embedding=description_embedding,
+            graph_embedding=graph_embedding,
+            community_ids=community_ids,
+            text_unit_ids=text_unit_ids,
+            document_ids=document_ids,
+            rank=rank,
+            attributes=attributes,
+        )
+        for (
+            item_id,
+            short_id,
+            title,
+            entity_type,
+            description,
+            name_embedding,
+            description_embedding,
+            graph_embedding,
+            community_ids,
+            text_unit_ids,
+            document_ids,
+            rank,
+            attributes,
+        ) in columns
+    ]
+
+
+def read_relationships(
+    df: pd.DataFrame,
+    id_col: str = "id",
+    short_id_col: str | None = "short_id",
+    source_col: str = "source",
+    target_col: str = "target",
+    description_col: str | None = "description",
+    description_embedding_col: str | None = "description_embedding",
+    weight_col: str | None = "weight",
+    text_unit_ids_col: str | None = "text_unit_ids",
+    document_ids_col: str | None = "document_ids",
+    attributes_cols: list[str] | None = None,
+) -> list[Relationship]:
+    """Read relationships from a dataframe."""
+    columns = zip(
+        column_to_str(df, id_col),
+        _short_ids(df, short_id_col),
+        column_to_str(df, source_col),
+        column_to_str(df, target_col),
+        column_to_optional_str(df, description_col),
+        column_to_optional_vectors(df, description_embedding_col),
+        column_to_optional_float(df, weight_col),
+        column_to_optional_list(df, text_unit_ids_col, item_type=str),
+        column_to_optional_list(df, document_ids_col, item_type=str),
+        column_to_attributes(df, attributes_cols),
+        strict=True,
+    )
+    return [
+        Relationship(
+            id=item_id,
+            short_id=short_id,
+            source=source,
+            target=target,
+            description=description,
+            description_embedding=description_embedding,
+            weight=weight,
+            text_unit_ids=text_unit_ids,
+            document_ids=document_ids,
+            attributes=attributes,
+        )
+        for (
+            item_id,
+            short_id,
+            source,
+            target,
+            description,
+            description_embedding,
+            weight,
+            text_unit_ids,
+            document_ids,
+            attributes,
+        ) in columns
+    ]
+
+
+def read_community_reports(
+    df: pd.DataFrame,
+    id_col: str = "id",
+    short_id_col: str | None = "short_id",
+    title_col: str = "title",
+    community_col: str = "community",
+    summary_col: str = "summary",
+    content_col: str = "full_content",
+    rank_col: str | None = "rank",
+    summary_embedding_col: str | None = "summary_embedding",
+    content_embedding_col: str | None = "full_content_embedding",
+    attributes_cols: list[str] | None = None,
+) -> list[CommunityReport]:
+    """Read community reports from a dataframe."""
+    columns = zip(
+        column_to_str(df, id_col),
+        _short_ids(df, short_id_col),
+        column_to_str(df, title_col),
+        column_to_str(df, community_col),
+        column_to_str(df, summary_col),
+        column_to_str(df, content_col),
+        column_to_optional_float(df, rank_col),
+        column_to_optional_vectors(df, summary_embedding_col),
+        column_to_optional_vectors(df, content_embedding_col),
+        column_to_attributes(df, attributes_cols),
+        strict=True,
+    )
+    return [
+        CommunityReport(
+            id=item_id,
+            short_id=short_id,
+            title=title,
+            community_id=community_id,
+            summary=summary,
+            full_content=full_content,
+            rank=rank,
+            summary_embedding=summary_embedding,
+            full_content_embedding=full_content_embedding,
+            attributes=attributes,
+        )
+        for (
+            item_id,
+            short_id,
+            title,
+            community_id,
+            summary,
+            full_content,
+            rank,
+            summary_embedding,
+            full_content_embedding,
+            attributes,
+        ) in columns
+    ]
+
+
+def read_text_units(
+    df: pd.DataFrame,
+    id_col: str = "id",
+    short_id_col: str | None = "short_id",
+    text_col: str = "text",
+    entities_col: str | None = "entity_ids",
+    relationships_col: str | None = "relationship_ids",
+    covariates_col: str | None = "covariate_ids",
+    tokens_col: str | None = "n_tokens",
+    document_ids_col: str | None = "document_ids",
+    embedding_col: str | None = "text_embedding",
+    attributes_cols: list[str] | None = None,
+) -> list[TextUnit]:
+    """Read text units from a dataframe."""
+    columns = zip(
+        column_to_str(df, id_col),
+        _short_ids(df, short_id_col),
+        column_to_str(df, text_col),
+        column_to_optional_list(df, entities_col, item_type=str),
+        column_to_optional_list(df, relationships_col, item_type=str),
+        column_to_optional_dict(df, covariates_col, key_type=str, value_type=str),
+        column_to_optional_vectors(df, embedding_col),
+        column_to_optional_int(df, tokens_col),
+        column_to_optional_list(df, document_ids_col, item_type=str),
+        column_to_attributes(df, attributes_cols),
+        strict=True,
+    )
+    return [
+        TextUnit(
+            id=item_id,
+            short_id=short_id,
+            text=text,
+            entity_ids=entity_ids,
+            relationship_ids=relationship_ids,
+            covariate_ids=covariate_ids,
+            text_embedding=text_embedding,  # type: ignore
+            n_tokens=n_tokens,
+            document_ids=document_ids,
+            attributes=attributes,
+        )
+        for (
+            item_id,
+            short_id,
+            text,
+            entity_ids,
+            relationship_ids,
+            covariate_ids,
+            text_embedding,
+            n_tokens,
+            document_ids,
+            attributes,
+        ) in columns
+    ]
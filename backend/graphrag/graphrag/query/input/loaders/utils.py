@@ -243,3 +243,192 @@ def to_optional_dict(
 
     msg = f"Column {column_name} not found in data"
     raise ValueError(msg)
+
+
+def column_to_str(df: pd.DataFrame, column_name: str | None) -> list[str]:
+    """Convert a whole column to a list of strings."""
+    if column_name is None:
+        msg = "Column name is None"
+        raise ValueError(msg)
+
+    if column_name in df:
+        return [str(value) for value in df[column_name].to_list()]
+    msg = f"Column {column_name} not found in data"
+    raise ValueError(msg)
+
+
+def column_to_optional_str(
+    df: pd.DataFrame, column_name: str | None
+) -> list[str | None]:
+    """Convert a whole column to a list of optional strings."""
+    if column_name is None:
+        msg = "Column name is None"
+        raise ValueError(msg)
+
+    if column_name in df:
+        return [
+            None if value is None else str(value)
+            for value in df[column_name].to_list()
+        ]
+    msg = f"Column {column_name} not found in data"
+    raise ValueError(msg)
+
+
+def column_to_optional_list(
+    df: pd.DataFrame, column_name: str | None, item_type: type | None = None
+) -> list[list | None]:
+    """
+    Convert a whole column to a list of optional lists.
+
+    Items are checked against `item_type` like `to_optional_list` does.
+    """
+    if column_name is None or column_name not in df:
+        return [None] * len(df)
+
+    result: list[list | None] = []
+    for value in df[column_name].to_list():
+        if value is None:
+            result.append(None)
+            continue
+        if isinstance(value, np.ndarray):
+            value = value.tolist()
+        if not isinstance(value, list):
+            msg = f"value is not a list: {value} ({type(value)})"
+            raise ValueError(msg)
+        if item_type is not None:
+            for v in value:
+                if not isinstance(v, item_type):
+                    msg = f"list item has item that is not {item_type}: {v} ({type(v)})"
+                    raise TypeError(msg)
+        result.append(value)
+    return result
+
+
+def column_to_optional_int(
+    df: pd.DataFrame, column_name: str | None
+) -> list[int | None]:
+    """Convert a whole column to a list of optional ints."""
+    if column_name is None:
+        return [None] * len(df)
+
+    if column_name not in df:
+        msg = f"Column {column_name} not found in data"
+        raise ValueError(msg)
+
+    result: list[int | None] = []
+    for value in df[column_name].to_list():
+        if value is None:
+            result.append(None)
+            continue
+        if isinstance(value, float):
+            value = int(value)
+        if not isinstance(value, int):
+            msg = f"value is not an int: {value} ({type(value)})"
+            raise ValueError(msg)
+        result.append(value)
+    return result
+
+
+def column_to_optional_float(
+    df: pd.DataFrame, column_name: str | None
+) -> list[float | None]:
+    """Convert a whole column to a list of optional floats."""
+    if column_name is None:
+        return [None] * len(df)
+
+    if column_name not in df:
+        msg = f"Column {column_name} not found in data"
+        raise ValueError(msg)
+
+    values = df[column_name].to_list()
+    for value in values:
+        if value is not None and not isinstance(value, float):
+            msg = f"value is not a float: {value} ({type(value)})"
+            raise ValueError(msg)
+    return values
+
+
+def column_to_optional_dict(
+    df: pd.DataFrame,
+    column_name: str | None,
+    key_type: type | None = None,
+    value_type: type | None = None,
+) -> list[dict | None]:
+    """Convert a whole column to a list of optional dicts."""
+    if column_name is None:
+        return [None] * len(df)
+
+    if column_name not in df:
+        msg = f"Column {column_name} not found in data"
+        raise ValueError(msg)
+
+    values = df[column_name].to_list()
+    for value in values:
+        if value is None:
+            continue
+        if not isinstance(value, dict):
+            msg = f"value is not a dict: {value} ({type(value)})"
+            raise TypeError(msg)
+        if key_type is not None:
+            for v in value:
+                if not isinstance(v, key_type):
+                    msg = f"dict key has item that is not {key_type}: {v} ({type(v)})"
+                    raise TypeError(msg)
+        if value_type is not None:
+            for v in value.values():
+                if not isinstance(v, value_type):
+                    msg = (
+                        f"dict value has item that is not {value_type}: {v} ({type(v)})"
+                    )
+                    raise TypeError(msg)
+    return values
+
+
+def column_to_matrix(
+    df: pd.DataFrame, column_name: str | None, dtype: type = np.float32
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Stack a column of vectors into one contiguous matrix.
+
+    Returns the matrix of all non-null vectors and a boolean mask of the rows
+    they came from.
+    """
+    if column_name is None or column_name not in df:
+        return np.empty((0, 0), dtype=dtype), np.zeros(len(df), dtype=bool)
+
+    values = df[column_name].to_numpy()
+    mask = np.fromiter((value is not None for value in values), bool, len(values))
+    if not mask.any():
+        return np.empty((0, 0), dtype=dtype), mask
+    try:
+        matrix = np.array(list(values[mask]), dtype=dtype)
+    except ValueError as e:
+        msg = f"Column {column_name} does not hold vectors of equal length"
+        raise ValueError(msg) from e
+    return matrix, mask
+
+
+def column_to_optional_vectors(
+    df: pd.DataFrame, column_name: str | None, dtype: type = np.float64
+) -> list[list[float] | None]:
+    """
+    Convert a column of vectors to lists through a single contiguous matrix.
+
+    The default float64 keeps the values the row-wise loaders return.
+    """
+    matrix, mask = column_to_matrix(df, column_name, dtype=dtype)
+    rows = iter(matrix.tolist())
+    return [next(rows) if present else None for present in mask]
+
+
+def column_to_attributes(
+    df: pd.DataFrame, attributes_cols: list[str] | None
+) -> list[dict | None]:
+    """Zip attribute columns into one dict per row."""
+    if not attributes_cols:
+        return [None] * len(df)
+    columns = [
+        df[col].to_list() if col in df else [None] * len(df)
+        for col in attributes_cols
+    ]
+    return [dict(zip(attributes_cols, values, strict=True)) for values in zip(*columns)]
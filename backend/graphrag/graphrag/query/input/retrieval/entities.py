@@ -9,7 +9,7 @@ from typing import Any, cast
 
 import pandas as pd
 
-from graphrag.model import Entity
+from graphrag.model import Entity, Relationship
 
 
 def get_entity_by_key(
@@ -28,6 +28,77 @@ def get_entity_by_key(
     return None
 
 
+class EntityIndex:
+    """
+    Prebuilt lookup tables over a fixed list of entities.
+
+    Gives the same answers as `get_entity_by_key`, `get_entity_by_name` and the
+    relationship scan in `find_nearest_neighbors_by_entity_rank`, but with
+    dictionary lookups instead of a pass over every entity per query.
+    """
+
+    def __init__(
+        self,
+        entities: list[Entity],
+        relationships: Iterable[Relationship] | None = None,
+    ):
+        self.entities = entities
+        self._positions = {id(entity): pos for pos, entity in enumerate(entities)}
+        self._by_key: dict[str, dict[Any, Entity]] = {}
+        self._by_title: dict[str, list[Entity]] = {}
+        for entity in entities:
+            self._by_title.setdefault(entity.title, []).append(entity)
+        for key in ("id", "short_id", "title"):
+            self._index_key(key)
+
+        self._neighbors: dict[str, set[str]] = {}
+        for rel in relationships or []:
+            self._neighbors.setdefault(rel.source, set()).add(rel.target)
+            self._neighbors.setdefault(rel.target, set()).add(rel.source)
+
+    def _index_key(self, key: str) -> dict[Any, Entity]:
+        lookup: dict[Any, Entity] = {}
+        for entity in self.entities:
+            lookup.setdefault(getattr(entity, key), entity)
+        self._by_key[key] = lookup
+        return lookup
+
+    def get_by_key(self, key: str, value: str | int) -> Entity | None:
+        """Get entity by key, accepting dashed or undashed UUIDs like `get_entity_by_key`."""
+        lookup = self._by_key.get(key)
+        if lookup is None:
+            lookup = self._index_key(key)
+        if isinstance(value, str) and is_valid_uuid(value):
+            candidates = [
+                entity
+                for entity in (lookup.get(value), lookup.get(value.replace("-", "")))
+                if entity is not None
+            ]
+            # the linear scan returns whichever form comes first in the list
+            return min(candidates, key=self.position, default=None)
+        return lookup.get(value)
+
+    def get_by_name(self, entity_name: str) -> list[Entity]:
+        """Get entities by name."""
+        return list(self._by_title.get(entity_name, []))
+
+    def neighbor_names(self, entity_name: str) -> set[str]:
+        """
+        Get the names of entities sharing a relationship with the given entity.
+
+        The entity itself is included when it has any relationship, as in the
+        source/target union the relationship scan produces.
+        """
+        neighbors = self._neighbors.get(entity_name)
+        if not neighbors:
+            return set()
+        return {entity_name, *neighbors}
+
+    def position(self, entity: Entity) -> int:
+        """Get the position of an entity in the indexed list."""
+        return self._positions[id(entity)]
+
+
 def get_entity_by_name(entities: Iterable[Entity], entity_name: str) -> list[Entity]:
     """Get entities by name."""
     return [entity for entity in entities if entity.title == entity_name]
@@ -3,17 +3,47 @@
 
 """Text Utilities for LLM."""
 
+import hashlib
+import threading
+from collections import OrderedDict
 from collections.abc import Iterator
 from itertools import islice
 
 import tiktoken
 
+TOKEN_COUNT_CACHE_SIZE = 8192
+"""Number of distinct strings whose token counts are kept by `num_tokens`."""
+
+_token_counts: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+_token_counts_lock = threading.Lock()
+
 
 def num_tokens(text: str, token_encoder: tiktoken.Encoding | None = None) -> int:
-    """Return the number of tokens in the given text."""
+    """
+    Return the number of tokens in the given text.
+
+    Context builders count the same report, entity and text unit rows on every
+    query, so counts are memoized per encoder in a bounded LRU. It is keyed on
+    a 16 byte digest of the text rather than the text itself, which keeps its
+    size independent of the length of the strings counted.
+    """
     if token_encoder is None:
         token_encoder = tiktoken.get_encoding("cl100k_base")
-    return len(token_encoder.encode(text))  # type: ignore
+    key = (
+        token_encoder.name,
+        hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(),
+    )
+    with _token_counts_lock:
+        count = _token_counts.get(key)
+        if count is not None:
+            _token_counts.move_to_end(key)
+            return count
+    count = len(token_encoder.encode(text))  # type: ignore
+    with _token_counts_lock:
+        _token_counts[key] = count
+        while len(_token_counts) > TOKEN_COUNT_CACHE_SIZE:
+            _token_counts.popitem(last=False)
+    return count
 
 
 def batched(iterable: Iterator, n: int):
@@ -0,0 +1,31 @@
+"""GraphRAG Orchestration YandexGPT Wrappers."""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .chat_yandex import DEFAULT_MAX_WORKERS, YandexGPTChat, shared_chat
+    from .embedding import YandexEmbedding
+
+__all__ = [
+    "DEFAULT_MAX_WORKERS",
+    "YandexEmbedding",
+    "YandexGPTChat",
+    "shared_chat",
+]
+
+# the chat client pulls in the YandexGPT SDK, which is slow to import, so
+# submodules are only loaded when one of their names is first accessed
+_LAZY_ATTRIBUTES = {
+    "DEFAULT_MAX_WORKERS": ".chat_yandex",
+    "YandexGPTChat": ".chat_yandex",
+    "YandexEmbedding": ".embedding",
+    "shared_chat": ".chat_yandex",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        return getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -0,0 +1,195 @@
+"""Executor-backed YandexGPT chat implementation."""
+
+import asyncio
+import threading
+from collections.abc import AsyncGenerator, Generator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any
+
+from yandex_cloud_ml_sdk import YCloudML
+
+from graphrag.query.llm.base import BaseLLM, BaseLLMCallback
+
+DEFAULT_MAX_WORKERS = 16
+
+_STREAM_END = object()
+
+_shared_clients: dict[tuple[str, str], "YandexGPTChat"] = {}
+_shared_clients_lock = threading.Lock()
+
+
+class YandexGPTChat(BaseLLM):
+    """
+    Wrapper for YandexGPT completion models.
+
+    The SDK client is synchronous, so async calls are dispatched to a dedicated
+    thread pool. This keeps the event loop free while a completion is running and
+    bounds the number of in-flight requests by `max_workers`.
+    """
+
+    def __init__(
+        self,
+        folder_id: str,
+        token: str,
+        model: str = "yandexgpt",
+        model_version: str | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        self.model = model
+        self.model_version = model_version
+        self.sdk = YCloudML(folder_id=folder_id, auth=token)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="yandexgpt"
+        )
+
+    def generate(
+        self,
+        messages: str | list[Any],
+        streaming: bool = True,
+        callbacks: list[BaseLLMCallback] | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Generate text."""
+        model = self._configured_model(**kwargs)
+        response = model.run(_to_sdk_messages(messages))
+        text = response[0].text
+        if callbacks:
+            for callback in callbacks:
+                callback.on_llm_new_token(text)
+        return text
+
+    def stream_generate(
+        self,
+        messages: str | list[Any],
+        callbacks: list[BaseLLMCallback] | None = None,
+        **kwargs: Any,
+    ) -> Generator[str, None, None]:
+        """Generate text with streaming, yielding only the newly generated part."""
+        model = self._configured_model(**kwargs)
+        emitted = 0
+        for partial_result in model.run_stream(_to_sdk_messages(messages)):
+            text = partial_result[0].text
+            delta = text[emitted:]
+            emitted = len(text)
+            if not delta:
+                continue
+            if callbacks:
+                for callback in callbacks:
+                    callback.on_llm_new_token(delta)
+            yield delta
+
+    async def agenerate(
+        self,
+        messages: str | list[Any],
+        streaming: bool = True,
+        callbacks: list[BaseLLMCallback] | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Generate text asynchronously in the adapter thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            partial(self.generate, messages, callbacks=callbacks, **kwargs),
+        )
+
+    async def astream_generate(
+        self,
+        messages: str | list[Any],
+        callbacks: list[BaseLLMCallback] | None = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Generate text asynchronously with streaming from the adapter thread pool.
+
+        Closing the generator early, e.g. when the client disconnects, stops
+        the producer thread at its next delta and closes the SDK stream.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+
+        def put(item: Any) -> None:
+            if stop.is_set():
+                return
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                # the event loop closed while the stream was still running
+                stop.set()
+
+        def produce() -> None:
+            stream = self.stream_generate(messages, callbacks=callbacks, **kwargs)
+            try:
+                for delta in stream:
+                    if stop.is_set():
+                        break
+                    put(delta)
+            except Exception as exc:  # noqa: BLE001
+                put(exc)
+            finally:
+                stream.close()
+                put(_STREAM_END)
+
+        producer = loop.run_in_executor(self._executor, produce)
+        try:
+            while (item := await queue.get()) is not _STREAM_END:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+            await producer
+        finally:
+            stop.set()
+
+    def close(self) -> None:
+        """Shut down the adapter thread pool."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _configured_model(
+        self,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+        **kwargs: Any,
+    ):
+        if self.model_version:
+            model = self.sdk.models.completions(
+                self.model, model_version=self.model_version
+            )
+        else:
+            model = self.sdk.models.completions(self.model)
+        config = {}
+        if max_tokens is not None:
+            config["max_tokens"] = max_tokens
+        if temperature is not None:
+            config["temperature"] = temperature
+        return model.configure(**config) if config else model
+
+
+def shared_chat(folder_id: str, token: str) -> YandexGPTChat:
+    """
+    The process-wide YandexGPTChat for a folder and token, created on first use.
+
+    Callers that do not manage a client of their own share this one, so they
+    do not each start, and leak, a thread pool.
+    """
+    key = (folder_id, token)
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = _shared_clients[key] = YandexGPTChat(
+                folder_id=folder_id, token=token
+            )
+        return client
+
+
+def _to_sdk_messages(messages: str | list[Any]) -> str | list[Any]:
+    """Convert OpenAI-style `content` messages to the SDK's `text` field."""
+    if isinstance(messages, str):
+        return messages
+    converted = []
+    for message in messages:
+        if isinstance(message, dict) and "content" in message:
+            message = {**message, "text": message["content"]}
+            message.pop("content")
+        converted.append(message)
+    return converted
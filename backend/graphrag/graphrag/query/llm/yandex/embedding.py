@@ -0,0 +1,182 @@
+"""Pooled YandexGPT text embedding client."""
+
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import httpx
+from tenacity import (
+    AsyncRetrying,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from graphrag.query.llm.base import BaseTextEmbedding
+
+DEFAULT_EMBEDDING_URL = (
+    "https://llm.api.cloud.yandex.net:443/foundationModels/v1/textEmbedding"
+)
+DEFAULT_MAX_CONNECTIONS = 16
+DEFAULT_CACHE_SIZE = 4096
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return False
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    # the waiters re-raise it, this keeps a task nobody waits on anymore quiet
+    if not task.cancelled():
+        task.exception()
+
+
+class YandexEmbedding(BaseTextEmbedding):
+    """
+    Wrapper for the YandexGPT text embedding endpoint.
+
+    Sync and async calls go through persistent connection pools. Vectors of
+    recent texts are kept in an LRU shared by both paths, and concurrent async
+    requests for the same text wait on a single HTTP call. The endpoint embeds
+    one text per request, so `aembed_batch` fans out over the pool, bounded by
+    `max_connections`.
+    """
+
+    def __init__(
+        self,
+        folder_id: str,
+        token: str,
+        model: str = "text-search-query",
+        model_version: str = "latest",
+        url: str = DEFAULT_EMBEDDING_URL,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        request_timeout: float = 30.0,
+        max_retries: int = 3,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        self.model_uri = f"emb://{folder_id}/{model}/{model_version}"
+        self.url = url
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        self.cache_size = cache_size
+
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "x-folder-id": folder_id,
+        }
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        self._client = httpx.Client(
+            headers=headers, limits=limits, timeout=request_timeout
+        )
+        self._async_client = httpx.AsyncClient(
+            headers=headers, limits=limits, timeout=request_timeout
+        )
+        self._cache: OrderedDict[str, list[float]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._in_flight: dict[str, asyncio.Task] = {}
+
+    def embed(self, text: str, **kwargs: Any) -> list[float]:
+        """Embed a text string."""
+        cached = self._cache_get(text)
+        if cached is not None:
+            return cached
+        for attempt in Retrying(
+            retry=retry_if_exception(_is_retryable),
+            stop=stop_after_attempt(self.max_retries),
+            wait=wait_exponential_jitter(max=10),
+            reraise=True,
+        ):
+            with attempt:
+                response = self._client.post(self.url, json=self._payload(text))
+                response.raise_for_status()
+        embedding = response.json()["embedding"]
+        self._cache_put(text, embedding)
+        return embedding
+
+    async def aembed(self, text: str, **kwargs: Any) -> list[float]:
+        """Embed a text string asynchronously, sharing calls for identical texts."""
+        cached = self._cache_get(text)
+        if cached is not None:
+            return cached
+
+        # the request runs as its own task and every caller, the first one
+        # included, waits on it through a shield, so a caller that is
+        # cancelled only stops waiting and the others still get the vector
+        task = self._in_flight.get(text)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(text))
+            task.add_done_callback(_retrieve_exception)
+            self._in_flight[text] = task
+        return await asyncio.shield(task)
+
+    async def aembed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed several texts concurrently, preserving their order."""
+        semaphore = asyncio.Semaphore(self.max_connections)
+
+        async def embed_one(text: str) -> list[float]:
+            async with semaphore:
+                return await self.aembed(text)
+
+        return await asyncio.gather(*(embed_one(text) for text in texts))
+
+    def close(self) -> None:
+        """Close the sync connection pool."""
+        self._client.close()
+
+    async def aclose(self) -> None:
+        """Close both connection pools."""
+        self._client.close()
+        await self._async_client.aclose()
+
+    async def _fetch(self, text: str) -> list[float]:
+        try:
+            embedding = await self._request(text)
+        finally:
+            del self._in_flight[text]
+        self._cache_put(text, embedding)
+        return embedding
+
+    async def _request(self, text: str) -> list[float]:
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception(_is_retryable),
+            stop=stop_after_attempt(self.max_retries),
+            wait=wait_exponential_jitter(max=10),
+            reraise=True,
+        ):
+            with attempt:
+                response = await self._async_client.post(
+                    self.url, json=self._payload(text)
+                )
+                response.raise_for_status()
+        return response.json()["embedding"]
+
+    def _payload(self, text: str) -> dict[str, str]:
+        return {"modelUri": self.model_uri, "text": text}
+
+    def _cache_get(self, text: str) -> list[float] | None:
+        if not self.cache_size:
+            return None
+        with self._cache_lock:
+            embedding = self._cache.get(text)
+            if embedding is not None:
+                self._cache.move_to_end(text)
+            return embedding
+
+    def _cache_put(self, text: str, embedding: list[float]) -> None:
+        if not self.cache_size:
+            return
+        with self._cache_lock:
+            self._cache[text] = embedding
+            self._cache.move_to_end(text)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
@@ -27,11 +27,16 @@ class GlobalCommunityContext(GlobalContextBuilder):
         entities: list[Entity] | None = None,
         token_encoder: tiktoken.Encoding | None = None,
         random_state: int = 86,
+        cache_context: bool = False,
     ):
         self.community_reports = community_reports
         self.entities = entities
         self.token_encoder = token_encoder
         self.random_state = random_state
+        self.cache_context = cache_context
+        self._context_plans: dict[
+            tuple, tuple[str | list[str], dict[str, pd.DataFrame]]
+        ] = {}
 
     def build_context(
         self,
@@ -69,10 +74,7 @@ class GlobalCommunityContext(GlobalContextBuilder):
             if conversation_history_context != "":
                 final_context_data = conversation_history_context_data
 
-        community_context, community_context_data = build_community_context(
-            community_reports=self.community_reports,
-            entities=self.entities,
-            token_encoder=self.token_encoder,
+        community_context, community_context_data = self._build_community_context(
             use_community_summary=use_community_summary,
             column_delimiter=column_delimiter,
             shuffle_data=shuffle_data,
@@ -83,9 +85,7 @@ class GlobalCommunityContext(GlobalContextBuilder):
             community_weight_name=community_weight_name,
             normalize_community_weight=normalize_community_weight,
             max_tokens=max_tokens,
-            single_batch=False,
             context_name=context_name,
-            random_state=self.random_state,
         )
 
         # Prepare context_prefix based on whether conversation_history_context exists
@@ -105,3 +105,30 @@ class GlobalCommunityContext(GlobalContextBuilder):
         final_context_data.update(community_context_data)
 
         return final_context, final_context_data
+
+    def _build_community_context(
+        self, **params: Any
+    ) -> tuple[str | list[str], dict[str, pd.DataFrame]]:
+        """
+        Build the community report batches, reusing a cached plan if enabled.
+
+        With a fixed set of reports and entities and a seeded shuffle, the batches
+        only depend on the build parameters, so the finished batch strings and
+        record frames are kept per parameter set. The cached frames are shared
+        between calls and must not be modified by callers.
+        """
+        key = tuple(sorted(params.items()))
+        if self.cache_context and key in self._context_plans:
+            return self._context_plans[key]
+
+        plan = build_community_context(
+            community_reports=self.community_reports,
+            entities=self.entities,
+            token_encoder=self.token_encoder,
+            single_batch=False,
+            random_state=self.random_state,
+            **params,
+        )
+        if self.cache_context:
+            self._context_plans[key] = plan
+        return plan
@@ -2,18 +2,21 @@ import asyncio
 import json
 import logging
 import time
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
 from dataclasses import dataclass
 from typing import Any
 
 import pandas as pd
 import tiktoken
-from yandex_cloud_ml_sdk import YCloudML
 
 from graphrag.callbacks.global_search_callbacks import GlobalSearchLLMCallback
 from graphrag.query.context_builder.builders import GlobalContextBuilder
 from graphrag.query.context_builder.conversation_history import (
     ConversationHistory,
 )
+from graphrag.query.llm.base import BaseLLM
+from graphrag.query.llm.text_utils import num_tokens
 from graphrag.query.structured_search.base import BaseSearch, SearchResult
 from graphrag.query.structured_search.global_search.map_system_prompt import (
     MAP_SYSTEM_PROMPT,
@@ -43,6 +46,22 @@ class GlobalSearchResult(SearchResult):
     map_responses: list[SearchResult]
     reduce_context_data: str | list[pd.DataFrame] | dict[str, pd.DataFrame]
     reduce_context_text: str | list[str] | dict[str, str]
+    # map batches whose LLM call failed; their key points are missing from the answer
+    failed_map_batches: int = 0
+
+
+@dataclass
+class GlobalSearchMapProgress:
+    """A map batch that finished during a streamed global search."""
+
+    completed: int
+    total: int
+    result: SearchResult
+    failed: bool = False
+
+
+class GlobalSearchMapError(RuntimeError):
+    """Every map batch of a global search failed."""
 
 
 class GlobalSearch(BaseSearch):
@@ -66,6 +85,7 @@ class GlobalSearch(BaseSearch):
         reduce_llm_params: dict[str, Any] = DEFAULT_REDUCE_LLM_PARAMS,
         context_builder_params: dict[str, Any] | None = None,
         concurrent_coroutines: int = 32,
+        llm: BaseLLM | None = None,
     ):
         super().__init__(
             llm="a",
@@ -82,7 +102,12 @@ class GlobalSearch(BaseSearch):
         self.folder_id = folder_id
         self.token = token
         self.token_encoder = token_encoder
-        self.sdk = YCloudML(folder_id=folder_id, auth=token)
+        if llm is None:
+            # the SDK is slow to import, only load it when no client is passed
+            from graphrag.query.llm.yandex import shared_chat
+
+            llm = shared_chat(folder_id=folder_id, token=token)
+        self.llm = llm
         self.map_llm_params = map_llm_params
         self.reduce_llm_params = reduce_llm_params
         if json_mode:
@@ -105,33 +130,134 @@ class GlobalSearch(BaseSearch):
             conversation_history=conversation_history, **self.context_builder_params
         )
 
-        map_responses = []
-        for data in context_chunks:
-            map_prompt = self.map_system_prompt.format(context_data=data)
+        if self.callbacks:
+            for callback in self.callbacks:
+                callback.on_map_response_start(context_chunks)  # type: ignore
 
-            raw_response = await self._generate_text(
-                prompt=f"{map_prompt}\n\nUser Query: {query}",
-                max_tokens=self.map_llm_params["max_tokens"],
-                temperature=self.map_llm_params["temperature"],
-            )
+        results = await asyncio.gather(*[
+            self._indexed_map_response(index, data, query)
+            for index, data in enumerate(context_chunks)
+        ])
+        map_responses = [result for _, result, _ in results]
+        failed_map_batches = sum(failed for _, _, failed in results)
+        self._check_map_failures(failed_map_batches, len(context_chunks))
 
-            parsed_response = self.parse_search_response(raw_response)
+        if self.callbacks:
+            for callback in self.callbacks:
+                callback.on_map_response_end(map_responses)
 
-            map_responses.append(
-                SearchResult(
-                    response=parsed_response,
-                    context_data=data,
-                    context_text=data,
-                    completion_time=time.time() - start_time,
-                    llm_calls=1,
-                    prompt_tokens=self._count_tokens(map_prompt),
-                )
-            )
+        reduce_prompt = self._build_reduce_prompt(map_responses)
+        reduce_response = await self._generate_text(
+            prompt=reduce_prompt,
+            max_tokens=self.reduce_llm_params["max_tokens"],
+            temperature=self.reduce_llm_params["temperature"],
+        )
+
+        return GlobalSearchResult(
+            response=reduce_response,
+            context_data=context_records,
+            context_text=context_chunks,
+            map_responses=map_responses,
+            reduce_context_data=reduce_prompt,
+            reduce_context_text=reduce_prompt,
+            completion_time=time.time() - start_time,
+            llm_calls=len(context_chunks),
+            prompt_tokens=self._count_tokens(reduce_prompt),
+            failed_map_batches=failed_map_batches,
+        )
+
+    async def astream_search(
+        self,
+        query: str,
+        conversation_history: ConversationHistory | None = None,
+        map_progress: bool = False,
+    ) -> AsyncGenerator:
+        """
+        Stream a global search.
+
+        The context records are yielded first and the reduce response follows
+        as text deltas. With `map_progress` a `GlobalSearchMapProgress` is also
+        yielded for every map batch, in completion order, before the first delta.
+        Raises `GlobalSearchMapError` before the reduce step if every batch failed.
+        """
+        context_chunks, context_records = self.context_builder.build_context(
+            conversation_history=conversation_history, **self.context_builder_params
+        )
+        yield context_records
+
+        if self.callbacks:
+            for callback in self.callbacks:
+                callback.on_map_response_start(context_chunks)  # type: ignore
+
+        map_responses: list[SearchResult] = [None] * len(context_chunks)  # type: ignore
+        failed_map_batches = 0
+        tasks = [
+            asyncio.ensure_future(self._indexed_map_response(index, data, query))
+            for index, data in enumerate(context_chunks)
+        ]
+        try:
+            for completed, future in enumerate(asyncio.as_completed(tasks), start=1):
+                index, result, failed = await future
+                map_responses[index] = result
+                failed_map_batches += failed
+                if map_progress:
+                    yield GlobalSearchMapProgress(
+                        completed=completed,
+                        total=len(context_chunks),
+                        result=result,
+                        failed=failed,
+                    )
+        finally:
+            # the consumer went away (e.g. the client disconnected): batches
+            # still waiting for the semaphore or a worker thread are dropped
+            for task in tasks:
+                task.cancel()
+        self._check_map_failures(failed_map_batches, len(context_chunks))
 
         if self.callbacks:
             for callback in self.callbacks:
                 callback.on_map_response_end(map_responses)
 
+        async with aclosing(
+            self.llm.astream_generate(
+                self._build_reduce_prompt(map_responses),
+                max_tokens=self.reduce_llm_params["max_tokens"],
+                temperature=self.reduce_llm_params["temperature"],
+            )
+        ) as deltas:
+            async for delta in deltas:
+                yield delta
+
+    async def _indexed_map_response(
+        self, index: int, context_data: str, query: str
+    ) -> tuple[int, SearchResult, bool]:
+        """Run one map batch; a batch whose LLM call fails yields no key points."""
+        try:
+            result = await self._map_response_single_batch(context_data, query)
+        except Exception:
+            log.exception("Map batch %d of global search failed", index)
+            return (
+                index,
+                SearchResult(
+                    response=[],
+                    context_data=context_data,
+                    context_text=context_data,
+                    completion_time=0.0,
+                    llm_calls=1,
+                    prompt_tokens=0,
+                ),
+                True,
+            )
+        return index, result, False
+
+    @staticmethod
+    def _check_map_failures(failed: int, total: int) -> None:
+        if total and failed == total:
+            msg = f"All {total} map batches of the global search failed"
+            raise GlobalSearchMapError(msg)
+
+    def _build_reduce_prompt(self, map_responses: list[SearchResult]) -> str:
+        """Rank the map key points and fit them into the reduce prompt."""
         key_points = []
         for index, response in enumerate(map_responses):
             if not isinstance(response.response, list):
@@ -163,35 +289,42 @@ class GlobalSearch(BaseSearch):
                 point["answer"],
             ]
             formatted_response_text = "\n".join(formatted_response_data)
-            if (
-                total_tokens + self._count_tokens(formatted_response_text)
-                > self.max_data_tokens
-            ):
+            formatted_response_tokens = self._count_tokens(formatted_response_text)
+            if total_tokens + formatted_response_tokens > self.max_data_tokens:
                 break
             data.append(formatted_response_text)
-            total_tokens += self._count_tokens(formatted_response_text)
+            total_tokens += formatted_response_tokens
         text_data = "\n\n".join(data)
 
-        reduce_prompt = self.reduce_system_prompt.format(
+        return self.reduce_system_prompt.format(
             report_data=text_data,
             response_type=self.response_type,
         )
-        reduce_response = await self._generate_text(
-            prompt=reduce_prompt,
-            max_tokens=self.reduce_llm_params["max_tokens"],
-            temperature=self.reduce_llm_params["temperature"],
-        )
 
-        return GlobalSearchResult(
-            response=reduce_response,
-            context_data=context_records,
-            context_text=context_chunks,
-            map_responses=map_responses,
-            reduce_context_data=reduce_prompt,
-            reduce_context_text=reduce_prompt,
+    async def _map_response_single_batch(
+        self,
+        context_data: str,
+        query: str,
+    ) -> SearchResult:
+        """Generate answer for a single chunk of community reports."""
+        start_time = time.time()
+        map_prompt = self.map_system_prompt.format(context_data=context_data)
+        async with self.semaphore:
+            raw_response = await self._generate_text(
+                prompt=f"{map_prompt}\n\nUser Query: {query}",
+                max_tokens=self.map_llm_params["max_tokens"],
+                temperature=self.map_llm_params["temperature"],
+            )
+        # a response that does not parse scores zero, parse_search_response logs it
+        parsed_response = self.parse_search_response(raw_response)
+
+        return SearchResult(
+            response=parsed_response,
+            context_data=context_data,
+            context_text=context_data,
             completion_time=time.time() - start_time,
-            llm_calls=len(context_chunks),
-            prompt_tokens=self._count_tokens(reduce_prompt),
+            llm_calls=1,
+            prompt_tokens=self._count_tokens(map_prompt),
         )
 
     def search(
@@ -205,18 +338,15 @@ class GlobalSearch(BaseSearch):
 
     def _count_tokens(self, text: str) -> int:
         """Count tokens using the provided token encoder."""
-        return len(self.token_encoder.encode(text))
+        return num_tokens(text, self.token_encoder)
 
     async def _generate_text(
         self, prompt: str, max_tokens: int, temperature: float
     ) -> str:
         """Uses YandexGPT to generate a text completion."""
-        model = self.sdk.models.completions("yandexgpt").configure(
-            max_tokens=max_tokens,
-            temperature=temperature,
+        return await self.llm.agenerate(
+            prompt, max_tokens=max_tokens, temperature=temperature
         )
-        response = model.run(prompt)
-        return response[0].text
 
     def parse_search_response(self, search_response: str) -> list[dict[str, Any]]:
         """Parse the search response JSON and return a list of key points."""
@@ -36,6 +36,7 @@ from graphrag.query.context_builder.source_context import (
     build_text_unit_context,
     count_relationships,
 )
+from graphrag.query.input.retrieval.entities import EntityIndex
 from graphrag.query.input.retrieval.community_reports import (
     get_candidate_communities,
 )
@@ -72,6 +73,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
         if text_units is None:
             text_units = []
         self.entities = {entity.id: entity for entity in entities}
+        self.entity_index = EntityIndex(list(self.entities.values()), relationships)
         self.community_reports = {
             community.id: community for community in community_reports  if isinstance(community, CommunityReport)
         }
@@ -147,6 +149,7 @@ class LocalSearchMixedContext(LocalContextBuilder):
             exclude_entity_names=exclude_entity_names,
             k=top_k_mapped_entities,
             oversample_scaler=2,
+            entity_index=self.entity_index,
         )
 
         # build context
@@ -3,6 +3,7 @@
 
 """LocalSearch implementation."""
 
+import asyncio
 import logging
 import time
 from typing import Any
@@ -64,7 +65,9 @@ class LocalSearch(BaseSearch):
         start_time = time.time()
         search_prompt = ""
 
-        context_text, context_records = self.context_builder.build_context(
+        # building the context embeds the query with the blocking embedder call
+        context_text, context_records = await asyncio.to_thread(
+            self.context_builder.build_context,
             query=query,
             conversation_history=conversation_history,
             **kwargs,
@@ -0,0 +1,101 @@
+"""Fill in `prompt_histories.request_hash` for rows written before the answer cache.
+
+Rows saved before migrations/001_prompt_request_hash.sql have no hash, so the
+answer cache never finds them. This hashes them with the API's `request_key`.
+Those rows have no language either, so they are hashed with the default
+language of `PromptRequest`, "english": cache reads for prompts asked in
+another language do not find them. Rows are hashed in id order,
+`--batch-size` rows per transaction; rows that already have a hash are left
+alone, so the script can be stopped and re-run. Run it after 001 and before
+migrations/002_prompt_history_indexes.sql. The database comes from the PG_*
+settings of the API.
+
+Usage (from backend/):
+
+    python scripts/backfill_request_hash.py --batch-size 1000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import asyncpg
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "api"))
+
+from answer_cache import request_key  # noqa: E402
+from settings import settings  # noqa: E402
+
+# `PromptRequest.language` defaults to this, and did before languages were stored
+DEFAULT_LANGUAGE = "english"
+
+SELECT_BATCH = """
+SELECT
+    ph.id,
+    ph.prompt,
+    ph.graph,
+    ph.language,
+    COALESCE(
+        (SELECT array_agg(psn.node)
+         FROM prompt_selected_nodes psn
+         WHERE psn.prompt_id = ph.id),
+        '{}'
+    ) AS nodes
+FROM prompt_histories ph
+WHERE ph.request_hash IS NULL AND ph.prompt IS NOT NULL AND ph.id > $1
+ORDER BY ph.id
+LIMIT $2;
+"""
+
+UPDATE_BATCH = """
+UPDATE prompt_histories AS ph
+SET request_hash = batch.request_hash
+FROM unnest($1::int[], $2::text[]) AS batch (id, request_hash)
+WHERE ph.id = batch.id AND ph.request_hash IS NULL;
+"""
+
+
+async def backfill(args: argparse.Namespace) -> None:
+    conn = await asyncpg.connect(
+        user=settings.PG_USER,
+        password=settings.PG_PASSWORD,
+        host=settings.PG_HOST,
+        port=settings.PG_PORT,
+        database=settings.PG_DATABASE,
+    )
+    start = time.perf_counter()
+    updated = 0
+    last_id = 0
+    try:
+        while rows := await conn.fetch(SELECT_BATCH, last_id, args.batch_size):
+            ids = [row["id"] for row in rows]
+            keys = [
+                request_key(
+                    row["prompt"],
+                    row["nodes"],
+                    row["graph"],
+                    row["language"] or DEFAULT_LANGUAGE,
+                )
+                for row in rows
+            ]
+            async with conn.transaction():
+                await conn.execute(UPDATE_BATCH, ids, keys)
+            updated += len(rows)
+            last_id = ids[-1]
+            print(f"hashed {updated} rows, up to id {last_id}")
+    finally:
+        await conn.close()
+    print(f"hashed {updated} rows in {time.perf_counter() - start:.1f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(backfill(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Measure how long importing the API entry point takes.
+
+Imports api/__main__.py in a fresh interpreter under `python -X importtime`
+and prints the slowest top-level imports. With --budget-ms the script exits
+with status 1 when the total exceeds the budget, so it can run in CI.
+
+Usage (from backend/):
+
+    python scripts/benchmark_api_import.py --top 20 --budget-ms 1500
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+# run from backend/, like the API, so settings find backend/.env; the API
+# modules import each other as top-level modules
+IMPORT_SNIPPET = """
+import importlib.util
+import sys
+sys.path.insert(0, "api")
+spec = importlib.util.spec_from_file_location("api_main", "api/__main__.py")
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+"""
+
+IMPORTTIME_LINE = re.compile(
+    r"^import time:\s+(?P<self>\d+)\s+\|\s+(?P<cumulative>\d+)\s+\|(?P<indent>\s+)(?P<name>\S+)"
+)
+
+
+def measure_import() -> tuple[float, list[tuple[str, int, int, int]]]:
+    """Wall time in seconds and (module, depth, self us, cumulative us) rows."""
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_SNIPPET],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    wall = time.perf_counter() - start
+    if completed.returncode != 0:
+        sys.stderr.write(completed.stderr)
+        raise SystemExit(completed.returncode)
+
+    rows = []
+    for line in completed.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            rows.append((
+                match["name"],
+                (len(match["indent"]) - 1) // 2,
+                int(match["self"]),
+                int(match["cumulative"]),
+            ))
+    return wall, rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    wall, rows = measure_import()
+    top_level = [row for row in rows if row[1] == 0]
+    total_ms = sum(row[3] for row in top_level) / 1000
+
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for name, _, self_us, cumulative_us in sorted(
+        top_level, key=lambda row: row[3], reverse=True
+    )[: args.top]:
+        print(f"{cumulative_us / 1000:14.1f} {self_us / 1000:9.1f}  {name}")
+    print(f"\nimports: {total_ms:.1f} ms, interpreter wall time: {wall * 1000:.1f} ms")
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"import time over budget of {args.budget_ms:.0f} ms", file=sys.stderr)
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Compare graph export with indexing communities and layout against recomputing them.
+
+Runs `scripts/graph.py export` on an indexing output three ways: reusing the
+communities and positions of create_final_nodes (the default), with
+--recompute (igraph Leiden and a seeded refinement of those positions), and
+the way convert_relationships_to_graph.py did it (leidenalg and
+Fruchterman-Reingold from scratch).
+
+Usage (from backend/):
+
+    python scripts/benchmark_graph_export.py --output-dir data/output_gazeta_threshold
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from unittest import mock
+
+import igraph as ig
+import leidenalg as la
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import graph  # noqa: E402
+
+
+def _from_scratch(
+    graph_vertices: int,
+    source: np.ndarray,
+    target: np.ndarray,
+    weight: np.ndarray,
+    resolution: float,
+    seed: int | None,
+    **_,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Clustering and layout as done before the export reused indexing results."""
+    g = ig.Graph(n=graph_vertices, edges=np.column_stack([source, target]).tolist())
+    g.es["weight"] = weight.tolist()
+    partition = la.find_partition(
+        g,
+        la.CPMVertexPartition,
+        weights=g.es["weight"],
+        resolution_parameter=resolution,
+        seed=seed,
+    )
+    layout = g.layout("fruchterman_reingold")
+    return np.asarray(partition.membership), np.asarray(layout.coords)
+
+
+def _best_of(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--output-dir", type=Path, default=Path("data/output_gazeta_threshold")
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        graph_dir = Path(tmp)
+
+        def export(**kwargs) -> None:
+            graph.export_graph(
+                args.output_dir, graph_dir, seed=args.seed, compress=False, **kwargs
+            )
+
+        def export_from_scratch() -> None:
+            with mock.patch.object(graph, "recompute_layout", _from_scratch):
+                export(recompute=True)
+
+        cases = {
+            "indexing layout": export,
+            "recompute": lambda: export(recompute=True),
+            "from scratch": export_from_scratch,
+        }
+        timings = {name: _best_of(fn, args.repeat) for name, fn in cases.items()}
+
+    baseline = timings["indexing layout"]
+    print(f"{'export':<20}{'seconds':>10}{'vs indexing layout':>22}")
+    for name, seconds in timings.items():
+        print(f"{name:<20}{seconds:>10.2f}{seconds / max(baseline, 1e-9):>21.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Measure GraphExtractor throughput against a mock LLM with simulated latency.
+
+Every LLM call sleeps --latency-ms before answering with a fixed extraction,
+so the numbers show how many requests the extractor keeps in flight, not
+how fast a real model is. Runs one batch of --documents texts per
+concurrency level and checks that the extracted graph does not depend on it.
+
+Usage (from backend/):
+
+    python scripts/benchmark_graph_extraction.py --documents 64 --latency-ms 200
+"""
+
+import argparse
+import asyncio
+import time
+
+import networkx as nx
+
+from graphrag.index.graph.extractors import GraphExtractor
+from graphrag.llm.mock import MockCompletionLLM
+
+RESPONSE = (
+    '("entity"<|>ALICE<|>PERSON<|>Alice works at Acme)##'
+    '("entity"<|>ACME<|>ORGANIZATION<|>Acme is a company)##'
+    '("relationship"<|>ALICE<|>ACME<|>Alice is employed by Acme<|>2)'
+    "<|COMPLETE|>"
+)
+
+
+class DelayedMockLLM:
+    """MockCompletionLLM behind a fixed delay, answering like the indexing LLMs do."""
+
+    def __init__(self, latency: float, limiter: asyncio.Semaphore):
+        self.latency = latency
+        self.limiter = limiter
+        self.calls = 0
+        self._mock = MockCompletionLLM([RESPONSE])
+
+    async def __call__(self, prompt: str, **kwargs) -> dict:
+        async with self.limiter:
+            self.calls += 1
+            await asyncio.sleep(self.latency)
+            result = await self._mock(prompt)
+        # gleaning loop checks answer "NO" so every document stops after one glean
+        output = "NO" if kwargs.get("max_tokens") == 1 else result.output
+        return {"output": output, "history": []}
+
+
+async def run(
+    documents: int, latency: float, concurrency: int, max_gleanings: int
+) -> tuple[float, int, nx.Graph]:
+    llm = DelayedMockLLM(latency, asyncio.Semaphore(64))
+    extractor = GraphExtractor(
+        llm_invoker=llm,
+        max_gleanings=max_gleanings,
+        concurrent_documents=concurrency,
+        loop_args={"max_tokens": 1},
+    )
+    texts = [f"Document {i}: Alice works at Acme." for i in range(documents)]
+    start = time.perf_counter()
+    result = await extractor(texts, {"entity_types": None})
+    return time.perf_counter() - start, llm.calls, result.output
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=32)
+    parser.add_argument("--latency-ms", type=float, default=100)
+    parser.add_argument("--max-gleanings", type=int, default=1)
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 4, 8, 16, 32]
+    )
+    args = parser.parse_args()
+
+    reference = None
+    print(f"{'concurrency':>12}{'seconds':>10}{'calls':>8}{'calls/s':>10}")
+    for concurrency in args.concurrency:
+        seconds, calls, graph = asyncio.run(
+            run(
+                args.documents,
+                args.latency_ms / 1000,
+                concurrency,
+                args.max_gleanings,
+            )
+        )
+        print(f"{concurrency:>12}{seconds:>10.2f}{calls:>8}{calls / seconds:>10.1f}")
+        data = nx.node_link_data(graph)
+        if reference is None:
+            reference = data
+        elif data != reference:
+            msg = f"concurrency {concurrency} extracted a different graph"
+            raise RuntimeError(msg)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Compare GraphML with the binary graph interchange format between indexing verbs.
+
+Builds a random entity graph shaped like the output of entity extraction,
+then for every clustering level serializes and parses it both ways, as
+cluster_graph and the verbs after it do. Prints time, size and peak
+traced memory per level.
+
+Usage (from backend/):
+
+    python scripts/benchmark_graph_interchange.py --nodes 50000 --levels 3
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import networkx as nx
+
+from graphrag.index.utils import dump_graph, load_graph
+
+
+def entity_graph(nodes: int, edges_per_node: int, seed: int) -> nx.Graph:
+    rng = random.Random(seed)
+    graph = nx.barabasi_albert_graph(nodes, edges_per_node, seed=seed)
+    graph = nx.relabel_nodes(graph, {i: f"ENTITY {i}" for i in graph.nodes})
+    for node in graph.nodes:
+        graph.nodes[node].update(
+            type=rng.choice(["PERSON", "ORGANIZATION", "GEO", "EVENT"]),
+            description=" ".join(f"word{rng.randrange(1000)}" for _ in range(30)),
+            source_id=",".join(str(rng.randrange(10_000)) for _ in range(2)),
+        )
+    for edge in graph.edges:
+        graph.edges[edge].update(
+            weight=float(rng.randint(1, 10)),
+            description=" ".join(f"word{rng.randrange(1000)}" for _ in range(20)),
+            source_id=str(rng.randrange(10_000)),
+        )
+    return graph
+
+
+def clustered(graph: nx.Graph, level: int) -> nx.Graph:
+    """The attributes apply_clustering adds for a level."""
+    graph = graph.copy()
+    for i, node in enumerate(graph.nodes):
+        graph.nodes[node].update(
+            cluster=str(i // (50 * (level + 1))),
+            level=level,
+            degree=graph.degree[node],
+            human_readable_id=i,
+            id=f"{i:032x}",
+        )
+    for i, edge in enumerate(graph.edges):
+        graph.edges[edge].update(id=f"{i:032x}", human_readable_id=i, level=level)
+    return graph
+
+
+def _measure(fn: Callable[[], object]) -> tuple[object, float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=50_000)
+    parser.add_argument("--edges-per-node", type=int, default=2)
+    parser.add_argument("--levels", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    graph = entity_graph(args.nodes, args.edges_per_node, args.seed)
+    print(f"{graph.number_of_nodes()} nodes, {graph.number_of_edges()} edges\n")
+    formats = {
+        "graphml": (lambda g: "\n".join(nx.generate_graphml(g)), nx.parse_graphml),
+        "binary": (dump_graph, load_graph),
+    }
+    print(
+        f"{'level':>5} {'format':<8}{'size MB':>9}{'write s':>9}{'read s':>8}"
+        f"{'write peak MB':>15}{'read peak MB':>14}"
+    )
+    for level in range(args.levels):
+        level_graph = clustered(graph, level)
+        for name, (write, read) in formats.items():
+            data, write_seconds, write_peak = _measure(lambda: write(level_graph))  # noqa: B023
+            parsed, read_seconds, read_peak = _measure(lambda: read(data))  # noqa: B023
+            if name == "binary" and not nx.utils.graphs_equal(parsed, level_graph):
+                msg = f"binary round trip changed the level {level} graph"
+                raise RuntimeError(msg)
+            print(
+                f"{level:>5} {name:<8}{len(data) / 2**20:>9.1f}"
+                f"{write_seconds:>9.2f}{read_seconds:>8.2f}"
+                f"{write_peak / 2**20:>15.1f}{read_peak / 2**20:>14.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Compare the row-wise (dfs) and columnar query loaders on an indexing output.
+
+Usage (from backend/):
+
+    python scripts/benchmark_loaders.py --output-dir data/output_gazeta_threshold
+"""
+
+import argparse
+import math
+import time
+from collections.abc import Callable
+from dataclasses import fields
+from pathlib import Path
+
+import pandas as pd
+
+from graphrag.query.input.loaders import columnar, dfs
+
+
+def _entity_frame(output_dir: Path) -> pd.DataFrame:
+    nodes = pd.read_parquet(output_dir / "create_final_nodes.parquet")
+    entities = pd.read_parquet(output_dir / "create_final_entities.parquet")
+    nodes = nodes[["title", "degree", "community"]].rename(
+        columns={"title": "name", "degree": "rank"}
+    )
+    nodes["community"] = nodes["community"].fillna(-1).astype(int).astype(str)
+    nodes["community"] = nodes["community"].apply(lambda x: [x])
+    nodes["rank"] = nodes["rank"].astype(int)
+    return nodes.merge(entities, on="name", how="inner").drop_duplicates(
+        subset=["name"]
+    )
+
+
+def _cases(output_dir: Path) -> dict[str, tuple[Callable, Callable, dict]]:
+    entity_df = _entity_frame(output_dir)
+    report_df = pd.read_parquet(output_dir / "create_final_community_reports.parquet")
+    relationship_df = pd.read_parquet(
+        output_dir / "create_final_relationships.parquet"
+    )
+    text_unit_df = pd.read_parquet(output_dir / "create_final_text_units.parquet")
+    return {
+        "entities": (
+            dfs.read_entities,
+            columnar.read_entities,
+            {
+                "df": entity_df,
+                "title_col": "name",
+                "short_id_col": "human_readable_id",
+                "community_col": "community",
+                "rank_col": "rank",
+                "name_embedding_col": None,
+                "graph_embedding_col": None,
+                "document_ids_col": None,
+            },
+        ),
+        "community_reports": (
+            dfs.read_community_reports,
+            columnar.read_community_reports,
+            {
+                "df": report_df,
+                "id_col": "community",
+                "short_id_col": "community",
+                "summary_embedding_col": None,
+                "content_embedding_col": None,
+            },
+        ),
+        "relationships": (
+            dfs.read_relationships,
+            columnar.read_relationships,
+            {
+                "df": relationship_df,
+                "short_id_col": "human_readable_id",
+                "description_embedding_col": None,
+                "document_ids_col": None,
+                "attributes_cols": ["rank"],
+            },
+        ),
+        "text_units": (
+            dfs.read_text_units,
+            columnar.read_text_units,
+            {"df": text_unit_df, "short_id_col": None, "covariates_col": None},
+        ),
+    }
+
+
+def _best_of(fn: Callable, kwargs: dict, repeat: int) -> tuple[float, list]:
+    best = float("inf")
+    result: list = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(**kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _first_difference(row_result: list, col_result: list) -> str | None:
+    """Describe the first field the two loaders disagree on, if any."""
+    if len(row_result) != len(col_result):
+        return f"{len(row_result)} vs {len(col_result)} objects"
+    for index, (expected, actual) in enumerate(zip(row_result, col_result)):
+        for field in fields(expected):
+            a, b = getattr(expected, field.name), getattr(actual, field.name)
+            if a != b and not (_is_nan(a) and _is_nan(b)):
+                return f"object {index} ({expected.id}) {field.name}: {a!r} != {b!r}"
+    return None
+
+
+def _is_nan(value: object) -> bool:
+    return isinstance(value, float) and math.isnan(value)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--output-dir", type=Path, default=Path("data/output_gazeta_threshold")
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'table':<20}{'rows':>8}{'dfs, ms':>12}{'columnar, ms':>15}{'speedup':>10}")
+    for name, (row_wise, column_wise, kwargs) in _cases(args.output_dir).items():
+        row_time, row_result = _best_of(row_wise, kwargs, args.repeat)
+        col_time, col_result = _best_of(column_wise, kwargs, args.repeat)
+        difference = _first_difference(row_result, col_result)
+        if difference is not None:
+            msg = f"{name}: loaders returned different objects, {difference}"
+            raise RuntimeError(msg)
+        print(
+            f"{name:<20}{len(kwargs['df']):>8}{row_time * 1000:>12.1f}"
+            f"{col_time * 1000:>15.1f}{row_time / max(col_time, 1e-9):>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
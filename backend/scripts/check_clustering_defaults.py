@@ -0,0 +1,110 @@
+"""Cluster a graph and re-cluster it for an update with the default configuration.
+
+Builds a planted-partition entity graph, clusters it with the strategy
+`ClusterGraphConfig` resolves when only the backend is set, as indexing runs
+do, then re-clusters it for a few new relationships and one new entity with
+the same strategy, as update runs do. Exits with status 1 when a backend
+fails, so it can run in CI.
+
+Usage (from backend/):
+
+    python scripts/check_clustering_defaults.py --backend leidenalg --backend graspologic
+"""
+
+import argparse
+import random
+import sys
+import time
+import traceback
+
+import networkx as nx
+import pandas as pd
+
+from graphrag.config.models.cluster_graph_config import ClusterGraphConfig
+from graphrag.index.operations.cluster_components import LeidenBackend
+from graphrag.index.operations.cluster_graph import run_layout
+from graphrag.index.update.communities import (
+    clustering_parameters,
+    previous_membership,
+    recluster_communities,
+)
+
+
+def entity_graph(communities: int, size: int, seed: int) -> nx.Graph:
+    graph = nx.planted_partition_graph(communities, size, 0.3, 0.01, seed=seed)
+    return nx.relabel_nodes(graph, {i: f"ENTITY {i}" for i in graph.nodes})
+
+
+def relationship_frame(edges: list[tuple[str, str]]) -> pd.DataFrame:
+    return pd.DataFrame(
+        [{"source": source, "target": target, "weight": 1.0} for source, target in edges]
+    )
+
+
+def check(backend: str, graph: nx.Graph, new_edges: int, seed: int) -> None:
+    strategy = ClusterGraphConfig(backend=backend).resolved_strategy()
+
+    start = time.perf_counter()
+    communities = run_layout(strategy, graph)
+    cluster_time = time.perf_counter() - start
+    if not communities:
+        msg = "clustering found no communities"
+        raise RuntimeError(msg)
+    nodes = pd.DataFrame([
+        {"title": node, "level": level, "community": community}
+        for level, community, members in communities
+        for node in members
+    ])
+
+    rng = random.Random(seed)
+    names = sorted(graph.nodes)
+    delta = [tuple(rng.sample(names, 2)) for _ in range(new_edges)]
+    delta += [("ENTITY NEW", names[0]), ("ENTITY NEW", names[1])]
+    touched = {node for edge in delta for node in edge}
+
+    start = time.perf_counter()
+    update = recluster_communities(
+        previous_membership(nodes),
+        relationship_frame(list(graph.edges) + delta),
+        touched,
+        **clustering_parameters(strategy),
+    )
+    update_time = time.perf_counter() - start
+
+    levels = sorted({level for level, _, _ in communities})
+    print(
+        f"{backend}: {len(levels)} levels, "
+        f"{sum(1 for level, _, _ in communities if level == 0)} level 0 communities "
+        f"in {cluster_time:.2f}s; update changed {len(update.changes)} "
+        f"communities in {update_time:.2f}s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--backend",
+        action="append",
+        choices=[backend.value for backend in LeidenBackend],
+        help="backend to check, repeatable; all of them by default",
+    )
+    parser.add_argument("--communities", type=int, default=40)
+    parser.add_argument("--size", type=int, default=50)
+    parser.add_argument("--new-edges", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    graph = entity_graph(args.communities, args.size, args.seed)
+    failed = False
+    for backend in args.backend or [backend.value for backend in LeidenBackend]:
+        try:
+            check(backend, graph, args.new_edges, args.seed)
+        except Exception:  # noqa: BLE001
+            traceback.print_exc()
+            print(f"{backend}: failed")
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Convert the graph tables configured in api/.env to memory-mappable Arrow files.
+
+The API converts missing or stale tables on first load, running this at deploy
+time just keeps that work out of worker startup.
+
+Usage (from backend/):
+
+    python scripts/convert_graph_tables.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "api"))
+
+from graph_store import ensure_arrow  # noqa: E402
+from settings import settings  # noqa: E402
+
+
+def main() -> None:
+    cache_dir = settings.GRAPH_TABLE_CACHE_DIR
+    if cache_dir is None:
+        print("GRAPH_TABLE_CACHE_DIR is not set, nothing to convert")
+        return
+    for graph_settings in (settings.PODCAST, settings.GAZETA):
+        for parquet_path in (
+            graph_settings.ENTITY_TABLE,
+            graph_settings.COMMUNITY_REPORT_TABLE,
+            graph_settings.ENTITY_EMBEDDING_TABLE,
+            graph_settings.TEXT_UNIT_TABLE,
+            graph_settings.COMMUNITY_TABLE,
+            graph_settings.RELATIONSHIP_TABLE,
+        ):
+            start = time.perf_counter()
+            path = ensure_arrow(parquet_path, cache_dir)
+            print(f"{parquet_path} -> {path} ({time.perf_counter() - start:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
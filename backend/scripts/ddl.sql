@@ -2,11 +2,18 @@ CREATE TABLE prompt_histories (
     id SERIAL PRIMARY KEY NOT NULL,
     prompt TEXT,
     graph TEXT,
-    response TEXT
+    response TEXT,
+    language TEXT,
+    request_hash TEXT
 );
 
+CREATE INDEX prompt_histories_request_hash_idx ON prompt_histories (request_hash, id DESC);
+CREATE INDEX prompt_histories_graph_id_idx ON prompt_histories (graph, id DESC);
+
 CREATE TABLE prompt_selected_nodes (
     id SERIAL PRIMARY KEY NOT NULL,
     prompt_id SERIAL REFERENCES prompt_histories(id),
     node TEXT
-)
+);
+
+CREATE INDEX prompt_selected_nodes_prompt_id_idx ON prompt_selected_nodes (prompt_id);
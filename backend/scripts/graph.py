@@ -0,0 +1,464 @@
+"""Build viewer artifacts from a graphrag indexing output.
+
+Usage (from backend/):
+
+    python scripts/graph.py export data/output_gazeta_threshold data/graphs/gazeta
+
+writes graph.json and rep.json into the graph directory, compact, with
+.gz and .br variants next to them, and a meta.json that lets the API
+answer prompts for the graph from the same output directory.
+
+Communities and positions come from create_final_nodes, as computed by
+the indexing pipeline. --recompute reclusters with Leiden and refines
+the indexing layout instead.
+"""
+
+import argparse
+import gzip
+import json
+import random
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import brotli
+import igraph as ig
+import matplotlib.colors as mcolors
+import matplotlib.pyplot as plt
+import numpy as np
+import orjson
+import pandas as pd
+
+BATCH_SIZE = 10_000
+UNCLUSTERED_COLOR = "#9e9e9e"
+
+
+class ArtifactWriter:
+    """Writes one document to a file and, in the same pass, its .gz and .br copies."""
+
+    def __init__(self, path: Path, compress: bool = True):
+        self.paths = [path]
+        self._plain = path.open("wb")
+        self._gzip = None
+        self._brotli = None
+        self._brotli_file = None
+        if compress:
+            gzip_path = path.with_name(path.name + ".gz")
+            brotli_path = path.with_name(path.name + ".br")
+            self.paths += [gzip_path, brotli_path]
+            self._gzip = gzip.open(gzip_path, "wb", compresslevel=9)
+            self._brotli = brotli.Compressor(quality=9)
+            self._brotli_file = brotli_path.open("wb")
+
+    def write(self, data: bytes) -> None:
+        self._plain.write(data)
+        if self._gzip is not None:
+            self._gzip.write(data)
+            self._brotli_file.write(self._brotli.process(data))
+
+    def close(self) -> None:
+        self._plain.close()
+        if self._gzip is not None:
+            self._gzip.close()
+            self._brotli_file.write(self._brotli.finish())
+            self._brotli_file.close()
+
+    def __enter__(self) -> "ArtifactWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _batched(records: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def write_json_array(writer: ArtifactWriter, records: Iterable[dict]) -> None:
+    """Stream a JSON array, serializing `BATCH_SIZE` records at a time."""
+    writer.write(b"[")
+    first = True
+    for batch in _batched(records, BATCH_SIZE):
+        if not first:
+            writer.write(b",")
+        # drop the brackets of the serialized batch
+        writer.write(orjson.dumps(batch)[1:-1])
+        first = False
+    writer.write(b"]")
+
+
+def load_relationships(output_dir: Path) -> pd.DataFrame:
+    return pd.read_parquet(
+        output_dir / "create_final_relationships.parquet",
+        columns=["source", "target", "weight", "description"],
+    )
+
+
+def load_nodes(output_dir: Path, community_level: int) -> pd.DataFrame:
+    """
+    One row per entity with its type, description, degree, position and the
+    community of the deepest level not below `community_level`.
+    """
+    nodes = pd.read_parquet(
+        output_dir / "create_final_nodes.parquet",
+        columns=[
+            "title",
+            "type",
+            "description",
+            "level",
+            "community",
+            "degree",
+            "x",
+            "y",
+        ],
+    )
+    # create_final_nodes has a row per community level; an entity that is
+    # not clustered at the requested level keeps its community from above
+    clustered = nodes[
+        nodes["community"].notna()
+        & (nodes["community"].astype(str) != "-1")
+        & (nodes["level"] <= community_level)
+    ].sort_values("level")
+    communities = (
+        clustered.drop_duplicates(subset=["title"], keep="last")
+        .set_index("title")["community"]
+        .astype(str)
+    )
+    nodes = nodes.drop_duplicates(subset=["title"]).set_index("title")
+    nodes["community"] = communities.reindex(nodes.index)
+    return nodes
+
+
+def precomputed_layout(
+    node_info: pd.DataFrame, source: np.ndarray, target: np.ndarray
+) -> np.ndarray | None:
+    """
+    Positions written by the indexing `layout_graph` step, or None when the
+    layout was disabled there. Entities missing from create_final_nodes are
+    placed at the mean position of their neighbours.
+    """
+    coords = node_info[["x", "y"]].astype(float).to_numpy()
+    known = ~np.isnan(coords).any(axis=1)
+    if not known.any() or not np.abs(coords[known]).sum():
+        return None
+    missing = ~known
+    if missing.any():
+        n = len(coords)
+        filled = np.where(known[:, None], coords, 0.0)
+        counts = np.bincount(source, known[target], n) + np.bincount(
+            target, known[source], n
+        )
+        for axis in range(2):
+            sums = np.bincount(source, filled[target, axis], n) + np.bincount(
+                target, filled[source, axis], n
+            )
+            fallback = coords[known, axis].mean()
+            coords[missing, axis] = np.where(
+                counts[missing] > 0,
+                sums[missing] / np.maximum(counts[missing], 1),
+                fallback,
+            )
+    return coords
+
+
+def refine_layout(
+    coords: np.ndarray,
+    source: np.ndarray,
+    target: np.ndarray,
+    weight: np.ndarray,
+    iterations: int = 30,
+    grid: int = 8,
+) -> np.ndarray:
+    """
+    ForceAtlas-style refinement of an existing layout.
+
+    Edges attract linearly with their weight; repulsion is degree-weighted
+    as in ForceAtlas2 but computed against the mass centroids of a
+    `grid` x `grid` partition of the plane rather than every node, so an
+    iteration costs O(nodes * grid^2 + edges). The step size cools
+    linearly, which keeps the result close to the seed.
+    """
+    n = len(coords)
+    if n == 0 or iterations <= 0:
+        return coords
+    pos = coords.astype(np.float64).copy()
+    degree = np.bincount(source, minlength=n) + np.bincount(target, minlength=n)
+    mass = degree + 1.0
+    extent = float(np.ptp(pos, axis=0).max()) or 1.0
+    floor = (extent / np.sqrt(n)) ** 2
+    repulsion = extent**2 / mass.sum()
+    cells = grid * grid
+    chunk = max(1, 2**20 // cells)
+
+    for iteration in range(iterations):
+        disp = np.zeros_like(pos)
+        delta = pos[source] - pos[target]
+        for axis in range(2):
+            force = delta[:, axis] * weight
+            disp[:, axis] -= np.bincount(source, force, n)
+            disp[:, axis] += np.bincount(target, force, n)
+
+        low = pos.min(axis=0)
+        size = np.maximum(np.ptp(pos, axis=0), 1e-12) / grid
+        cell_xy = np.minimum(((pos - low) // size).astype(np.int64), grid - 1)
+        cell = cell_xy[:, 0] * grid + cell_xy[:, 1]
+        cell_mass = np.bincount(cell, mass, cells)
+        centroids = np.stack(
+            [np.bincount(cell, pos[:, axis] * mass, cells) for axis in range(2)],
+            axis=1,
+        ) / np.maximum(cell_mass, 1e-12)[:, None]
+        for start in range(0, n, chunk):
+            rows = slice(start, start + chunk)
+            dx = pos[rows, 0, None] - centroids[None, :, 0]
+            dy = pos[rows, 1, None] - centroids[None, :, 1]
+            force = cell_mass / np.maximum(dx * dx + dy * dy, floor)
+            disp[rows, 0] += repulsion * mass[rows] * (dx * force).sum(axis=1)
+            disp[rows, 1] += repulsion * mass[rows] * (dy * force).sum(axis=1)
+
+        # a node does not repel itself: remove its share of its own cell
+        own = pos - centroids[cell]
+        own_force = mass / np.maximum((own**2).sum(axis=1), floor)
+        disp -= repulsion * (mass * own_force)[:, None] * own
+
+        length = np.maximum(np.linalg.norm(disp, axis=1), 1e-12)
+        step = 0.1 * extent * (1 - iteration / iterations) / np.sqrt(n)
+        pos += disp * (np.minimum(length, step) / length)[:, None]
+    return pos
+
+
+def recompute_layout(
+    graph_vertices: int,
+    source: np.ndarray,
+    target: np.ndarray,
+    weight: np.ndarray,
+    resolution: float,
+    seed: int | None,
+    initial_membership: np.ndarray | None,
+    initial_coords: np.ndarray | None,
+    iterations: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Leiden membership and coordinates computed here instead of by indexing.
+
+    Clustering starts from the indexing communities when given and uses
+    igraph's built-in Leiden. The layout refines the indexing positions
+    when given, otherwise it falls back to grid Fruchterman-Reingold.
+    """
+    graph = ig.Graph(n=graph_vertices, edges=np.column_stack([source, target]).tolist())
+    graph.es["weight"] = weight.tolist()
+    if seed is not None:
+        # igraph draws random numbers from Python's random module
+        random.seed(seed)
+    partition = graph.community_leiden(
+        objective_function="CPM",
+        weights="weight",
+        resolution=resolution,
+        initial_membership=(
+            initial_membership.tolist() if initial_membership is not None else None
+        ),
+        n_iterations=-1,
+    )
+    membership = np.asarray(partition.membership, dtype=np.int64)
+    if initial_coords is None:
+        coords = np.asarray(
+            graph.layout_fruchterman_reingold(weights="weight", grid=True).coords
+        )
+    else:
+        coords = refine_layout(initial_coords, source, target, weight, iterations)
+    return membership, coords
+
+
+def community_palette(communities: int) -> list[str]:
+    cmap = plt.get_cmap("tab20", max(communities, 1))
+    return [mcolors.to_hex(cmap(i)) for i in range(max(communities, 1))]
+
+
+def export_graph(
+    output_dir: Path,
+    graph_dir: Path,
+    resolution: float = 0.5,
+    scale: float = 20.0,
+    seed: int | None = None,
+    compress: bool = True,
+    community_level: int = 2,
+    recompute: bool = False,
+    iterations: int = 30,
+) -> list[Path]:
+    relationships = load_relationships(output_dir)
+    nodes = load_nodes(output_dir, community_level)
+
+    vertices = pd.Index(
+        pd.unique(pd.concat([relationships["source"], relationships["target"]]))
+    )
+    source = vertices.get_indexer(relationships["source"])
+    target = vertices.get_indexer(relationships["target"])
+    weight = relationships["weight"].astype(float).to_numpy()
+    node_info = nodes.reindex(vertices)
+
+    coords = precomputed_layout(node_info, source, target)
+    codes, labels = pd.factorize(node_info["community"])
+    if recompute:
+        membership, coords = recompute_layout(
+            len(vertices),
+            source,
+            target,
+            weight,
+            resolution,
+            seed,
+            initial_membership=(
+                # unclustered entities start in singleton communities
+                np.where(codes >= 0, codes, len(labels) + np.arange(len(codes)))
+                if len(labels)
+                else None
+            ),
+            initial_coords=coords,
+            iterations=iterations,
+        )
+        communities = [str(community) for community in membership.tolist()]
+    else:
+        if coords is None:
+            msg = (
+                f"{output_dir} has no node positions, index with the layout "
+                "enabled or export with --recompute"
+            )
+            raise SystemExit(msg)
+        membership = codes
+        communities = [
+            community if isinstance(community, str) else None
+            for community in node_info["community"].tolist()
+        ]
+
+    palette = community_palette(int(membership.max()) + 1 if len(membership) else 0)
+    colors = np.where(
+        membership >= 0,
+        np.asarray(palette, dtype=object)[np.maximum(membership, 0) % len(palette)],
+        UNCLUSTERED_COLOR,
+    )
+
+    texts = (
+        "TYPE: " + node_info["type"].astype(str) + "\n\n\n " + node_info["description"]
+    ).fillna("")
+
+    graph_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+
+    def node_records() -> Iterator[dict]:
+        for i, (name, text, color, community, x, y) in enumerate(
+            zip(
+                vertices.tolist(),
+                texts.tolist(),
+                colors.tolist(),
+                communities,
+                (coords[:, 0] * scale).tolist(),
+                (coords[:, 1] * scale).tolist(),
+                strict=True,
+            )
+        ):
+            yield {
+                "id": i,
+                "data": {
+                    "texts": [{"id": i, "text": text}],
+                    "color": color,
+                    "community": community,
+                    "size": 2,
+                },
+                "name": name,
+                "vx": 0,
+                "vy": 0,
+                "x": x,
+                "y": y,
+            }
+
+    def link_records() -> Iterator[dict]:
+        for i, (s, t, explanation) in enumerate(
+            zip(
+                source.tolist(),
+                target.tolist(),
+                relationships["description"].fillna("").tolist(),
+                strict=True,
+            )
+        ):
+            yield {
+                "source": s,
+                "target": t,
+                "data": {"id": i, "explanation": explanation, "color": "#000000"},
+            }
+
+    with ArtifactWriter(graph_dir / "graph.json", compress) as writer:
+        writer.write(b'{"nodes":')
+        write_json_array(writer, node_records())
+        writer.write(b',"links":')
+        write_json_array(writer, link_records())
+        writer.write(b"}")
+        written += writer.paths
+
+    reports = pd.read_parquet(
+        output_dir / "create_final_community_reports.parquet",
+        columns=["full_content"],
+    )
+    with ArtifactWriter(graph_dir / "rep.json", compress) as writer:
+        write_json_array(
+            writer,
+            (
+                {"pid": pid, "text": text}
+                for pid, text in enumerate(reports["full_content"].tolist())
+            ),
+        )
+        written += writer.paths
+
+    meta_path = graph_dir / "meta.json"
+    meta = json.loads(meta_path.read_text("utf-8")) if meta_path.exists() else {}
+    meta.update({"output_dir": str(output_dir), "community_level": community_level})
+    meta.setdefault("name", graph_dir.name)
+    meta_path.write_text(json.dumps(meta, indent=2, ensure_ascii=False), "utf-8")
+    written.append(meta_path)
+    return written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="write graph.json and rep.json")
+    export.add_argument("output_dir", type=Path, help="graphrag indexing output")
+    export.add_argument("graph_dir", type=Path, help="e.g. data/graphs/<id>")
+    export.add_argument("--scale", type=float, default=20.0)
+    export.add_argument("--community-level", type=int, default=2)
+    export.add_argument(
+        "--recompute",
+        action="store_true",
+        help="recluster and refine the layout instead of using the indexing ones",
+    )
+    export.add_argument("--resolution", type=float, default=0.5)
+    export.add_argument("--iterations", type=int, default=30)
+    export.add_argument("--seed", type=int, default=None)
+    export.add_argument("--no-compress", action="store_true")
+
+    args = parser.parse_args()
+    if args.command == "export":
+        start = time.perf_counter()
+        written = export_graph(
+            args.output_dir,
+            args.graph_dir,
+            resolution=args.resolution,
+            scale=args.scale,
+            seed=args.seed,
+            compress=not args.no_compress,
+            community_level=args.community_level,
+            recompute=args.recompute,
+            iterations=args.iterations,
+        )
+        for path in written:
+            print(f"{path} ({path.stat().st_size} bytes)")
+        print(f"done in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
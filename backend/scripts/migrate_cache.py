@@ -0,0 +1,54 @@
+"""Copy a JSON file pipeline cache into a single-file SQLite cache.
+
+Usage (from backend/):
+
+    python scripts/migrate_cache.py data/ragtest/cache data/ragtest/cache/cache.sqlite --compression-level 3
+
+then set `cache: {type: sqlite, base_dir: cache}` in the indexing settings.
+The JSON files are left in place.
+"""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+
+from graphrag.index.cache.sqlite_pipeline_cache import (
+    DEFAULT_BATCH_SIZE,
+    SqlitePipelineCache,
+    migrate_json_cache,
+)
+
+
+async def migrate(args: argparse.Namespace) -> None:
+    cache = SqlitePipelineCache(
+        str(args.target),
+        compression_level=args.compression_level,
+        batch_size=args.batch_size,
+    )
+    start = time.perf_counter()
+    try:
+        copied, skipped = await migrate_json_cache(
+            str(args.source), cache, batch_size=args.batch_size
+        )
+    finally:
+        cache.close()
+    print(
+        f"copied {copied} entries, skipped {skipped} unreadable files "
+        f"in {time.perf_counter() - start:.1f}s; "
+        f"{args.target} is {args.target.stat().st_size} bytes"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", type=Path, help="JSON cache directory")
+    parser.add_argument("target", type=Path, help="SQLite cache file")
+    parser.add_argument("--compression-level", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+    asyncio.run(migrate(args))
+
+
+if __name__ == "__main__":
+    main()
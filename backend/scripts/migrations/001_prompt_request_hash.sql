@@ -0,0 +1,8 @@
+-- Answer cache key: hash of the normalized prompt, sorted nodes, graph and language.
+-- Rows written before this migration have no hash until
+-- scripts/backfill_request_hash.py fills it in.
+ALTER TABLE prompt_histories ADD COLUMN IF NOT EXISTS language TEXT;
+ALTER TABLE prompt_histories ADD COLUMN IF NOT EXISTS request_hash TEXT;
+
+CREATE INDEX IF NOT EXISTS prompt_histories_request_hash_idx
+    ON prompt_histories (request_hash);
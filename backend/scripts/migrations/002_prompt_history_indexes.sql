@@ -0,0 +1,23 @@
+-- Cache reads filter on request_hash and take the newest row, history pages
+-- filter on graph and walk id downwards, node lists are fetched per prompt.
+--
+-- The indexes are built CONCURRENTLY so writes to the tables are not blocked,
+-- which cannot run inside a transaction: apply the file statement by
+-- statement, e.g. `psql -f`, not `psql -1` or a migration tool's transaction.
+-- Run scripts/backfill_request_hash.py first, so the rows written before
+-- 001_prompt_request_hash.sql are already hashed when this index lands.
+-- A build that fails leaves an INVALID index behind; drop it and re-run.
+
+-- (request_hash) from 001 is replaced by (request_hash, id DESC) under the
+-- same name, the new index is built before the old one is dropped
+CREATE INDEX CONCURRENTLY IF NOT EXISTS prompt_histories_request_hash_id_idx
+    ON prompt_histories (request_hash, id DESC);
+DROP INDEX CONCURRENTLY IF EXISTS prompt_histories_request_hash_idx;
+ALTER INDEX prompt_histories_request_hash_id_idx
+    RENAME TO prompt_histories_request_hash_idx;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS prompt_histories_graph_id_idx
+    ON prompt_histories (graph, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS prompt_selected_nodes_prompt_id_idx
+    ON prompt_selected_nodes (prompt_id);